@@ -9,7 +9,7 @@ from django.contrib.admin import display
 
 from lessons.models.lesson import ScheduledLesson
 
-from .models import User, Lesson, Transfer, Term, School, Admission
+from .models import User, Lesson, Transfer, Term, School, Admission, LessonPrice, LessonBalance, StudentBalance
 
 
 @admin.register(User)
@@ -73,4 +73,52 @@ class ScheduledLessonAdmin(admin.ModelAdmin):
     """
     list_display = [
         f.name for f in ScheduledLesson._meta.fields
-    ]
\ No newline at end of file
+    ]
+
+
+@admin.register(LessonPrice)
+class LessonPriceAdmin(admin.ModelAdmin):
+    """
+    Configuration of the admin interface to display lesson prices.
+    """
+    list_display = [
+        'id', 'school', 'duration', 'price'
+    ]
+
+
+@admin.register(LessonBalance)
+class LessonBalanceAdmin(admin.ModelAdmin):
+    """
+    Configuration of the admin interface to display lesson balances, which are only written by the ledger.
+    """
+    list_display = [
+        'id', 'lesson', 'school', 'student', 'invoiced', 'paid', 'outstanding'
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(StudentBalance)
+class StudentBalanceAdmin(admin.ModelAdmin):
+    """
+    Configuration of the admin interface to display student balances, which are only written by the ledger.
+    """
+    list_display = [
+        'id', 'school', 'student', 'invoiced', 'paid', 'outstanding'
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -4,9 +4,8 @@ Forms that will be used in the music school management system.
 
 from django import forms
 from django.db.models import Q
-from django.shortcuts import get_object_or_404
 
-from lessons.models import Lesson, User, Term, School
+from lessons.models import Lesson, User, Term
 
 
 class LessonModifyForm(forms.ModelForm):
@@ -174,12 +173,12 @@ class LessonFulfillForm(forms.ModelForm):
         return super().form_valid(form)
 
     def __init__(self, *args, **kwargs):
+        self.school = kwargs.pop('school')
         super().__init__(*args, **kwargs)
-        self.fields['start_term'].queryset = Term.objects.filter(school_id=kwargs['initial']['school'])
+        self.fields['start_term'].queryset = Term.objects.filter(school=self.school)
         self.fields['start_term'].empty_label = None
 
-        school_instance = get_object_or_404(School, pk=kwargs['initial']['school'])
-        term = school_instance.get_update_current_term
+        term = self.school.get_update_current_term
         if term == None:
             self.fields.pop('start_term')
             self.fields.pop('start_type')
@@ -6,6 +6,7 @@ from django import forms
 from django.db.models import Q
 
 from lessons.models import Term
+from lessons.services import import_format, import_terms, parse_terms, read_rows, validate_terms
 
 class TermForm(forms.ModelForm):
     """
@@ -52,4 +53,36 @@ class TermForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         self.school = kwargs['initial']['school']
         self.term = kwargs['instance']
-        super(TermForm, self).__init__(*args, **kwargs)
\ No newline at end of file
+        super(TermForm, self).__init__(*args, **kwargs)
+
+
+class TermImportForm(forms.Form):
+    """
+    Form used to import the terms of a school from a CSV or JSON file, which gives the start_date and end_date of
+    each term as YYYY-MM-DD.
+    """
+
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'class': "form-control", 'accept': ".csv,.json"}),
+        help_text="A CSV file with start_date and end_date columns, or a JSON list of objects with those keys."
+    )
+
+    def __init__(self, school, *args, **kwargs):
+        self.school = school
+        self.terms = []
+        super(TermImportForm, self).__init__(*args, **kwargs)
+
+    def clean_file(self):
+        """
+        Validate that the terms of the file can be read and do not overlap each other or the existing terms.
+        """
+        file = self.cleaned_data['file']
+        self.terms = parse_terms(read_rows(file, import_format(file.name)), school_id=self.school)
+        validate_terms(self.terms)
+        return file
+
+    def save(self):
+        """
+        Save the terms of the file onto the database.
+        """
+        return import_terms(self.terms)
@@ -7,7 +7,8 @@ from django import forms
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 
-from lessons.models import User, Lesson, Transfer, School
+from lessons.models import User, Lesson, Transfer
+from lessons.services import import_transfers, read_rows, transfer_reference_errors
 
 
 class TransferForm(forms.ModelForm):
@@ -53,21 +54,10 @@ class TransferForm(forms.ModelForm):
 
         user_id, invoice_id = re.split(r'\D+', transfer_number)
 
-        user = User.objects.filter(pk=user_id).first()
-        lesson = Lesson.objects.filter(pk=invoice_id).first()
-        if user and lesson:
-            if user != lesson.student:
-                self.add_error('transfer_id', 'This student has not booked this lesson. You should refund this '
-                                              'transfer.')
-            else:
-                if not lesson.fulfilled:
-                    self.add_error('transfer_id', "This lesson has not been fulfilled yet.")
-                if lesson.school.id != self.school:
-                    self.add_error('transfer_id', "This lesson is not managed by this school")
-        if not user:
-            self.add_error('transfer_id', 'This user could not be found. You should refund this transfer.')
-        if not lesson:
-            self.add_error('transfer_id', 'This lesson could not be found. You should refund this transfer.')
+        self.user = User.objects.filter(pk=user_id).first()
+        self.lesson = Lesson.objects.filter(pk=invoice_id).first()
+        for error in transfer_reference_errors(self.user, self.lesson, self.school):
+            self.add_error('transfer_id', error)
         return cleaned_data
 
     def save(self):
@@ -75,12 +65,45 @@ class TransferForm(forms.ModelForm):
         Save the transfer onto the database.
         """
         super().save(commit=False)
-        transfer_number = str(self.cleaned_data.get('transfer_id'))
-        user_id, invoice_id = re.split(r'\D+', transfer_number)
         transfer = Transfer.objects.create(
-            user=User.objects.get(pk=user_id),
-            lesson=Lesson.objects.get(pk=invoice_id),
-            school=School.objects.get(pk=self.school),
+            user=self.user,
+            lesson=self.lesson,
+            school_id=self.school,
             amount=self.cleaned_data.get('amount')
         )
         return transfer
+
+
+class TransferImportForm(forms.Form):
+    """
+    Form used to import the transfers of a bank statement into a school from a CSV file, which gives the reference
+    and amount of each transfer.
+    """
+
+    file = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={'class': "form-control", 'accept': ".csv"}),
+        help_text="A CSV file with reference and amount columns, where references are in the format XXXX-YYYY."
+    )
+
+    def __init__(self, school, *args, **kwargs):
+        self.school = school
+        self.rows = []
+        super(TransferImportForm, self).__init__(*args, **kwargs)
+
+    def clean_file(self):
+        """
+        Validate that the file is a CSV file with reference and amount columns.
+        """
+        file = self.cleaned_data['file']
+        if not file.name.lower().endswith('.csv'):
+            raise ValidationError("Only CSV files can be imported.")
+        self.rows = read_rows(file, 'csv')
+        if self.rows and not {'reference', 'amount'} <= set(self.rows[0][1]):
+            raise ValidationError("The file must have reference and amount columns.")
+        return file
+
+    def save(self):
+        """
+        Save the valid transfers of the file onto the database and return them along with the rejected lines.
+        """
+        return import_transfers(self.rows, self.school)
@@ -0,0 +1,178 @@
+import json
+import statistics
+from time import perf_counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.db.models.functions import Coalesce
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from lessons.models import Lesson, User
+from lessons.models.lesson import ScheduledLesson
+from lessons.services import SEED_PASSWORD, seed_school
+
+BENCHMARK_DIRECTOR = 'benchmark.director@example.org'
+
+
+class QueryRecorder:
+    """
+    Execute wrapper that records the SQL and parameters of every query run while it is installed.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+
+def count_rows(queries):
+    """
+    Count the rows fetched by the SELECT queries of a request by running each of them again as a count.
+    """
+    rows = 0
+    with connection.cursor() as cursor:
+        for sql, params in queries:
+            if sql.lstrip().upper().startswith('SELECT'):
+                cursor.execute(f'SELECT COUNT(*) FROM ({sql}) benchmark_rows', params)
+                rows += cursor.fetchone()[0]
+    return rows
+
+
+def percentile(cut_points, p):
+    return round(cut_points[p - 1], 2)
+
+
+class Command(BaseCommand):
+    help = "Seed a school and measure the latency, queries and rows fetched of the main pages with the test client."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=100, help="Number of students of the seeded school.")
+        parser.add_argument('--teachers', type=int, default=10, help="Number of teachers of the seeded school.")
+        parser.add_argument('--requests', type=int, default=50, help="Number of measured requests per page.")
+        parser.add_argument('--warmup', type=int, default=3, help="Number of unmeasured requests per page.")
+        parser.add_argument('--seed', type=int, default=0, help="Seed of the generated school.")
+        parser.add_argument('--output', default='benchmark.json', help="File the results are saved to as JSON.")
+        parser.add_argument('--keep', action='store_true', help="Keep the seeded school after the benchmark.")
+
+    def handle(self, *args, **options):
+        if options['requests'] < 2:
+            raise CommandError("At least 2 requests per page are needed to calculate percentiles.")
+        if User.objects.filter(email=BENCHMARK_DIRECTOR).exists():
+            raise CommandError(f"{BENCHMARK_DIRECTOR} already exists, remove the school of a kept benchmark first.")
+
+        director = User.objects.create_user(
+            email=BENCHMARK_DIRECTOR,
+            first_name='Benchmark',
+            last_name='Director',
+            password=SEED_PASSWORD
+        )
+        school = None
+        try:
+            school = seed_school(
+                'Benchmark School', director, students=options['students'], teachers=options['teachers'],
+                seed=options['seed']
+            )
+            school.set_group_teacher(director)
+            school.set_group_client(director)
+            self.stdout.write(f"Seeded {school} with {options['students']} students.")
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                results = self.run_benchmark(school, director, options)
+        finally:
+            if not options['keep']:
+                if school is not None:
+                    User.objects.filter(email__startswith=f'school{school.id}.').delete()
+                    school.delete()
+                director.delete()
+
+        report = {
+            'students': options['students'],
+            'teachers': options['teachers'],
+            'requests': options['requests'],
+            'seed': options['seed'],
+            'endpoints': results,
+        }
+        with open(options['output'], 'w') as output:
+            json.dump(report, output, indent=4)
+
+        self.stdout.write(f"{'Endpoint':<12}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Queries':>10}{'Rows':>10}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<12}{result['p50_ms']:>10}{result['p95_ms']:>10}{result['p99_ms']:>10}"
+                f"{result['queries']:>10}{result['rows']:>10}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Saved the results to {options['output']}."))
+
+    def timetable_client(self, school):
+        """
+        Return the seeded client whose household has the most scheduled lessons, so that the timetable is measured
+        with lessons on it rather than empty.
+        """
+        household = ScheduledLesson.objects.filter(school=school).values(
+            head=Coalesce('student__parent', 'student')
+        ).annotate(lessons=Count('id')).order_by('-lessons', 'head').first()
+        if household is None:
+            raise CommandError("The seeded school has no scheduled lesson to measure the timetable with.")
+        return User.objects.get(pk=household['head'])
+
+    def endpoints(self, school, director):
+        """
+        Return the name, method, URL and data of each page that is measured, and the user requesting it.
+        """
+        lesson = Lesson.objects.filter(school=school, fulfilled=False).order_by('id').first()
+        if lesson is None:
+            raise CommandError("The seeded school has no unfulfilled lesson to measure the fulfil page with.")
+        school_url = lambda name, **kwargs: reverse(name, kwargs={'school': school.id, **kwargs})
+        return [
+            ('login', 'post', reverse('log_in'), {'email': director.email, 'password': SEED_PASSWORD}, None),
+            ('home', 'get', school_url('school_home'), None, director),
+            ('bookings', 'get', school_url('school_bookings'), None, director),
+            ('timetable', 'get', school_url('timetable'), None, self.timetable_client(school)),
+            ('transfers', 'get', school_url('school_transfers'), None, director),
+            ('members', 'get', school_url('members'), None, director),
+            ('fulfil', 'get', school_url('fulfill_lesson', pk=lesson.id), None, director),
+        ]
+
+    def run_benchmark(self, school, director, options):
+        clients = {}
+        results = {}
+        for name, method, url, data, user in self.endpoints(school, director):
+            if user is not None and user.pk not in clients:
+                clients[user.pk] = Client()
+                clients[user.pk].force_login(user)
+            latencies, query_counts, rows = [], [], None
+            for number in range(options['warmup'] + options['requests']):
+                # every login is measured from a new session, as logged in users are redirected
+                request_client = Client() if user is None else clients[user.pk]
+                recorder = QueryRecorder()
+                with connection.execute_wrapper(recorder):
+                    started = perf_counter()
+                    response = getattr(request_client, method)(url, data)
+                    elapsed = perf_counter() - started
+                if response.status_code >= 400:
+                    raise CommandError(f"{name} responded with {response.status_code}.")
+                if number < options['warmup']:
+                    continue
+                latencies.append(elapsed * 1000)
+                query_counts.append(len(recorder.queries))
+                if rows is None:
+                    rows = count_rows(recorder.queries)
+
+            cut_points = statistics.quantiles(latencies, n=100, method='inclusive')
+            results[name] = {
+                'url': url,
+                'user': None if user is None else user.email,
+                'p50_ms': percentile(cut_points, 50),
+                'p95_ms': percentile(cut_points, 95),
+                'p99_ms': percentile(cut_points, 99),
+                'mean_ms': round(statistics.fmean(latencies), 2),
+                'queries': max(query_counts),
+                'rows': rows,
+            }
+            self.stdout.write(f"Measured {name} over {options['requests']} requests.")
+        return results
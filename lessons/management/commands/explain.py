@@ -0,0 +1,124 @@
+import re
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from lessons.management.commands.benchmark import QueryRecorder
+from lessons.models import Lesson, Term, User
+from lessons.services import SEED_PASSWORD, seed_school
+from msms.urls import school_urlpatterns
+
+EXPLAIN_DIRECTOR = 'explain.director@example.org'
+
+FULL_SCAN = re.compile(r'^SCAN (?P<table>\w+)(?: AS (?P<alias>\w+))?$')
+
+
+def full_scans(sql, params):
+    """
+    Return the steps of the query plan of a query that read every row of a table without an index.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        details = [row[3] for row in cursor.fetchall()]
+    return [detail for detail in details if FULL_SCAN.match(detail)]
+
+
+class Command(BaseCommand):
+    help = "Seed a school, request every page and fail when a query of any of them scans a whole table."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=100, help="Number of students of the seeded school.")
+        parser.add_argument('--teachers', type=int, default=10, help="Number of teachers of the seeded school.")
+        parser.add_argument('--seed', type=int, default=0, help="Seed of the generated school.")
+        parser.add_argument(
+            '--allow', action='append', default=[], metavar='TABLE',
+            help="Table that may be scanned, such as a lookup table that only ever holds a few rows."
+        )
+        parser.add_argument('--keep', action='store_true', help="Keep the seeded school after the check.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError("Query plans can only be explained on SQLite databases.")
+        if User.objects.filter(email=EXPLAIN_DIRECTOR).exists():
+            raise CommandError(f"{EXPLAIN_DIRECTOR} already exists, remove the school of a kept check first.")
+
+        director = User.objects.create_user(
+            email=EXPLAIN_DIRECTOR,
+            first_name='Explain',
+            last_name='Director',
+            password=SEED_PASSWORD
+        )
+        school = None
+        try:
+            school = seed_school(
+                'Explain School', director, students=options['students'], teachers=options['teachers'],
+                seed=options['seed']
+            )
+            school.set_group_teacher(director)
+            school.set_group_client(director)
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                scans = self.explain_pages(school, director, set(options['allow']))
+        finally:
+            if not options['keep']:
+                if school is not None:
+                    User.objects.filter(email__startswith=f'school{school.id}.').delete()
+                    school.delete()
+                director.delete()
+
+        for name, detail, sql in scans:
+            self.stdout.write(f"{name}: {detail}\n    {sql}")
+        if scans:
+            raise CommandError(f"{len(scans)} queries scan a whole table.")
+        self.stdout.write(self.style.SUCCESS("No query scans a whole table."))
+
+    def pages(self, school):
+        """
+        Return the name and URL of the home page and of every school page.
+        """
+        lessons = Lesson.objects.filter(school=school).order_by('id')
+        objects = {
+            'modify_lesson': lessons.filter(fulfilled=False).values_list('id', flat=True).first(),
+            'booking_invoice': lessons.filter(fulfilled=True).values_list('id', flat=True).first(),
+            'fulfill_lesson': lessons.filter(fulfilled=False).values_list('id', flat=True).first(),
+            'edit_term': Term.objects.filter(school=school).values_list('id', flat=True).first(),
+            'manage_member': lessons.values_list('student_id', flat=True).first(),
+        }
+        pages = [('home', reverse('home'))]
+        for pattern in school_urlpatterns:
+            kwargs = {'school': school.id}
+            if 'pk' in pattern.pattern.converters:
+                if objects.get(pattern.name) is None:
+                    raise CommandError(f"The seeded school has no object to request {pattern.name} with.")
+                kwargs['pk'] = objects[pattern.name]
+            pages.append((pattern.name, reverse(pattern.name, kwargs=kwargs)))
+        return pages
+
+    def explain_pages(self, school, director, allowed):
+        """
+        Request every page and return the name, full scan and SQL of each of their queries that scans a table.
+        """
+        client = Client()
+        client.force_login(director)
+        scans, explained = [], set()
+        for name, url in self.pages(school):
+            recorder = QueryRecorder()
+            with connection.execute_wrapper(recorder):
+                response = client.get(url)
+                # streamed responses only query the database as their content is read
+                if response.streaming:
+                    b''.join(response.streaming_content)
+            if response.status_code >= 400:
+                raise CommandError(f"{name} responded with {response.status_code}.")
+            for sql, params in recorder.queries:
+                if not sql.lstrip().upper().startswith('SELECT') or sql in explained:
+                    continue
+                explained.add(sql)
+                for detail in full_scans(sql, params):
+                    if FULL_SCAN.match(detail).group('table') not in allowed:
+                        scans.append((name, detail, sql))
+            self.stdout.write(f"Explained {name}.")
+        return scans
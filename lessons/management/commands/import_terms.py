@@ -0,0 +1,43 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from lessons.models import School
+from lessons.services import IMPORT_FORMATS, import_format, import_terms, parse_terms, read_rows, validate_terms
+
+
+class Command(BaseCommand):
+    help = "Import the terms of many schools from a CSV or JSON file, checking every term before saving any."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV file with school, start_date and end_date columns, or a JSON list of "
+                                         "objects with those keys.")
+        parser.add_argument('--school', type=int, help="Import every term into this school, ignoring the school of "
+                                                       "the rows.")
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help="Format of the file, by default its extension.")
+        parser.add_argument('--check', action='store_true',
+                            help="Report the problems of the file without saving its terms.")
+
+    def handle(self, *args, **options):
+        if options['school'] is not None and not School.objects.filter(pk=options['school']).exists():
+            raise CommandError(f"School {options['school']} does not exist.")
+        try:
+            file_format = options['format'] or import_format(options['path'])
+            with open(options['path'], encoding='utf-8-sig', newline='') as file:
+                rows = read_rows(file, file_format)
+            terms = parse_terms(rows, school_id=options['school'])
+            if options['check']:
+                validate_terms(terms)
+            else:
+                created = import_terms(terms)
+        except OSError as error:
+            raise CommandError(f"{options['path']} could not be read: {error.strerror}.")
+        except ValidationError as error:
+            for message in error.messages:
+                self.stdout.write(message)
+            raise CommandError(f"{len(error.messages)} problems were found, no terms were imported.")
+
+        if options['check']:
+            self.stdout.write(self.style.SUCCESS(f"All {len(terms)} terms can be imported."))
+        else:
+            schools = len({term.school_id for term in created})
+            self.stdout.write(self.style.SUCCESS(f"Imported {len(created)} terms into {schools} schools."))
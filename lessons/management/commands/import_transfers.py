@@ -0,0 +1,40 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from lessons.models import School
+from lessons.services import import_transfers, read_rows
+
+
+class Command(BaseCommand):
+    help = "Import the transfers of a bank statement into a school, reporting every line that cannot be imported."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV file with reference and amount columns, where references are in the "
+                                         "format XXXX-YYYY.")
+        parser.add_argument('--school', type=int, required=True, help="School the transfers are paid to.")
+        parser.add_argument('--check', action='store_true',
+                            help="Report the lines that cannot be imported without saving any transfer.")
+
+    def handle(self, *args, **options):
+        if not School.objects.filter(pk=options['school']).exists():
+            raise CommandError(f"School {options['school']} does not exist.")
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as file:
+                rows = read_rows(file, 'csv')
+        except OSError as error:
+            raise CommandError(f"{options['path']} could not be read: {error.strerror}.")
+        except ValidationError as error:
+            raise CommandError(' '.join(error.messages))
+
+        with transaction.atomic():
+            result = import_transfers(rows, options['school'])
+            if options['check']:
+                transaction.set_rollback(True)
+
+        for row, reason in result.rejects:
+            self.stdout.write(f"Line {row}: {reason}")
+        action = "can be imported" if options['check'] else "imported"
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(result.transfers)} transfers {action}, {len(result.rejects)} lines rejected."
+        ))
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from lessons.models import Lesson, School, StudentBalance
+from lessons.services import ledger_differences, rebuild_balances, student_ledger_differences
+
+
+class Command(BaseCommand):
+    help = "Check the lesson and student balances against lessons and transfers, and rebuild them."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--school', type=int, help="Only check or rebuild the balances of this school.")
+        parser.add_argument('--check', action='store_true',
+                            help="Report balances that differ without rebuilding them, failing if there are any.")
+        parser.add_argument('--chunk-size', type=int, default=2000,
+                            help="Number of lessons rebuilt at a time.")
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError("The chunk size must be at least 1.")
+        lessons = Lesson.objects.order_by('id')
+        balances = StudentBalance.objects.all()
+        if options['school'] is not None:
+            if not School.objects.filter(pk=options['school']).exists():
+                raise CommandError(f"School {options['school']} does not exist.")
+            lessons = lessons.filter(school_id=options['school'])
+            balances = balances.filter(school_id=options['school'])
+
+        if options['check']:
+            differences = 0
+            for stored, expected in ledger_differences(lessons):
+                differences += 1
+                if stored is None:
+                    self.stdout.write(f"Lesson {expected.lesson_id} has no balance.")
+                else:
+                    self.stdout.write(
+                        f"Lesson {expected.lesson_id} has invoiced {stored.invoiced}, paid {stored.paid}, "
+                        f"expected invoiced {expected.invoiced}, paid {expected.paid}."
+                    )
+            for balance in student_ledger_differences(balances):
+                differences += 1
+                self.stdout.write(
+                    f"Student {balance.student_id} of school {balance.school_id} has invoiced {balance.invoiced}, "
+                    f"paid {balance.paid}, which differs from their lesson balances."
+                )
+            if differences:
+                raise CommandError(f"{differences} balances differ from the lessons and transfers.")
+            self.stdout.write(self.style.SUCCESS("Every balance matches the lessons and transfers."))
+            return
+
+        total = 0
+        ids = list(lessons.values_list('id', flat=True))
+        for start in range(0, len(ids), options['chunk_size']):
+            chunk = ids[start:start + options['chunk_size']]
+            total += rebuild_balances(Lesson.objects.filter(pk__in=chunk))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the balances of {total} lessons."))
@@ -0,0 +1,79 @@
+from itertools import islice
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from lessons.models import Lesson, School, Term
+from lessons.services import (
+    TermIndex, lesson_count, lesson_price, rebuild_balances, reprice_lessons, reprice_term, reschedule, school_prices
+)
+
+
+class Command(BaseCommand):
+    help = "Reprice, and optionally reschedule, every fulfilled lesson of a school or of one of its terms."
+
+    def add_arguments(self, parser):
+        parser.add_argument('school', type=int, help="ID of the school whose lessons are repriced.")
+        parser.add_argument('--term', type=int, help="Only reprice lessons that take place during this term.")
+        parser.add_argument('--reschedule', action='store_true',
+                            help="Regenerate the scheduled lessons of each lesson and recount them before it is "
+                                 "repriced.")
+        parser.add_argument('--chunk-size', type=int, default=2000,
+                            help="Number of lessons read and written at a time when rescheduling.")
+
+    def handle(self, *args, **options):
+        try:
+            school = School.objects.get(pk=options['school'])
+        except School.DoesNotExist:
+            raise CommandError(f"School {options['school']} does not exist.")
+        if options['chunk_size'] < 1:
+            raise CommandError("The chunk size must be at least 1.")
+
+        term = None
+        lessons = Lesson.objects.filter(school=school, fulfilled=True).order_by('id')
+        if options['term'] is not None:
+            try:
+                term = Term.objects.get(pk=options['term'], school=school)
+            except Term.DoesNotExist:
+                raise CommandError(f"Term {options['term']} does not belong to {school}.")
+            lessons = lessons.filter(start_date__lte=term.end_date, end_date__gte=term.start_date)
+
+        started = perf_counter()
+        if options['reschedule']:
+            total = self.reschedule_lessons(school, lessons, options['chunk_size'])
+        elif term is not None:
+            total = reprice_term(term)
+        else:
+            with transaction.atomic():
+                total = reprice_lessons(lessons)
+                rebuild_balances(lessons)
+
+        elapsed = perf_counter() - started
+        rate = total / elapsed if elapsed else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Repriced {total} lessons of {school} in {elapsed:.2f}s ({rate:.0f} lessons/s)."
+        ))
+
+    def reschedule_lessons(self, school, lessons, chunk_size):
+        """
+        Regenerate the scheduled lessons of every lesson a chunk at a time, then recount and reprice each lesson from
+        its new schedule, and return the number of lessons repriced.
+        """
+        terms = TermIndex(Term.objects.filter(school=school))
+        prices = school_prices(school.id)
+        total = 0
+        # only the price and number of lessons are written, which the iterated query neither filters nor orders by
+        rows = lessons.iterator(chunk_size=chunk_size)
+        while chunk := list(islice(rows, chunk_size)):
+            with transaction.atomic():
+                for lesson in chunk:
+                    if lesson.start_date is not None and lesson.end_date is not None:
+                        reschedule(lesson, terms)
+                        lesson.number_of_lessons = lesson_count(lesson, terms)
+                    lesson.price = lesson_price(lesson, count=lesson.number_of_lessons, prices=prices)
+                Lesson.objects.bulk_update(chunk, ['number_of_lessons', 'price'])
+                rebuild_balances(Lesson.objects.filter(pk__in=[lesson.pk for lesson in chunk]))
+            total += len(chunk)
+            self.stdout.write(f"Repriced {total} lessons", ending='\r')
+        return total
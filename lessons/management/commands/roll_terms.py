@@ -0,0 +1,32 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from lessons.models import School
+from lessons.services import roll_current_terms
+
+
+class Command(BaseCommand):
+    help = "Move every school whose current term is over, or that has none, on to its term that has not ended yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--school', type=int, help="Only roll the current term of this school.")
+        parser.add_argument('--date', help="Date to roll the terms forward to as YYYY-MM-DD, today by default.")
+
+    def handle(self, *args, **options):
+        today = None
+        if options['date'] is not None:
+            try:
+                today = datetime.date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError(f"{options['date']} is not a date in the YYYY-MM-DD format.")
+        schools = School.objects.order_by('id')
+        if options['school'] is not None:
+            if not School.objects.filter(pk=options['school']).exists():
+                raise CommandError(f"School {options['school']} does not exist.")
+            schools = schools.filter(pk=options['school'])
+
+        moved = roll_current_terms(schools, today)
+        for school in moved:
+            self.stdout.write(f"School {school.id} moved on to the term starting {school.current_term.start_date}.")
+        self.stdout.write(self.style.SUCCESS(f"Rolled the current term of {len(moved)} schools forward."))
@@ -1,9 +1,10 @@
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand
 import datetime
 from faker import Faker
-import random
 
 from lessons.models import User, Lesson, School, Term, Transfer, Admission
+from lessons.services import SEED_PASSWORD, seed_users, seed_members, seed_lessons
 
 
 class Command(BaseCommand):
@@ -12,6 +13,10 @@ class Command(BaseCommand):
         super().__init__()
         self.faker = Faker('en_GB')
 
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=100, help="Number of random students seeded per school.")
+        parser.add_argument('--teachers', type=int, default=10, help="Number of random teachers seeded per school.")
+
     def create_lesson(self, student_user, teacher_user, school, term, fulfilled):
         lesson = Lesson.objects.create(
             title="Piano Lesson",
@@ -31,15 +36,6 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         print("The database is seeding...")
 
-        INSTRUMENTS = [
-            ('Piano', 'Piano'),
-            ('Guitar','Guitar'),
-            ('Drums','Drums'),
-            ('Violin','Violin'),
-            ('Trumpet','Trumpet'),
-            ('Flute','Flute'),
-            ('Harp','Harp'),
-        ]
 
         Term.objects.all().delete()
 
@@ -161,150 +157,25 @@ class Command(BaseCommand):
 
 
 
-        teacher_list = []
-
-        # Generate 10 random Teachers
-        for i in range(10):
-            first_name = self.faker.first_name()
-            last_name = self.faker.last_name()
-            email = f'{first_name}.{last_name}@{self.faker.domain_name()}'
-            instrument = random.sample(INSTRUMENTS, k=random.randint(1, len(INSTRUMENTS)))
-            password = User.objects.make_random_password()
-            teacher_user = User.objects.create_user(
-                first_name=first_name,
-                last_name=last_name,
-                email=email,
-                password=password,
-                instrument=instrument
-            )
-            teacher_list.append(teacher_user)
-            print(f'Seeding Teacher User {i}', end='\r')
-            teacher_user.set_group_adult_user()
-            school.set_group_teacher(teacher_user)
-
-            l = self.create_lesson(bob_doe, teacher_user, school, teacher_list[0], True)
-            Transfer.objects.create(user=student_user, lesson=l, school=school, amount=l.price)
-            l = self.create_lesson(bob_doe, teacher_user, school, teacher_list[0], True)
-            Transfer.objects.create(user=student_user, lesson=l, school=school, amount=l.price)
-
-
-        user_list = []
-        # Generate 100 random students for kings school
-        for i in range(100):
-            first_name = self.faker.first_name()
-            last_name = self.faker.last_name()
-            email = f'{first_name}.{last_name}@{self.faker.domain_name()}'
-            password = User.objects.make_random_password()
-            student_user = User.objects.create_user(
-                first_name=first_name,
-                last_name=last_name,
-                email=email,
-                password=password
-            )
-            user_list.append(student_user)
-            print(f'Seeding User {i}', end='\r')
-            student_user.set_group_adult_user()
-            school.set_group_client(student_user)
-            if random.random() < 0.7:
-                l = self.create_lesson(student_user, random.choice(teacher_list), school, t, True)
-                amount_diff = [0, 0.5, 1, 2]
-                diff = random.choice(amount_diff)
-                Transfer.objects.create(user=student_user, lesson=l, school=school, amount=l.price*diff)
-            if random.random() < 0.3:
-                l = self.create_lesson(student_user, random.choice(teacher_list), school, t, False)
-
-        # Generate random children per user for kings school
-        for user in user_list:
-            if random.random() < 0.6:
-                first_name = self.faker.first_name()
-                last_name = self.faker.last_name()
-                student_user = User.objects.create_user(
-                    first_name=first_name,
-                    last_name=last_name,
-                    parent=user,
-                    email=f'{first_name}.{last_name}@{self.faker.domain_name()}',
-                    password="Password123"
-                )
-                student_user.set_group_user()
-                school.set_group_client(student_user)
-                if random.random() < 0.7:
-                    l = self.create_lesson(student_user, random.choice(teacher_list), school, t, True)
-                    amount_diff = [0, 0.5, 1, 2]
-                    diff = random.choice(amount_diff)
-                    Transfer.objects.create(user=student_user, lesson=l, school=school, amount=l.price * diff)
-                if random.random() < 0.3:
-                    l = self.create_lesson(student_user, random.choice(teacher_list), school, t, False)
-
-
-        teacher_list = []
-
-        # Generate 10 random Teachers
-        for i in range(10):
-            first_name = self.faker.first_name()
-            last_name = self.faker.last_name()
-            email = f'{first_name}.{last_name}@{self.faker.domain_name()}'
-            instrument = random.sample(INSTRUMENTS, k=random.randint(1, len(INSTRUMENTS)))
-            password = User.objects.make_random_password()
-            teacher_user = User.objects.create_user(
-                first_name=first_name,
-                last_name=last_name,
-                email=email,
-                password=password,
-                instrument=instrument
-            )
-            teacher_list.append(teacher_user)
-            print(f'Seeding Teacher User {i}', end='\r')
-            teacher_user.set_group_adult_user()
-            norma_school.set_group_teacher(teacher_user)
-
+        # Generate random teachers, students and children for each school
+        password_hash = make_password(SEED_PASSWORD)
+        for prefix, seeded_school in [('kings', school), ('norma', norma_school)]:
+            teacher_list = seed_users(options['teachers'], f'{prefix}.teacher', self.faker, password_hash=password_hash)
+            seed_members(seeded_school, teacher_list, 'Teacher')
+            print(f'Seeded {len(teacher_list)} teachers for {seeded_school}')
 
-        user_list = []
-        # Generate 100 random students for norma school
-        for i in range(100):
-            first_name = self.faker.first_name()
-            last_name = self.faker.last_name()
-            email = f'{first_name}.{last_name}@{self.faker.domain_name()}'
-            password = User.objects.make_random_password()
-            student_user = User.objects.create_user(
-                first_name=first_name,
-                last_name=last_name,
-                email=email,
-                password=password
-            )
-            user_list.append(student_user)
-            print(f'Seeding User {i}', end='\r')
-            student_user.set_group_adult_user()
-            norma_school.set_group_client(student_user)
-            if random.random() < 0.7:
-                l = self.create_lesson(student_user, random.choice(teacher_list), norma_school, t, True)
-                amount_diff = [0, 0.5, 1, 2]
-                diff = random.choice(amount_diff)
-                Transfer.objects.create(user=student_user, lesson=l, school=norma_school, amount=l.price*diff)
-            if random.random() < 0.3:
-                l = self.create_lesson(student_user, random.choice(teacher_list), norma_school, t, False)
-
-        # Generate random children per user for norma school
-        for user in user_list:
-            if random.random() < 0.6:
-                first_name = self.faker.first_name()
-                last_name = self.faker.last_name()
-                student_user = User.objects.create_user(
-                    first_name=first_name,
-                    last_name=last_name,
-                    parent=user,
-                    email=f'{first_name}.{last_name}@{self.faker.domain_name()}',
-                    password="Password123"
-                )
-                student_user.set_group_user()
-                norma_school.set_group_client(student_user)
-                if random.random() < 0.7:
-                    l = self.create_lesson(student_user, random.choice(teacher_list), norma_school, t, True)
-                    amount_diff = [0, 0.5, 1, 2]
-                    diff = random.choice(amount_diff)
-                    Transfer.objects.create(user=student_user, lesson=l, school=norma_school, amount=l.price * diff)
-                if random.random() < 0.3:
-                    l = self.create_lesson(student_user, random.choice(teacher_list), norma_school, t, False)
+            user_list = seed_users(options['students'], f'{prefix}.student', self.faker, password_hash=password_hash)
+            child_list = seed_users(int(len(user_list) * 0.6), f'{prefix}.child', self.faker, parents=user_list,
+                                    password_hash=password_hash)
+            seed_members(seeded_school, user_list + child_list, 'Client')
+            seed_lessons(seeded_school, user_list + child_list, teacher_list, Term.objects.filter(school=seeded_school))
+            print(f'Seeded {len(user_list)} students and {len(child_list)} children for {seeded_school}')
 
+            if seeded_school == school:
+                for teacher_user in teacher_list:
+                    for _ in range(2):
+                        l = self.create_lesson(bob_doe, teacher_user, school, t, True)
+                        Transfer.objects.create(user=student_user, lesson=l, school=school, amount=l.price)
 
         # Generate 1 random Admins
         for i in range(1):
@@ -0,0 +1,28 @@
+# Generated by Django 4.1.3 on 2026-10-18 12:14
+
+from decimal import Decimal
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LessonPrice',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('duration', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(30), django.core.validators.MaxValueValidator(60), django.core.validators.StepValueValidator(15)], verbose_name='Duration (minutes)')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('school', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='prices', to='lessons.school')),
+            ],
+            options={
+                'unique_together': {('school', 'duration')},
+            },
+        ),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 4.1.3 on 2026-10-18 12:17
+
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_ledger(apps, schema_editor):
+    Lesson = apps.get_model('lessons', 'Lesson')
+    Transfer = apps.get_model('lessons', 'Transfer')
+    LessonBalance = apps.get_model('lessons', 'LessonBalance')
+    StudentBalance = apps.get_model('lessons', 'StudentBalance')
+
+    paid = dict(
+        Transfer.objects.values('lesson_id').annotate(total=models.Sum('amount')).values_list('lesson_id', 'total')
+    )
+    lesson_balances, student_totals = [], {}
+    for lesson_id, school_id, student_id, fulfilled, price in Lesson.objects.values_list(
+            'id', 'school_id', 'student_id', 'fulfilled', 'price').iterator():
+        invoiced = Decimal(price).quantize(Decimal('0.01')) if fulfilled and price is not None else Decimal('0.00')
+        lesson_paid = paid.get(lesson_id) or Decimal('0.00')
+        lesson_balances.append(LessonBalance(
+            lesson_id=lesson_id, school_id=school_id, student_id=student_id,
+            invoiced=invoiced, paid=lesson_paid, outstanding=invoiced - lesson_paid
+        ))
+        totals = student_totals.setdefault((school_id, student_id), [Decimal('0.00'), Decimal('0.00')])
+        totals[0] += invoiced
+        totals[1] += lesson_paid
+    LessonBalance.objects.bulk_create(lesson_balances, batch_size=500)
+    StudentBalance.objects.bulk_create([
+        StudentBalance(
+            school_id=school_id, student_id=student_id,
+            invoiced=invoiced, paid=total_paid, outstanding=invoiced - total_paid
+        )
+        for (school_id, student_id), (invoiced, total_paid) in student_totals.items()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0002_lessonprice'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LessonBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('invoiced', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('paid', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('outstanding', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=10)),
+                ('lesson', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='balance', to='lessons.lesson')),
+                ('school', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='lessons.school')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lesson_balances', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StudentBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('invoiced', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('paid', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('outstanding', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('school', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_balances', to='lessons.school')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_balances', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('school', 'student')},
+            },
+        ),
+        migrations.RunPython(build_ledger, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 4.1.3 on 2026-10-18 12:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import unicodedata
+
+
+def normalise_name(name):
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(character for character in decomposed if not unicodedata.combining(character))
+    return ' '.join(stripped.casefold().split())[:40]
+
+
+def index_names(apps, schema_editor):
+    User = apps.get_model('lessons', 'User')
+    NameTrigram = apps.get_model('lessons', 'NameTrigram')
+
+    users = list(User.objects.only('id', 'first_name', 'last_name'))
+    trigrams = []
+    for user in users:
+        user.first_name_key = normalise_name(user.first_name)
+        user.last_name_key = normalise_name(user.last_name)
+        user_trigrams = {
+            key[start:start + 3] for key in (user.first_name_key, user.last_name_key) for start in range(len(key) - 2)
+        }
+        trigrams.extend(NameTrigram(user_id=user.id, trigram=trigram) for trigram in user_trigrams)
+    User.objects.bulk_update(users, ['first_name_key', 'last_name_key'], batch_size=500)
+    NameTrigram.objects.bulk_create(trigrams, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0003_balance_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='first_name_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='last_name_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=40),
+        ),
+        migrations.CreateModel(
+            name='NameTrigram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trigram', models.CharField(max_length=3)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='name_trigrams', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'unique_together': {('trigram', 'user')},
+            },
+        ),
+        migrations.RunPython(index_names, migrations.RunPython.noop),
+    ]
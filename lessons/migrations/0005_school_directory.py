@@ -0,0 +1,87 @@
+# Generated by Django 4.1.3 on 2026-10-18 12:34
+
+from django.db import migrations, models
+import django.db.models.deletion
+import lessons.models.search
+import unicodedata
+
+DIRECTORY_SQL = [
+    "CREATE VIRTUAL TABLE lessons_school_directory USING fts5("
+    "name_key, content='lessons_school', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER lessons_school_directory_insert AFTER INSERT ON lessons_school BEGIN "
+    "INSERT INTO lessons_school_directory(rowid, name_key) VALUES (new.id, new.name_key); END",
+    "CREATE TRIGGER lessons_school_directory_delete AFTER DELETE ON lessons_school BEGIN "
+    "INSERT INTO lessons_school_directory(lessons_school_directory, rowid, name_key) "
+    "VALUES ('delete', old.id, old.name_key); END",
+    "CREATE TRIGGER lessons_school_directory_update AFTER UPDATE OF name_key ON lessons_school BEGIN "
+    "INSERT INTO lessons_school_directory(lessons_school_directory, rowid, name_key) "
+    "VALUES ('delete', old.id, old.name_key); "
+    "INSERT INTO lessons_school_directory(rowid, name_key) VALUES (new.id, new.name_key); END",
+    "INSERT INTO lessons_school_directory(lessons_school_directory) VALUES ('rebuild')",
+]
+
+DROP_DIRECTORY_SQL = [
+    "DROP TRIGGER lessons_school_directory_insert",
+    "DROP TRIGGER lessons_school_directory_delete",
+    "DROP TRIGGER lessons_school_directory_update",
+    "DROP TABLE lessons_school_directory",
+]
+
+
+def normalise_name(name):
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(character for character in decomposed if not unicodedata.combining(character))
+    return ' '.join(stripped.casefold().split())[:30]
+
+
+def index_school_names(apps, schema_editor):
+    School = apps.get_model('lessons', 'School')
+    schools = list(School.objects.only('id', 'name'))
+    for school in schools:
+        school.name_key = normalise_name(school.name)
+    School.objects.bulk_update(schools, ['name_key'], batch_size=500)
+
+
+def create_directory(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in DIRECTORY_SQL:
+            schema_editor.execute(statement)
+
+
+def drop_directory(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        for statement in DROP_DIRECTORY_SQL:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0004_member_search'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SchoolDirectoryEntry',
+            fields=[
+                ('school', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='directory_entry', serialize=False, to='lessons.school')),
+                ('name_key', lessons.models.search.DirectoryField(max_length=30)),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'lessons_school_directory',
+                'managed': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='school',
+            name='name_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=30),
+        ),
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(fields=['client', 'school'], name='admission_client_school_idx'),
+        ),
+        migrations.RunPython(index_school_names, migrations.RunPython.noop),
+        migrations.RunPython(create_directory, drop_directory),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.1.3 on 2026-10-18 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0005_school_directory'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='admission',
+            index=models.Index(fields=['school', 'client', 'is_active'], name='admission_membership_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lesson',
+            index=models.Index(fields=['school', 'fulfilled', 'id'], name='lesson_school_fulfilled_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lesson',
+            index=models.Index(fields=['school', 'student'], name='lesson_school_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduledlesson',
+            index=models.Index(fields=['lesson', 'start'], name='scheduled_lesson_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='studentbalance',
+            index=models.Index(fields=['school', 'outstanding'], name='balance_school_outstanding_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='term',
+            index=models.Index(fields=['school', 'start_date'], name='term_school_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transfer',
+            index=models.Index(fields=['school', 'user'], name='transfer_school_user_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.1.3 on 2026-10-18 12:52
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def copy_lessons(apps, schema_editor):
+    ScheduledLesson = apps.get_model('lessons', 'ScheduledLesson')
+    Lesson = apps.get_model('lessons', 'Lesson')
+
+    lesson = Lesson.objects.filter(pk=OuterRef('lesson_id'))
+    ScheduledLesson.objects.update(
+        school_id=Subquery(lesson.values('school_id')[:1]),
+        student_id=Subquery(lesson.values('student_id')[:1]),
+        teacher_id=Subquery(lesson.values('teacher_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0006_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scheduledlesson',
+            name='school',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='scheduled_lessons', to='lessons.school'),
+        ),
+        migrations.AddField(
+            model_name='scheduledlesson',
+            name='student',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='scheduled_lessons', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='scheduledlesson',
+            name='teacher',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='taught_scheduled_lessons', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(copy_lessons, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='scheduledlesson',
+            name='school',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='scheduled_lessons', to='lessons.school'),
+        ),
+        migrations.AlterField(
+            model_name='scheduledlesson',
+            name='student',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='scheduled_lessons', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='scheduledlesson',
+            name='teacher',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='taught_scheduled_lessons', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='scheduledlesson',
+            index=models.Index(fields=['school', 'teacher', 'start'], name='scheduled_teacher_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scheduledlesson',
+            index=models.Index(fields=['school', 'student', 'start'], name='scheduled_student_start_idx'),
+        ),
+    ]
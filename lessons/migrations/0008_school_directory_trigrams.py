@@ -0,0 +1,48 @@
+# Generated by Django 4.1.3 on 2026-10-18 13:11
+
+from django.db import migrations
+
+DROP_DIRECTORY_SQL = [
+    "DROP TRIGGER lessons_school_directory_insert",
+    "DROP TRIGGER lessons_school_directory_delete",
+    "DROP TRIGGER lessons_school_directory_update",
+    "DROP TABLE lessons_school_directory",
+]
+
+
+def directory_sql(tokenize):
+    return [
+        "CREATE VIRTUAL TABLE lessons_school_directory USING fts5("
+        f"name_key, content='lessons_school', content_rowid='id', tokenize='{tokenize}')",
+        "CREATE TRIGGER lessons_school_directory_insert AFTER INSERT ON lessons_school BEGIN "
+        "INSERT INTO lessons_school_directory(rowid, name_key) VALUES (new.id, new.name_key); END",
+        "CREATE TRIGGER lessons_school_directory_delete AFTER DELETE ON lessons_school BEGIN "
+        "INSERT INTO lessons_school_directory(lessons_school_directory, rowid, name_key) "
+        "VALUES ('delete', old.id, old.name_key); END",
+        "CREATE TRIGGER lessons_school_directory_update AFTER UPDATE OF name_key ON lessons_school BEGIN "
+        "INSERT INTO lessons_school_directory(lessons_school_directory, rowid, name_key) "
+        "VALUES ('delete', old.id, old.name_key); "
+        "INSERT INTO lessons_school_directory(rowid, name_key) VALUES (new.id, new.name_key); END",
+        "INSERT INTO lessons_school_directory(lessons_school_directory) VALUES ('rebuild')",
+    ]
+
+
+def rebuild_directory(tokenize):
+    def rebuild(apps, schema_editor):
+        if schema_editor.connection.vendor == 'sqlite':
+            for statement in DROP_DIRECTORY_SQL + directory_sql(tokenize):
+                schema_editor.execute(statement)
+    return rebuild
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0007_scheduled_lesson_members'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            rebuild_directory('trigram'), rebuild_directory('unicode61 remove_diacritics 2')
+        ),
+    ]
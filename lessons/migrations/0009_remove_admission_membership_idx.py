@@ -0,0 +1,17 @@
+# Generated by Django 4.1.3 on 2026-10-18 13:18
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0008_school_directory_trigrams'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='admission',
+            name='admission_membership_idx',
+        ),
+    ]
@@ -4,3 +4,6 @@ from .transfer import Transfer
 from .term import Term
 from .school import School
 from .admission import Admission
+from .price import LessonPrice
+from .ledger import LessonBalance, StudentBalance
+from .search import NameTrigram, SchoolDirectoryEntry
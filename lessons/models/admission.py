@@ -19,3 +19,6 @@ class Admission(models.Model):
 
     class Meta:
         unique_together = ('school', 'client')
+        indexes = [
+            models.Index(fields=['client', 'school'], name='admission_client_school_idx'),
+        ]
@@ -10,6 +10,7 @@ from django.db import models
 from multiselectfield import MultiSelectField
 
 from lessons.models.mixins import GroupRegistrationMixin
+from lessons.models.search import normalise_name
 
 
 INSTRUMENTS = [
@@ -104,11 +105,24 @@ class User(PermissionsMixin, GroupRegistrationMixin, AbstractBaseUser):
     )
     is_superuser = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True, verbose_name='Active Account')
+    first_name_key = models.CharField(max_length=40, blank=True, editable=False, db_index=True)
+    last_name_key = models.CharField(max_length=40, blank=True, editable=False, db_index=True)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
     objects = UserManager()
 
+    def normalise_names(self):
+        self.first_name_key = normalise_name(self.first_name)[:40]
+        self.last_name_key = normalise_name(self.last_name)[:40]
+
+    def save(self, *args, **kwargs):
+        self.normalise_names()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'first_name', 'last_name'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'first_name_key', 'last_name_key'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return str(f"{self.first_name} {self.last_name}")
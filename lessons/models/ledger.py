@@ -0,0 +1,59 @@
+"""
+Balance ledger models that will be used in the music school management system.
+"""
+from decimal import Decimal
+
+from django.db import models
+
+from lessons.models import User, Lesson
+
+
+class LessonBalance(models.Model):
+    """
+    The LessonBalance model holds the amount invoiced for a lesson, the amount paid towards it and the amount still
+    outstanding. Only fulfilled lessons are invoiced.
+    """
+
+    lesson = models.OneToOneField(
+        Lesson,
+        on_delete=models.CASCADE,
+        related_name='balance'
+    )
+    school = models.ForeignKey(
+        'School',
+        on_delete=models.CASCADE
+    )
+    student = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='lesson_balances'
+    )
+    invoiced = models.DecimalField(default=Decimal('0.00'), max_digits=10, decimal_places=2)
+    paid = models.DecimalField(default=Decimal('0.00'), max_digits=10, decimal_places=2)
+    outstanding = models.DecimalField(default=Decimal('0.00'), max_digits=10, decimal_places=2)
+
+
+class StudentBalance(models.Model):
+    """
+    The StudentBalance model holds the totals of the lesson balances of a student within a school.
+    """
+
+    school = models.ForeignKey(
+        'School',
+        on_delete=models.CASCADE,
+        related_name='student_balances'
+    )
+    student = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='student_balances'
+    )
+    invoiced = models.DecimalField(default=Decimal('0.00'), max_digits=12, decimal_places=2)
+    paid = models.DecimalField(default=Decimal('0.00'), max_digits=12, decimal_places=2)
+    outstanding = models.DecimalField(default=Decimal('0.00'), max_digits=12, decimal_places=2)
+
+    class Meta:
+        unique_together = ('school', 'student')
+        indexes = [
+            models.Index(fields=['school', 'outstanding'], name='balance_school_outstanding_idx'),
+        ]
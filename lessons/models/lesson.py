@@ -1,10 +1,14 @@
 """
 Lesson model that will be used in the music school management system.
 """
+from decimal import Decimal
+
 from django.apps import apps
 from django.urls import reverse
 
 from django.db import models
+from django.db.models import Case, F, Sum, Value, When
+from django.db.models.functions import Coalesce, Round
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator, StepValueValidator
 from lessons.models import User
@@ -36,6 +40,34 @@ START_TYPES = [
 ]
 
 
+class LessonQuerySet(models.QuerySet):
+    """
+    Lesson query set used to annotate lessons with information about their payments.
+    """
+
+    def with_payment_summary(self):
+        """
+        Annotate each lesson with the total amount paid by its transfers and its payment status, both calculated by
+        the database. Money is compared to the penny so that the status does not depend on how it is summed.
+        """
+        paid = Round(Coalesce(
+            Sum('transfer__amount'),
+            Value(Decimal('0.00')),
+            output_field=models.DecimalField(max_digits=10, decimal_places=2)
+        ), 2)
+        price = Round(F('price'), 2)
+        return self.annotate(
+            paid_amount=paid,
+            payment_state=Case(
+                When(paid_amount=0, then=Value("Unpaid")),
+                When(paid_amount__lt=price, then=Value("Partially Paid")),
+                When(paid_amount=price, then=Value("Paid")),
+                default=Value("Overpaid"),
+                output_field=models.CharField()
+            )
+        )
+
+
 class Lesson(models.Model):
     """
     Lesson model used to represent a fulfilled or unfulfilled lesson.
@@ -90,29 +122,42 @@ class Lesson(models.Model):
     start_date = models.DateField(blank=True, null=True)
     end_date = models.DateField(blank=True, null=True)
 
+    objects = LessonQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['school', 'fulfilled', 'id'], name='lesson_school_fulfilled_idx'),
+            models.Index(fields=['school', 'student'], name='lesson_school_student_idx'),
+        ]
+
     @property
     def total_paid(self):
         """
-        Calculate the total paid amount of all transfers that relate to this lesson.
+        Calculate the total paid amount of all transfers that relate to this lesson, or return it from the
+        annotation added by with_payment_summary.
         """
-        transfer_list = apps.get_model('lessons.Transfer').objects.filter(lesson=self.id)
-        total_paid = 0
-        for transfer in transfer_list:
-            total_paid += transfer.amount
-        return total_paid
+        if 'paid_amount' in self.__dict__:
+            return self.paid_amount
+        total_paid = apps.get_model('lessons.Transfer').objects.filter(lesson=self.id).aggregate(
+            total=Sum('amount')
+        )['total']
+        return total_paid or 0
 
     @property
     def payment_status(self):
         """
         Return a suitable status message of the paid amount of a transfer.
         """
-        if self.total_paid == 0:
+        if 'payment_state' in self.__dict__:
+            return self.payment_state
+        total_paid = self.total_paid
+        if total_paid == 0:
             return "Unpaid"
-        elif self.total_paid < self.price:
+        elif total_paid < self.price:
             return "Partially Paid"
-        elif self.total_paid == self.price:
+        elif total_paid == self.price:
             return "Paid"
-        elif self.total_paid > self.price:
+        elif total_paid > self.price:
             return "Overpaid"
 
     def __str__(self):
@@ -123,10 +168,53 @@ class Lesson(models.Model):
 
 
 class ScheduledLesson(models.Model):
+    """
+    ScheduledLesson model used to represent a single occurrence of a lesson. The school, student and teacher of its
+    lesson are copied onto it, so that timetables are read as a range of an index in start order.
+    """
+
     lesson = models.ForeignKey(
         Lesson,
         blank=False,
         on_delete=models.CASCADE  # check this
     )
+    school = models.ForeignKey(
+        'School',
+        on_delete=models.CASCADE,
+        related_name='scheduled_lessons',
+        editable=False
+    )
+    student = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='scheduled_lessons',
+        editable=False
+    )
+    teacher = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='taught_scheduled_lessons',
+        editable=False
+    )
     start = models.DateTimeField(blank=False)
     end = models.DateTimeField(blank=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['lesson', 'start'], name='scheduled_lesson_start_idx'),
+            models.Index(fields=['school', 'teacher', 'start'], name='scheduled_teacher_start_idx'),
+            models.Index(fields=['school', 'student', 'start'], name='scheduled_student_start_idx'),
+        ]
+
+    def copy_lesson(self):
+        """
+        Copy the school, student and teacher of the lesson onto this scheduled lesson.
+        """
+        self.school_id = self.lesson.school_id
+        self.student_id = self.lesson.student_id
+        self.teacher_id = self.lesson.teacher_id
+
+    def save(self, *args, **kwargs):
+        if self.school_id is None:
+            self.copy_lesson()
+        super().save(*args, **kwargs)
@@ -0,0 +1,52 @@
+"""
+School membership snapshot that will be used in the music school management system.
+"""
+
+
+class SchoolMembership:
+    """
+    Read-only snapshot of a user's admission to a school, holding whether the admission is active and the names of
+    the groups it belongs to. A null membership represents a user without an admission.
+    """
+
+    def __init__(self, admission_id=None, is_active=True, group_names=()):
+        self.admission_id = admission_id
+        self.is_active = is_active
+        self.group_names = frozenset(group_names)
+
+    @classmethod
+    def null(cls):
+        return cls()
+
+    @classmethod
+    def from_admission(cls, admission):
+        return cls(
+            admission_id=admission.id,
+            is_active=admission.is_active,
+            group_names=admission.groups.values_list('name', flat=True)
+        )
+
+    @property
+    def exists(self):
+        return self.admission_id is not None
+
+    @property
+    def group_count(self):
+        return len(self.group_names)
+
+    @property
+    def is_banned(self):
+        return not self.is_active
+
+    def in_group(self, group):
+        return group in self.group_names
+
+    def __eq__(self, other):
+        if not isinstance(other, SchoolMembership):
+            return NotImplemented
+        return (self.admission_id, self.is_active, self.group_names) == \
+               (other.admission_id, other.is_active, other.group_names)
+
+    def __repr__(self):
+        return f"<SchoolMembership admission={self.admission_id} active={self.is_active} groups={sorted(self.group_names)}>"
+
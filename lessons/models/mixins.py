@@ -1,6 +1,8 @@
 from django.contrib.auth.models import Group
 from django.apps import apps
 
+from lessons.models.membership import SchoolMembership
+
 
 class GroupRegistrationMixin:
     """
@@ -56,35 +58,84 @@ class AdmissionMixin:
         user_admission, created = apps.get_model('lessons.Admission').objects.get_or_create(school=self, client=user)
         return user_admission
 
+    def _find_user_admission(self, user):
+        return apps.get_model('lessons.Admission').objects.filter(school=self, client=user).first()
+
+    def _load_membership(self, user):
+        """
+        Read the membership of a user in one query without creating an admission for users that are not members.
+        """
+        rows = list(apps.get_model('lessons.Admission').objects.filter(
+            school=self,
+            client=user
+        ).values_list('id', 'is_active', 'groups__name'))
+        if not rows:
+            return SchoolMembership.null()
+        return SchoolMembership(
+            admission_id=rows[0][0],
+            is_active=rows[0][1],
+            group_names=[row[2] for row in rows if row[2] is not None]
+        )
+
+    """
+    Membership cache
+    """
+
+    @staticmethod
+    def _get_user_id(user):
+        return getattr(user, 'pk', user)
+
+    def cache_membership(self, user, membership):
+        """
+        Remember the membership of a user so that the group getters of this school instance do not query it again.
+        """
+        if not hasattr(self, '_memberships'):
+            self._memberships = {}
+        self._memberships[self._get_user_id(user)] = membership
+
+    def _forget_membership(self, user):
+        getattr(self, '_memberships', {}).pop(self._get_user_id(user), None)
+
+    def get_membership(self, user):
+        """
+        Return the membership of a user, preferring the copy cached on this instance over the database.
+        """
+        membership = getattr(self, '_memberships', {}).get(self._get_user_id(user))
+        if membership is None:
+            membership = self._load_membership(user)
+        return membership
+
     def leave_school(self, user):
-        user_admission = self._get_user_admission(user)
-        user_admission.groups.clear()
+        user_admission = self._find_user_admission(user)
+        if user_admission is not None:
+            user_admission.groups.clear()
+        self._forget_membership(user)
 
     def ban_member(self, user):
         user_admission = self._get_user_admission(user)
         user_admission.is_active = False
         user_admission.save()
+        self._forget_membership(user)
 
     def unban_member(self, user):
-        user_admission = self._get_user_admission(user)
-        user_admission.is_active = True
-        user_admission.save()
+        user_admission = self._find_user_admission(user)
+        if user_admission is not None and not user_admission.is_active:
+            user_admission.is_active = True
+            user_admission.save()
+        self._forget_membership(user)
 
     def has_member(self, user):
-        user_admission = self._get_user_admission(user)
-        return user_admission.groups.count()
+        return self.get_membership(user).group_count
 
     def get_ban(self, user):
-        user_admission = self._get_user_admission(user)
-        return not user_admission.is_active
+        return self.get_membership(user).is_banned
 
     """
     Group getters
     """
 
     def _is_group(self, user, group):
-        user_admission = self._get_user_admission(user)
-        return user_admission.groups.filter(name=group).exists()
+        return self.get_membership(user).in_group(group)
 
     def is_director(self, user):
         return self._is_group(user, 'Director')
@@ -109,6 +160,7 @@ class AdmissionMixin:
         group, created = Group.objects.get_or_create(name=group)
         user_admission = self._get_user_admission(user)
         user_admission.groups.add(group)
+        self._forget_membership(user)
 
     def set_group_director(self, user):
         self._set_group(user, 'Director')
@@ -0,0 +1,36 @@
+"""
+Lesson price model that will be used in the music school management system.
+"""
+from decimal import Decimal
+
+from django.core.validators import MinValueValidator, MaxValueValidator, StepValueValidator
+from django.db import models
+
+
+class LessonPrice(models.Model):
+    """
+    The LessonPrice model holds the price of a single lesson of a given duration within a school. Durations without a
+    price are charged at the default hourly rate.
+    """
+
+    school = models.ForeignKey(
+        'School',
+        on_delete=models.CASCADE,
+        blank=False,
+        related_name='prices'
+    )
+    duration = models.PositiveIntegerField(
+        validators=[MinValueValidator(30), MaxValueValidator(60), StepValueValidator(15)],
+        verbose_name="Duration (minutes)"
+    )
+    price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        validators=[MinValueValidator(Decimal('0.01'))]
+    )
+
+    class Meta:
+        unique_together = ('school', 'duration')
+
+    def __str__(self):
+        return f"{self.duration}m - £{self.price}"
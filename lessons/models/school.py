@@ -2,11 +2,55 @@
 School models that will be used in the music school management system.
 """
 from django.db import models
-from datetime import datetime
+from django.db.models import FilteredRelation, Q
 
 from lessons.models import Term
 from lessons.models import User
+from lessons.models.membership import SchoolMembership
 from lessons.models.mixins import AdmissionMixin
+from lessons.models.search import normalise_name
+
+
+class SchoolManager(models.Manager):
+    """
+    School manager used to load schools together with the membership of a user.
+    """
+
+    def get_with_membership(self, user, **kwargs):
+        """
+        Return a single school with the membership of the given user already loaded. The school, the user's admission
+        and the names of its groups are fetched in one query.
+        """
+        if not user.is_authenticated:
+            school = self.get(**kwargs)
+            school.cache_membership(user, SchoolMembership.null())
+            return school
+
+        field_names = [field.attname for field in self.model._meta.concrete_fields]
+        rows = list(self.filter(**kwargs).annotate(
+            user_admission=FilteredRelation('admission', condition=Q(admission__client=user.pk))
+        ).values_list(
+            *field_names,
+            'user_admission__id',
+            'user_admission__is_active',
+            'user_admission__groups__name'
+        ))
+        if not rows:
+            raise self.model.DoesNotExist("School matching query does not exist.")
+
+        offset = len(field_names)
+        school = self.model.from_db(self.db, field_names, rows[0][:offset])
+        admission_id, is_active = rows[0][offset:offset + 2]
+        if admission_id is None:
+            membership = SchoolMembership.null()
+        else:
+            membership = SchoolMembership(
+                admission_id=admission_id,
+                is_active=is_active,
+                group_names=[row[offset + 2] for row in rows if row[offset + 2] is not None]
+            )
+        school.cache_membership(user, membership)
+        return school
 
 
 class School(AdmissionMixin, models.Model):
@@ -15,6 +59,7 @@ class School(AdmissionMixin, models.Model):
     """
     
     name = models.CharField(max_length=30, blank=False)
+    name_key = models.CharField(max_length=30, blank=True, editable=False, db_index=True)
     director = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -35,13 +80,25 @@ class School(AdmissionMixin, models.Model):
     )
     description = models.TextField()
 
+    objects = SchoolManager()
+
     @property
     def get_update_current_term(self):
-        if self.current_term:
-            if datetime.now().date() > self.current_term.end_date:
-                next = Term.get_next_by_start_date(self.current_term)
-                self.current_term = next
-        return self.current_term
+        """
+        Return the current term of the school from its term calendar, which has moved on once the saved one is over.
+        """
+        from lessons.services.terms import current_term
+        return current_term(self)
+
+    def normalise_name(self):
+        self.name_key = normalise_name(self.name)[:30]
+
+    def save(self, *args, **kwargs):
+        self.normalise_name()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'name_key'}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return str(f"{self.name}")
@@ -0,0 +1,80 @@
+"""
+Search indexes that will be used to find users and schools by name in the music school management system.
+"""
+import unicodedata
+
+from django.db import models
+from django.db.models import Lookup
+
+TRIGRAM_LENGTH = 3
+
+
+def normalise_name(name):
+    """
+    Return the search key of a name, which is lower-cased with its accents removed and its spaces collapsed.
+    """
+    decomposed = unicodedata.normalize('NFKD', name or '')
+    stripped = ''.join(character for character in decomposed if not unicodedata.combining(character))
+    return ' '.join(stripped.casefold().split())
+
+
+def name_trigrams(key):
+    """
+    Return the set of three character sequences of a search key.
+    """
+    return {key[start:start + TRIGRAM_LENGTH] for start in range(len(key) - TRIGRAM_LENGTH + 1)}
+
+
+class NameTrigram(models.Model):
+    """
+    The NameTrigram model holds each three character sequence of the first and last name search keys of a user, so
+    that a user whose name contains a search can be found through the index of trigrams instead of a scan of names.
+    """
+
+    user = models.ForeignKey(
+        'User',
+        on_delete=models.CASCADE,
+        related_name='name_trigrams'
+    )
+    trigram = models.CharField(max_length=TRIGRAM_LENGTH)
+
+    class Meta:
+        unique_together = ('trigram', 'user')
+
+
+class DirectoryField(models.CharField):
+    """
+    Column of a full text search table, which can be searched with the match lookup.
+    """
+
+
+@DirectoryField.register_lookup
+class Match(Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', [*lhs_params, *rhs_params]
+
+
+class SchoolDirectoryEntry(models.Model):
+    """
+    The SchoolDirectoryEntry model reads the full text index of the name search keys of schools. The index is an
+    SQLite FTS5 table of trigrams kept in sync with the schools by triggers, so it is only created on SQLite
+    databases.
+    """
+
+    school = models.OneToOneField(
+        'School',
+        primary_key=True,
+        db_column='rowid',
+        on_delete=models.DO_NOTHING,
+        related_name='directory_entry'
+    )
+    name_key = DirectoryField(max_length=30)
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'lessons_school_directory'
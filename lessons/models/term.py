@@ -21,6 +21,9 @@ class Term(models.Model):
 
     class Meta:
         ordering = ['start_date', ]
+        indexes = [
+            models.Index(fields=['school', 'start_date'], name='term_school_start_idx'),
+        ]
 
     def __str__(self):
         return "Term " + str(self.id)
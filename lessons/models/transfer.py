@@ -34,3 +34,8 @@ class Transfer(models.Model):
         max_digits=8,
         decimal_places=2
     )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['school', 'user'], name='transfer_school_user_idx'),
+        ]
@@ -0,0 +1,11 @@
+from .recurrence import *
+from .terms import *
+from .scheduling import *
+from .pricing import *
+from .ledger import *
+from .timetable import *
+from .seeding import *
+from .search import *
+from .directory import *
+from .imports import *
+from .exports import *
@@ -0,0 +1,51 @@
+"""
+School directory service that will be used to find the schools of the platform by name from the home page.
+"""
+from django.db import connections
+from django.db.models import Case, F, IntegerField, Q, Value, When
+
+from lessons.models import Admission
+from lessons.models.search import TRIGRAM_LENGTH, normalise_name
+
+__all__ = ['directory_query', 'search_schools', 'enrolled_schools']
+
+
+def directory_query(search):
+    """
+    Return the full text query matching the names that contain each word of a search at least a trigram long.
+    """
+    return ' '.join(
+        '"{}"'.format(word.replace('"', '""')) for word in normalise_name(search).split() if len(word) >= TRIGRAM_LENGTH
+    )
+
+
+def _has_directory(schools):
+    return connections[schools.db].vendor == 'sqlite'
+
+
+def search_schools(schools, search):
+    """
+    Filter schools to those whose name contains every word of a search, ignoring case and accents, and annotate
+    each of them with the rank of its match, where lower ranks are better. On SQLite the words at least a trigram
+    long are searched in the trigram index of the school directory and its matches are ranked by relevance,
+    elsewhere names are ranked by whether they start with the search.
+    """
+    key = normalise_name(search)
+    if not key:
+        return schools.annotate(rank=Value(0, output_field=IntegerField()))
+    schools = schools.filter(*[Q(name_key__contains=word) for word in key.split() if len(word) < TRIGRAM_LENGTH])
+    query = directory_query(key)
+    if query and _has_directory(schools):
+        return schools.filter(directory_entry__name_key__match=query).annotate(rank=F('directory_entry__rank'))
+
+    schools = schools.filter(*[Q(name_key__contains=word) for word in key.split() if len(word) >= TRIGRAM_LENGTH])
+    return schools.annotate(
+        rank=Case(When(name_key__startswith=key, then=Value(0)), default=Value(1), output_field=IntegerField())
+    )
+
+
+def enrolled_schools(schools, user):
+    """
+    Filter schools to those a user belongs to a group of, found through the index of the user's admissions.
+    """
+    return schools.filter(id__in=Admission.objects.filter(client=user, groups__isnull=False).values('school_id'))
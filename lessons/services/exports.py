@@ -0,0 +1,86 @@
+"""
+Export service that will be used to stream the bookings, transfers and balances of a school as CSV files.
+"""
+import csv
+from decimal import Decimal
+
+__all__ = ['EXPORT_CHUNK_SIZE', 'BOOKING_COLUMNS', 'TRANSFER_COLUMNS', 'BALANCE_COLUMNS', 'csv_rows']
+
+EXPORT_CHUNK_SIZE = 2000
+
+BOOKING_COLUMNS = (
+    ('booking', 'id'),
+    ('title', 'title'),
+    ('student', 'student_id'),
+    ('student_first_name', 'student__first_name'),
+    ('student_last_name', 'student__last_name'),
+    ('student_email', 'student__email'),
+    ('teacher_first_name', 'teacher__first_name'),
+    ('teacher_last_name', 'teacher__last_name'),
+    ('instrument', 'instrument'),
+    ('day', 'day'),
+    ('time', 'time'),
+    ('duration', 'duration'),
+    ('number_of_lessons', 'number_of_lessons'),
+    ('interval', 'interval'),
+    ('start_date', 'start_date'),
+    ('end_date', 'end_date'),
+    ('fulfilled', 'fulfilled'),
+    ('price', 'price'),
+    ('paid', 'paid_amount'),
+    ('payment_state', 'payment_state'),
+)
+
+TRANSFER_COLUMNS = (
+    ('transfer', 'id'),
+    ('student', 'user_id'),
+    ('booking', 'lesson_id'),
+    ('student_first_name', 'user__first_name'),
+    ('student_last_name', 'user__last_name'),
+    ('lesson_title', 'lesson__title'),
+    ('amount', 'amount'),
+)
+
+BALANCE_COLUMNS = (
+    ('student', 'student_id'),
+    ('student_first_name', 'student__first_name'),
+    ('student_last_name', 'student__last_name'),
+    ('student_email', 'student__email'),
+    ('invoiced', 'invoiced'),
+    ('paid', 'paid'),
+    ('outstanding', 'outstanding'),
+)
+
+# spreadsheets run cells starting with these characters as formulas
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class Echo:
+    """
+    File-like object that returns what is written to it, so a CSV writer formats a row without buffering it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _cell(value):
+    # every decimal exported is an amount of money, which annotations on SQLite may return without its pence
+    if isinstance(value, Decimal):
+        return f'{value:.2f}'
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def csv_rows(queryset, columns):
+    """
+    Yield the header and then every row of a queryset as lines of a CSV file, where columns pairs the header of each
+    column with the field it is read from. The rows are read as tuples in chunks of EXPORT_CHUNK_SIZE with a server
+    side cursor where the database has one, so a file of any length is written in constant memory.
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow([header for header, field in columns])
+    rows = queryset.values_list(*[field for header, field in columns])
+    for row in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield writer.writerow([_cell(value) for value in row])
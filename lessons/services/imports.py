@@ -0,0 +1,250 @@
+"""
+Import service that will be used to read the terms of many schools and the transfers of bank statements from CSV or
+JSON files and save them in bulk.
+"""
+import csv
+import datetime
+import io
+import json
+import re
+from collections import defaultdict, namedtuple
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from lessons.models import Lesson, School, Term, Transfer, User
+from lessons.services.ledger import rebuild_balances
+from lessons.services.terms import TermCalendar, invalidate_term_calendar
+
+__all__ = [
+    'IMPORT_FORMATS', 'TermRow', 'import_format', 'read_rows', 'parse_terms', 'validate_terms', 'import_terms',
+    'TransferImport', 'transfer_reference_errors', 'import_transfers'
+]
+
+IMPORT_FORMATS = ('csv', 'json')
+
+TermRow = namedtuple('TermRow', ['row', 'school_id', 'start_date', 'end_date'])
+
+TransferImport = namedtuple('TransferImport', ['transfers', 'rejects'])
+
+TRANSFER_REFERENCE = re.compile(r'^([0-9]+)-([0-9]+)$')
+TRANSFER_AMOUNT_LIMIT = Decimal('1000000')
+ID_LIMIT = 2 ** 63
+
+
+def import_format(file_name):
+    """
+    Return the format of an import file from the extension of its name.
+    """
+    extension = file_name.rsplit('.', 1)[-1].lower() if '.' in file_name else ''
+    if extension not in IMPORT_FORMATS:
+        raise ValidationError("Only CSV and JSON files can be imported.")
+    return extension
+
+
+def read_rows(file, file_format):
+    """
+    Return the number and fields of every row of a CSV file with a header row, or of a JSON file holding a list of
+    objects. Rows are numbered from one, not counting the header.
+    """
+    content = file.read()
+    if isinstance(content, bytes):
+        try:
+            content = content.decode('utf-8-sig')
+        except UnicodeDecodeError:
+            raise ValidationError("The file must be encoded as UTF-8.")
+
+    if file_format == 'csv':
+        return list(enumerate(csv.DictReader(io.StringIO(content)), start=1))
+
+    try:
+        records = json.loads(content)
+    except ValueError:
+        raise ValidationError("The file is not valid JSON.")
+    if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+        raise ValidationError("The file must hold a list of objects.")
+    return list(enumerate(records, start=1))
+
+
+def _is_id(value):
+    return 0 < value < ID_LIMIT
+
+
+def _parse_id(value):
+    number = int(str(value).strip())
+    if not _is_id(number):
+        raise ValueError(f"{number} is not an id.")
+    return number
+
+
+def _parse_date(value):
+    return datetime.date.fromisoformat(str(value).strip())
+
+
+def parse_terms(rows, school_id=None):
+    """
+    Return the terms of the rows of an import file. Each row gives a school, start_date and end_date, where dates are
+    written as YYYY-MM-DD. When a school is given, every term is imported into it and the rows give no school.
+    """
+    terms, errors = [], []
+    for number, fields in rows:
+        try:
+            school = school_id if school_id is not None else _parse_id(fields.get('school'))
+        except ValueError:
+            errors.append(f"Row {number}: the school must be a school number.")
+            continue
+        try:
+            start_date, end_date = _parse_date(fields.get('start_date')), _parse_date(fields.get('end_date'))
+        except ValueError:
+            errors.append(f"Row {number}: the start and end dates must be written as YYYY-MM-DD.")
+            continue
+        terms.append(TermRow(number, school, start_date, end_date))
+    if errors:
+        raise ValidationError(errors)
+    if not terms:
+        raise ValidationError("The file holds no terms.")
+    return terms
+
+
+def _existing_terms(school_ids):
+    existing = defaultdict(list)
+    for term in Term.objects.filter(school__in=school_ids):
+        existing[term.school_id].append(term)
+    return existing
+
+
+def validate_terms(terms):
+    """
+    Check that the schools of imported terms exist, that every term ends after it starts and that no term overlaps
+    another imported or existing term of its school. The existing terms of every school are read with a single query
+    and each school's terms are sorted by start date, so overlaps are found by comparing neighbours.
+    """
+    school_ids = {term.school_id for term in terms if _is_id(term.school_id)}
+    known = set(School.objects.filter(pk__in=school_ids).values_list('pk', flat=True))
+    errors, by_school = [], defaultdict(list)
+    for term in terms:
+        if term.school_id not in known:
+            errors.append((term.row, f"Row {term.row}: school {term.school_id} does not exist."))
+        elif term.end_date <= term.start_date:
+            errors.append((term.row, f"Row {term.row}: the end date cannot be earlier or equal to the start date."))
+        else:
+            by_school[term.school_id].append(term)
+    for school_id, existing in _existing_terms(list(by_school)).items():
+        by_school[school_id].extend(TermRow(None, school_id, term.start_date, term.end_date) for term in existing)
+
+    for school_id, intervals in by_school.items():
+        intervals.sort(key=lambda interval: interval.start_date)
+        latest = None
+        for interval in intervals:
+            if latest is not None and interval.start_date <= latest.end_date:
+                errors.extend(_overlap_error(school_id, latest, interval))
+            if latest is None or interval.end_date > latest.end_date:
+                latest = interval
+    if errors:
+        raise ValidationError([message for row, message in sorted(errors)])
+
+
+def _overlap_error(school_id, earlier, later):
+    if earlier.row is not None and later.row is not None:
+        return [(later.row, f"Row {later.row}: the term overlaps the term of row {earlier.row}.")]
+    imported = earlier if later.row is None else later
+    if imported.row is None:
+        return []
+    return [(imported.row, f"Row {imported.row}: the term overlaps an existing term of school {school_id}.")]
+
+
+def import_terms(terms, today=None):
+    """
+    Validate imported terms and save them with a single insert, then give each of their schools that has no current
+    term the first of its terms that has not ended. Return the saved terms.
+    """
+    today = today or timezone.localdate()
+    with transaction.atomic():
+        validate_terms(terms)
+        created = Term.objects.bulk_create([
+            Term(school_id=term.school_id, start_date=term.start_date, end_date=term.end_date) for term in terms
+        ], batch_size=500)
+
+        school_ids = {term.school_id for term in created}
+        schools = list(School.objects.filter(pk__in=school_ids, current_term__isnull=True).only('id', 'current_term'))
+        school_terms = _existing_terms([school.pk for school in schools])
+        for school in schools:
+            school.current_term = TermCalendar(school_terms[school.pk]).current_term(today)
+        School.objects.bulk_update(schools, ['current_term'], batch_size=500)
+        for school_id in school_ids:
+            invalidate_term_calendar(school_id)
+    return created
+
+
+def transfer_reference_errors(user, lesson, school_id):
+    """
+    Return what is wrong with paying for a lesson with a transfer from a user within a school, where the user or
+    lesson is None when its reference could not be found.
+    """
+    errors = []
+    if user is None:
+        errors.append("This user could not be found. You should refund this transfer.")
+    if lesson is None:
+        errors.append("This lesson could not be found. You should refund this transfer.")
+    if user is None or lesson is None:
+        return errors
+    if user.pk != lesson.student_id:
+        return ["This student has not booked this lesson. You should refund this transfer."]
+    if not lesson.fulfilled:
+        errors.append("This lesson has not been fulfilled yet.")
+    if lesson.school_id != int(school_id):
+        errors.append("This lesson is not managed by this school")
+    return errors
+
+
+def _parse_amount(value):
+    try:
+        amount = Decimal(str(value).strip().replace(',', ''))
+    except InvalidOperation:
+        return None
+    if not amount.is_finite() or amount < Decimal('0.01') or amount >= TRANSFER_AMOUNT_LIMIT \
+            or amount != amount.quantize(Decimal('0.01')):
+        return None
+    return amount
+
+
+def import_transfers(rows, school_id):
+    """
+    Save the transfers of the rows of a bank statement, each giving the reference and amount of a transfer, and
+    return them along with the number and reason of every rejected row. The users and lessons of every reference are
+    read with two lookups, the rows are checked in memory and the valid ones are saved with a single insert, after
+    which the balances of their lessons are rebuilt. References to numbers too large to be ids are never looked up,
+    so they are rejected as users and lessons that could not be found.
+    """
+    rejects, lines = [], []
+    for number, fields in rows:
+        match = TRANSFER_REFERENCE.match(str(fields.get('reference') or '').strip())
+        amount = _parse_amount(fields.get('amount'))
+        if match is None:
+            rejects.append((number, "The reference must be in the format XXXX-YYYY."))
+        elif amount is None:
+            rejects.append((number, "The amount must be a number of pounds and pence from 0.01."))
+        else:
+            lines.append((number, int(match.group(1)), int(match.group(2)), amount))
+
+    users = User.objects.only('id').in_bulk(
+        {user_id for number, user_id, lesson_id, amount in lines if _is_id(user_id)}
+    )
+    lessons = Lesson.objects.only('id', 'student_id', 'school_id', 'fulfilled').in_bulk(
+        {lesson_id for number, user_id, lesson_id, amount in lines if _is_id(lesson_id)}
+    )
+    transfers = []
+    for number, user_id, lesson_id, amount in lines:
+        errors = transfer_reference_errors(users.get(user_id), lessons.get(lesson_id), school_id)
+        if errors:
+            rejects.append((number, ' '.join(errors)))
+        else:
+            transfers.append(Transfer(user_id=user_id, lesson_id=lesson_id, school_id=school_id, amount=amount))
+
+    with transaction.atomic():
+        transfers = Transfer.objects.bulk_create(transfers, batch_size=500)
+        if transfers:
+            rebuild_balances(Lesson.objects.filter(pk__in={transfer.lesson_id for transfer in transfers}))
+    return TransferImport(transfers, sorted(rejects))
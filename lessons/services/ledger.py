@@ -0,0 +1,199 @@
+"""
+Ledger service that will be used to keep the balances of lessons and students up to date.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Round
+
+from lessons.models import Lesson, LessonBalance, StudentBalance
+
+__all__ = [
+    'refresh_lesson_balance',
+    'remove_lesson_balance',
+    'expected_lesson_balances',
+    'ledger_differences',
+    'student_ledger_differences',
+    'rebuild_balances',
+]
+
+ZERO = Decimal('0.00')
+BALANCE_FIELDS = ['school', 'student', 'invoiced', 'paid', 'outstanding']
+
+
+def _balance_values(balance):
+    return balance.school_id, balance.student_id, balance.invoiced, balance.paid, balance.outstanding
+
+
+def _invoiced(fulfilled, price):
+    if not fulfilled or price is None:
+        return ZERO
+    return Decimal(price)
+
+
+def _apply_student_delta(school_id, student_id, invoiced, paid, create=True):
+    if not invoiced and not paid:
+        return
+    balances = StudentBalance.objects.filter(school_id=school_id, student_id=student_id)
+    updated = balances.update(
+        invoiced=Round(F('invoiced') + Value(invoiced), 2),
+        paid=Round(F('paid') + Value(paid), 2),
+        outstanding=Round(F('outstanding') + Value(invoiced - paid), 2),
+    )
+    if not updated and create:
+        StudentBalance.objects.create(
+            school_id=school_id,
+            student_id=student_id,
+            invoiced=invoiced,
+            paid=paid,
+            outstanding=invoiced - paid
+        )
+
+
+def refresh_lesson_balance(lesson_id):
+    """
+    Recalculate the balance of a lesson from its price and transfers and apply the difference to the balance of its
+    student. A lesson moved to another student or school takes its totals with it.
+    """
+    with transaction.atomic():
+        lesson = Lesson.objects.filter(pk=lesson_id).with_payment_summary().values_list(
+            'school_id', 'student_id', 'fulfilled', 'price', 'paid_amount'
+        ).first()
+        if lesson is None:
+            return None
+        school_id, student_id, fulfilled, price, paid = lesson
+        invoiced = _invoiced(fulfilled, price)
+
+        balance = LessonBalance.objects.select_for_update().filter(lesson_id=lesson_id).first()
+        if balance is None:
+            balance = LessonBalance(lesson_id=lesson_id, school_id=school_id, student_id=student_id)
+        elif (balance.school_id, balance.student_id) != (school_id, student_id):
+            _apply_student_delta(balance.school_id, balance.student_id, -balance.invoiced, -balance.paid, create=False)
+            balance.school_id, balance.student_id = school_id, student_id
+            balance.invoiced = balance.paid = ZERO
+
+        invoiced_delta = invoiced - balance.invoiced
+        paid_delta = paid - balance.paid
+        balance.invoiced, balance.paid, balance.outstanding = invoiced, paid, invoiced - paid
+        balance.save()
+        _apply_student_delta(school_id, student_id, invoiced_delta, paid_delta)
+        return balance
+
+
+def remove_lesson_balance(balance):
+    """
+    Subtract the totals of a deleted lesson balance from the balance of its student.
+    """
+    _apply_student_delta(balance.school_id, balance.student_id, -balance.invoiced, -balance.paid, create=False)
+
+
+def expected_lesson_balances(lessons):
+    """
+    Yield the lesson balances a queryset of lessons should have, calculated from their prices and transfers.
+    """
+    rows = lessons.order_by().with_payment_summary().values_list(
+        'id', 'school_id', 'student_id', 'fulfilled', 'price', 'paid_amount'
+    )
+    for lesson_id, school_id, student_id, fulfilled, price, paid in rows.iterator():
+        invoiced = _invoiced(fulfilled, price)
+        yield LessonBalance(
+            lesson_id=lesson_id,
+            school_id=school_id,
+            student_id=student_id,
+            invoiced=invoiced,
+            paid=paid,
+            outstanding=invoiced - paid
+        )
+
+
+def ledger_differences(lessons):
+    """
+    Yield pairs of stored and expected lesson balances that differ for a queryset of lessons. The stored balance is
+    None when a lesson has no balance yet.
+    """
+    stored = {
+        balance.lesson_id: balance for balance in LessonBalance.objects.filter(lesson__in=lessons.values('pk'))
+    }
+    for expected in expected_lesson_balances(lessons):
+        balance = stored.get(expected.lesson_id)
+        if balance is None or _balance_values(balance) != _balance_values(expected):
+            yield balance, expected
+
+
+def student_ledger_differences(balances):
+    """
+    Yield student balances from a queryset whose totals differ from the totals of their lesson balances.
+    """
+    totals = {
+        (row['school_id'], row['student_id']): (row['total_invoiced'], row['total_paid'])
+        for row in LessonBalance.objects.filter(
+            school_id__in=balances.order_by().values('school_id'),
+            student_id__in=balances.order_by().values('student_id')
+        ).values('school_id', 'student_id').annotate(
+            total_invoiced=Sum('invoiced'),
+            total_paid=Sum('paid')
+        ).order_by()
+    }
+    for balance in balances.iterator():
+        invoiced, paid = totals.get((balance.school_id, balance.student_id), (ZERO, ZERO))
+        if (balance.invoiced, balance.paid, balance.outstanding) != (invoiced, paid, invoiced - paid):
+            yield balance
+
+
+def _rebuild_student_balances(pairs):
+    totals = LessonBalance.objects.filter(
+        school_id__in={school_id for school_id, _ in pairs},
+        student_id__in={student_id for _, student_id in pairs}
+    ).values('school_id', 'student_id').annotate(
+        total_invoiced=Sum('invoiced'),
+        total_paid=Sum('paid')
+    ).order_by()
+    totals = {
+        (row['school_id'], row['student_id']): (row['total_invoiced'], row['total_paid']) for row in totals
+    }
+    existing = {
+        (balance.school_id, balance.student_id): balance for balance in StudentBalance.objects.filter(
+            school_id__in={school_id for school_id, _ in pairs},
+            student_id__in={student_id for _, student_id in pairs}
+        )
+    }
+
+    to_create, to_update = [], []
+    for pair in pairs:
+        invoiced, paid = totals.get(pair, (ZERO, ZERO))
+        balance = existing.get(pair)
+        if balance is None:
+            balance = StudentBalance(school_id=pair[0], student_id=pair[1])
+            to_create.append(balance)
+        else:
+            to_update.append(balance)
+        balance.invoiced, balance.paid, balance.outstanding = invoiced, paid, invoiced - paid
+    StudentBalance.objects.bulk_update(to_update, ['invoiced', 'paid', 'outstanding'])
+    StudentBalance.objects.bulk_create(to_create)
+
+
+def rebuild_balances(lessons):
+    """
+    Recalculate the balances of a queryset of lessons in bulk, then recalculate the balances of their students from
+    the lesson balances. Used after bulk updates which do not send signals, and to repair the ledger.
+    """
+    with transaction.atomic():
+        existing = dict(
+            LessonBalance.objects.filter(lesson__in=lessons.values('pk')).values_list('lesson_id', 'id')
+        )
+        to_create, to_update, pairs = [], [], set()
+        for balance in expected_lesson_balances(lessons):
+            balance.id = existing.get(balance.lesson_id)
+            (to_create if balance.id is None else to_update).append(balance)
+            pairs.add((balance.school_id, balance.student_id))
+
+        # lessons moved to another student leave totals behind on their previous student
+        pairs.update(
+            LessonBalance.objects.filter(lesson__in=lessons.values('pk')).values_list('school_id', 'student_id')
+        )
+        LessonBalance.objects.bulk_update(to_update, BALANCE_FIELDS, batch_size=500)
+        LessonBalance.objects.bulk_create(to_create, batch_size=500)
+        if pairs:
+            _rebuild_student_balances(pairs)
+        return len(to_create) + len(to_update)
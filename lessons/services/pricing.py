@@ -0,0 +1,116 @@
+"""
+Pricing service that will be used to price the lessons of a booking.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+
+from django.db import transaction
+from django.db.models import Case, DecimalField, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, Round
+
+from lessons.models import Lesson, LessonPrice
+from lessons.services.ledger import rebuild_balances
+from lessons.services.recurrence import count_occurrences
+
+__all__ = [
+    'DEFAULT_HOURLY_RATE',
+    'default_unit_price',
+    'unit_price',
+    'school_prices',
+    'lesson_count',
+    'lesson_price',
+    'reprice_lessons',
+    'reprice_term',
+]
+
+DEFAULT_HOURLY_RATE = Decimal('10.00')
+PENNY = Decimal('0.01')
+
+
+def default_unit_price(duration):
+    """
+    Return the price of a single lesson of a given duration at the default hourly rate.
+    """
+    return (DEFAULT_HOURLY_RATE * Decimal(duration) / Decimal(60)).quantize(PENNY, rounding=ROUND_HALF_UP)
+
+
+def unit_price(school_id, duration):
+    """
+    Return the price of a single lesson of a given duration from the price table of a school, falling back to the
+    default hourly rate.
+    """
+    price = LessonPrice.objects.filter(school_id=school_id, duration=duration).values_list('price', flat=True).first()
+    if price is None:
+        return default_unit_price(duration)
+    return price
+
+
+def school_prices(school_id):
+    """
+    Return the price table of a school as a dictionary from lesson duration to the price of a single lesson.
+    """
+    return dict(LessonPrice.objects.filter(school_id=school_id).values_list('duration', 'price'))
+
+
+def lesson_count(lesson, terms=None):
+    """
+    Return the number of scheduled lessons of a booking from the recurrence engine, without querying its schedule.
+    Bookings without a start and end date have no scheduled lessons.
+    """
+    if lesson.start_date is None or lesson.end_date is None:
+        return 0
+    return count_occurrences(lesson, terms)
+
+
+def lesson_price(lesson, count=None, terms=None, prices=None):
+    """
+    Return the price of a booking, which is the price of each lesson multiplied by the number of lessons. A price
+    table loaded with school_prices can be given to avoid querying it for every lesson.
+    """
+    if count is None:
+        count = lesson_count(lesson, terms)
+    if prices is None:
+        price = unit_price(lesson.school_id, lesson.duration)
+    else:
+        price = prices.get(lesson.duration) or default_unit_price(lesson.duration)
+    return (price * count).quantize(PENNY, rounding=ROUND_HALF_UP)
+
+
+def _unit_price_expression(durations):
+    table_price = LessonPrice.objects.filter(
+        school=OuterRef('school'),
+        duration=OuterRef('duration')
+    ).values('price')[:1]
+    # default prices are calculated in Python so that they stay exact decimals on every database backend
+    default_price = Case(
+        *[When(duration=duration, then=Value(default_unit_price(duration))) for duration in durations],
+        output_field=DecimalField()
+    )
+    return Coalesce(Subquery(table_price, output_field=DecimalField()), default_price, output_field=DecimalField())
+
+
+def reprice_lessons(lessons):
+    """
+    Reprice every lesson of a queryset from its school's price table and its stored number of lessons with a single
+    UPDATE, and return the number of lessons repriced. The update sends no signals, so the balances of the lessons are
+    left for the caller to rebuild.
+    """
+    durations = set(lessons.order_by().values_list('duration', flat=True).distinct())
+    if not durations:
+        return 0
+    return lessons.update(price=Round(_unit_price_expression(durations) * F('number_of_lessons'), 2))
+
+
+def reprice_term(term):
+    """
+    Reprice every fulfilled lesson of a school that takes place during a term and rebuild their balances.
+    """
+    lessons = Lesson.objects.filter(
+        school_id=term.school_id,
+        fulfilled=True,
+        start_date__lte=term.end_date,
+        end_date__gte=term.start_date
+    )
+    with transaction.atomic():
+        repriced = reprice_lessons(lessons)
+        rebuild_balances(lessons)
+    return repriced
@@ -0,0 +1,112 @@
+"""
+Recurrence engine that will be used to calculate when the lessons of a booking take place.
+"""
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+from django.utils.timezone import make_aware
+
+from lessons.models.lesson import DAYS_OF_WEEK
+
+__all__ = ['TermIndex', 'first_lesson_date', 'occurrence_dates', 'occurrences', 'count_occurrences']
+
+WEEKDAYS = [day for day, label in DAYS_OF_WEEK]
+
+
+class TermIndex:
+    """
+    Sorted interval index over the non-overlapping terms of a school. Finding the term that contains a date is a
+    bisection over the term start dates, so each lookup is O(log n) in the number of terms.
+    """
+
+    def __init__(self, terms):
+        self.terms = sorted(terms, key=lambda term: term.start_date)
+        self._start_dates = [term.start_date for term in self.terms]
+
+    @classmethod
+    def of(cls, terms):
+        """
+        Return the given terms as an index, or None when no terms are given.
+        """
+        if terms is None or isinstance(terms, cls):
+            return terms
+        return cls(terms)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __contains__(self, date):
+        return self.term_containing(date) is not None
+
+    def term_containing(self, date):
+        position = bisect_right(self._start_dates, date) - 1
+        if position >= 0 and date <= self.terms[position].end_date:
+            return self.terms[position]
+        return None
+
+    def overlapping(self, start_date, end_date):
+        """
+        Return the terms that overlap the period between two dates, both inclusive.
+        """
+        position = max(bisect_right(self._start_dates, start_date) - 1, 0)
+        overlapping = []
+        for term in self.terms[position:]:
+            if term.start_date > end_date:
+                break
+            if term.end_date >= start_date:
+                overlapping.append(term)
+        return overlapping
+
+
+def first_lesson_date(lesson):
+    """
+    Return the first date on or after the start date of a lesson that falls on the day of the lesson.
+    """
+    days_ahead = (WEEKDAYS.index(lesson.day) - lesson.start_date.weekday()) % 7
+    return lesson.start_date + timedelta(days=days_ahead)
+
+
+def occurrence_dates(lesson, terms=None):
+    """
+    Yield the date of every occurrence of a lesson between its start and end date. When terms are given, dates that
+    fall outside of every term are skipped. A school without terms does not restrict the dates.
+    """
+    term_index = TermIndex.of(terms)
+    interval = timedelta(weeks=lesson.interval)
+    date = first_lesson_date(lesson)
+    while date <= lesson.end_date:
+        if not term_index or date in term_index:
+            yield date
+        date += interval
+
+
+def occurrences(lesson, terms=None):
+    """
+    Yield the aware start and end datetime of every occurrence of a lesson.
+    """
+    duration = timedelta(minutes=lesson.duration)
+    for date in occurrence_dates(lesson, terms):
+        start = make_aware(datetime.combine(date, lesson.time))
+        yield start, start + duration
+
+
+def count_occurrences(lesson, terms=None):
+    """
+    Return the number of occurrences of a lesson without generating them. Occurrences are counted arithmetically
+    within each term that overlaps the booking.
+    """
+    term_index = TermIndex.of(terms)
+    first_date = first_lesson_date(lesson)
+    if first_date > lesson.end_date:
+        return 0
+    step = 7 * lesson.interval
+    if not term_index:
+        return (lesson.end_date - first_date).days // step + 1
+
+    count = 0
+    for term in term_index.overlapping(first_date, lesson.end_date):
+        # occurrences are first_date + k * step, so count the values of k that land inside the term
+        first_k = -(-(max(term.start_date, first_date) - first_date).days // step)
+        last_k = (min(term.end_date, lesson.end_date) - first_date).days // step
+        count += max(last_k - first_k + 1, 0)
+    return count
@@ -0,0 +1,83 @@
+"""
+Scheduling engine that will be used to generate the scheduled lessons of a booking.
+"""
+from collections import namedtuple
+
+from django.db import transaction
+
+from lessons.models.lesson import ScheduledLesson
+from lessons.services.recurrence import occurrences
+
+__all__ = ['ScheduleChanges', 'build_schedule', 'create_schedule', 'reschedule', 'sync_schedule']
+
+ScheduleChanges = namedtuple('ScheduleChanges', ['created', 'updated', 'deleted'])
+
+
+def _scheduled_lesson(lesson, start, end):
+    return ScheduledLesson(
+        lesson=lesson,
+        school_id=lesson.school_id,
+        student_id=lesson.student_id,
+        teacher_id=lesson.teacher_id,
+        start=start,
+        end=end
+    )
+
+
+def build_schedule(lesson, terms=None):
+    """
+    Return the unsaved scheduled lessons of a lesson, computed in memory. When terms are given, only occurrences
+    that fall inside a term are scheduled.
+    """
+    return [_scheduled_lesson(lesson, start, end) for start, end in occurrences(lesson, terms)]
+
+
+def create_schedule(lesson, terms=None):
+    """
+    Save the schedule of a lesson with a single insert and return the scheduled lessons.
+    """
+    with transaction.atomic():
+        return ScheduledLesson.objects.bulk_create(build_schedule(lesson, terms))
+
+
+def reschedule(lesson, terms=None):
+    """
+    Bring the saved schedule of a lesson in line with its current day, time, duration, interval and dates. Scheduled
+    lessons that still match an occurrence are left alone, the rest are moved onto the missing occurrences, and only
+    the difference in size is inserted or deleted.
+    """
+    with transaction.atomic():
+        existing = list(ScheduledLesson.objects.select_for_update().filter(lesson=lesson).order_by('start'))
+        wanted = list(occurrences(lesson, terms))
+
+        unchanged = {(sl.start, sl.end) for sl in existing} & set(wanted)
+        stale = [sl for sl in existing if (sl.start, sl.end) not in unchanged]
+        missing = [occurrence for occurrence in wanted if occurrence not in unchanged]
+
+        moved = list(zip(stale, missing))
+        for scheduled_lesson, (start, end) in moved:
+            scheduled_lesson.start = start
+            scheduled_lesson.end = end
+        ScheduledLesson.objects.bulk_update([scheduled_lesson for scheduled_lesson, occurrence in moved],
+                                            ['start', 'end'])
+
+        created = ScheduledLesson.objects.bulk_create([
+            _scheduled_lesson(lesson, start, end) for start, end in missing[len(moved):]
+        ])
+        deleted = [sl.id for sl in stale[len(moved):]]
+        if deleted:
+            ScheduledLesson.objects.filter(id__in=deleted).delete()
+
+        return ScheduleChanges(created=len(created), updated=len(moved), deleted=len(deleted))
+
+
+def sync_schedule(lesson):
+    """
+    Copy the school, student and teacher of a lesson onto the scheduled lessons that do not match them yet with a
+    single UPDATE, and return the number of scheduled lessons changed.
+    """
+    return ScheduledLesson.objects.filter(lesson=lesson).exclude(
+        school_id=lesson.school_id,
+        student_id=lesson.student_id,
+        teacher_id=lesson.teacher_id
+    ).update(school_id=lesson.school_id, student_id=lesson.student_id, teacher_id=lesson.teacher_id)
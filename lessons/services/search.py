@@ -0,0 +1,53 @@
+"""
+Member search service that will be used to find the admissions of a school by the names of their members.
+"""
+from django.db import transaction
+from django.db.models import Count, Q
+
+from lessons.models import NameTrigram
+from lessons.models.search import TRIGRAM_LENGTH, name_trigrams, normalise_name
+
+__all__ = ['index_member_names', 'search_members']
+
+
+def index_member_names(users):
+    """
+    Replace the name trigrams of users from their first and last name search keys with a single insert.
+    """
+    with transaction.atomic():
+        NameTrigram.objects.filter(user__in=[user.pk for user in users]).delete()
+        NameTrigram.objects.bulk_create([
+            NameTrigram(user_id=user.pk, trigram=trigram)
+            for user in users
+            for trigram in name_trigrams(user.first_name_key) | name_trigrams(user.last_name_key)
+        ], batch_size=500)
+
+
+def _name_condition(field, key):
+    if not key:
+        return Q()
+    return Q(**{f'{field}__contains': key})
+
+
+def search_members(admissions, first_name='', last_name=''):
+    """
+    Filter admissions to those whose member's first and last names contain the searches, ignoring case and accents.
+    Members are narrowed down through the name trigram index before their names are compared, while searches shorter
+    than a trigram have no trigrams and are compared with the name search keys of every member of the school.
+    """
+    first_key, last_key = normalise_name(first_name), normalise_name(last_name)
+    admissions = admissions.filter(
+        _name_condition('client__first_name_key', first_key),
+        _name_condition('client__last_name_key', last_key)
+    )
+
+    trigrams = set()
+    for key in (first_key, last_key):
+        if len(key) >= TRIGRAM_LENGTH:
+            trigrams |= name_trigrams(key)
+    if trigrams:
+        candidates = NameTrigram.objects.filter(trigram__in=trigrams).values('user').annotate(
+            matched=Count('trigram')
+        ).filter(matched=len(trigrams)).values('user')
+        admissions = admissions.filter(client__in=candidates)
+    return admissions
@@ -0,0 +1,162 @@
+"""
+Seeding service that will be used to fill schools with generated members, lessons and transfers in bulk.
+"""
+import datetime
+import random
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.db import transaction
+from faker import Faker
+
+from lessons.models import Admission, Lesson, School, Term, Transfer, User
+from lessons.models.lesson import ScheduledLesson
+from lessons.services.ledger import rebuild_balances
+from lessons.services.pricing import lesson_count, lesson_price, school_prices
+from lessons.services.recurrence import TermIndex
+from lessons.services.scheduling import build_schedule
+from lessons.services.search import index_member_names
+from lessons.services.terms import invalidate_term_calendar
+
+__all__ = ['SEED_PASSWORD', 'TERM_DATES', 'seed_terms', 'seed_users', 'seed_members', 'seed_lessons', 'seed_school']
+
+SEED_PASSWORD = 'Password123'
+TERM_DATES = [
+    (datetime.date(2022, 9, 1), datetime.date(2022, 10, 21)),
+    (datetime.date(2022, 10, 31), datetime.date(2022, 12, 16)),
+    (datetime.date(2023, 1, 3), datetime.date(2023, 2, 10)),
+    (datetime.date(2023, 2, 20), datetime.date(2023, 3, 31)),
+    (datetime.date(2023, 4, 17), datetime.date(2023, 5, 26)),
+    (datetime.date(2023, 6, 5), datetime.date(2023, 7, 21)),
+]
+PAYMENT_RATIOS = [Decimal('0'), Decimal('0.5'), Decimal('1'), Decimal('2')]
+
+
+def seed_terms(school, dates=TERM_DATES):
+    """
+    Create the terms of a school with a single insert and make the first one its current term.
+    """
+    terms = Term.objects.bulk_create([
+        Term(school=school, start_date=start_date, end_date=end_date) for start_date, end_date in dates
+    ])
+    invalidate_term_calendar(school.id)
+    school.current_term = terms[0]
+    school.save()
+    return terms
+
+
+def seed_users(count, prefix, faker=None, parents=None, password_hash=None):
+    """
+    Create users with generated names and a shared password with a single insert, in the Adult-user and User groups,
+    or only the User group when they are children of the given parents. The password is hashed once, as hashing it
+    for every user would dominate the time taken.
+    """
+    faker = faker or Faker('en_GB')
+    password_hash = password_hash or make_password(SEED_PASSWORD)
+    users = [
+        User(
+            first_name=faker.first_name(),
+            last_name=faker.last_name(),
+            email=f'{prefix}.{number}@example.org',
+            password=password_hash,
+            parent=parents[number % len(parents)] if parents else None
+        ) for number in range(count)
+    ]
+    for user in users:
+        user.normalise_names()
+    users = User.objects.bulk_create(users, batch_size=500)
+    index_member_names(users)
+    groups = ['User'] if parents else ['Adult-user', 'User']
+    group_ids = [Group.objects.get_or_create(name=group)[0].id for group in groups]
+    User.groups.through.objects.bulk_create([
+        User.groups.through(user_id=user.id, group_id=group_id) for user in users for group_id in group_ids
+    ], batch_size=500)
+    return users
+
+
+def seed_members(school, users, *groups):
+    """
+    Admit users to a school in the given groups with one insert for the admissions and one for their groups.
+    """
+    admissions = Admission.objects.bulk_create(
+        [Admission(school=school, client=user) for user in users], batch_size=500
+    )
+    group_ids = [Group.objects.get_or_create(name=group)[0].id for group in groups]
+    Admission.groups.through.objects.bulk_create([
+        Admission.groups.through(admission_id=admission.id, group_id=group_id)
+        for admission in admissions for group_id in group_ids
+    ], batch_size=500)
+
+
+def seed_lessons(school, students, teachers, terms, rng=None, fulfilled_ratio=0.7):
+    """
+    Book a lesson for each student with a random teacher, fulfilling some of them for the first term, and schedule,
+    price and pay towards the fulfilled lessons in bulk.
+    """
+    rng = rng or random.Random()
+    index = TermIndex(terms)
+    prices = school_prices(school.id)
+    first_term = min(terms, key=lambda term: term.start_date)
+
+    lessons = []
+    for student in students:
+        lesson = Lesson(
+            school=school,
+            student=student,
+            teacher=rng.choice(teachers),
+            title="Piano Lesson",
+            instrument="Piano",
+            day=rng.choice(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday']),
+            time=datetime.time(rng.randint(9, 17), 0),
+            interval=1,
+            duration=rng.choice([30, 45, 60]),
+            information="I have no prior experience.",
+            fulfilled=rng.random() < fulfilled_ratio
+        )
+        if lesson.fulfilled:
+            lesson.start_date, lesson.end_date = first_term.start_date, first_term.end_date
+            lesson.number_of_lessons = lesson_count(lesson, index)
+            lesson.price = lesson_price(lesson, count=lesson.number_of_lessons, prices=prices)
+        lessons.append(lesson)
+
+    with transaction.atomic():
+        lessons = Lesson.objects.bulk_create(lessons, batch_size=500)
+        fulfilled = [lesson for lesson in lessons if lesson.fulfilled]
+        ScheduledLesson.objects.bulk_create(
+            [scheduled for lesson in fulfilled for scheduled in build_schedule(lesson, index)], batch_size=500
+        )
+        transfers = []
+        for lesson in fulfilled:
+            amount = (lesson.price * rng.choice(PAYMENT_RATIOS)).quantize(Decimal('0.01'))
+            if amount > 0:
+                transfers.append(Transfer(user=lesson.student, school=school, lesson=lesson, amount=amount))
+        Transfer.objects.bulk_create(transfers, batch_size=500)
+        rebuild_balances(Lesson.objects.filter(school=school))
+    return lessons
+
+
+def seed_school(name, director, students=100, teachers=10, children_ratio=0.6, seed=None):
+    """
+    Create a school run by a director with its terms, teachers, students and some of their children as clients, and
+    a lesson booked by every student and child. The same seed always generates the same school.
+    """
+    rng = random.Random(seed)
+    faker = Faker('en_GB')
+    faker.seed_instance(seed)
+    password_hash = make_password(SEED_PASSWORD)
+
+    school = School.objects.create(name=name, director=director, description=faker.text(max_nb_chars=1000))
+    school.set_group_director(director)
+    terms = seed_terms(school)
+    prefix = f'school{school.id}'
+
+    teacher_users = seed_users(teachers, f'{prefix}.teacher', faker, password_hash=password_hash)
+    seed_members(school, teacher_users, 'Teacher')
+    student_users = seed_users(students, f'{prefix}.student', faker, password_hash=password_hash)
+    child_users = seed_users(
+        int(students * children_ratio), f'{prefix}.child', faker, parents=student_users, password_hash=password_hash
+    )
+    seed_members(school, student_users + child_users, 'Client')
+    seed_lessons(school, student_users + child_users, teacher_users, terms, rng)
+    return school
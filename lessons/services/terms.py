@@ -0,0 +1,150 @@
+"""
+Term calendar service that will be used to find the current, next and containing terms of a school.
+"""
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.utils import timezone
+
+from lessons.models import School, Term
+from lessons.services.recurrence import TermIndex
+
+__all__ = ['TermCalendar', 'term_calendar', 'current_term', 'roll_current_terms', 'invalidate_term_calendar']
+
+
+class TermCalendar(TermIndex):
+    """
+    Sorted index over the terms of a school that answers which term is current, which comes next and which contains
+    a date by bisection, without querying the database.
+    """
+
+    def __init__(self, terms):
+        super().__init__(terms)
+        self._end_dates = [term.end_date for term in self.terms]
+        self._terms_by_id = {term.id: term for term in self.terms}
+
+    def get(self, term_id):
+        return self._terms_by_id.get(term_id)
+
+    def current_term(self, date):
+        """
+        Return the term that has not ended by a date, which is the term containing the date or the first term after
+        it during a holiday, or None when every term has ended.
+        """
+        position = bisect_left(self._end_dates, date)
+        if position < len(self.terms):
+            return self.terms[position]
+        return None
+
+    def next_term(self, term):
+        """
+        Return the term that starts after a term, or None when it is the last term.
+        """
+        position = bisect_right(self._start_dates, term.start_date)
+        if position < len(self.terms):
+            return self.terms[position]
+        return None
+
+
+"""
+Shared term calendar cache
+
+The terms of each school are shared between requests through the cache named by the TERM_CALENDAR_CACHE_ALIAS
+setting, or not at all when it is None. Entries are removed by the signal handlers in lessons.signals whenever a term
+is saved or deleted.
+"""
+
+
+def _term_calendar_cache():
+    alias = getattr(settings, 'TERM_CALENDAR_CACHE_ALIAS', None)
+    if alias is None:
+        return None
+    return caches[alias]
+
+
+def term_calendar_cache_key(school_id):
+    return f"lessons:terms:{school_id}"
+
+
+def _share_terms(school_id, terms):
+    cache = _term_calendar_cache()
+    # terms read inside a transaction may still be rolled back, so they are never shared with other requests
+    if cache is None or connection.in_atomic_block:
+        return
+    cache.set(term_calendar_cache_key(school_id), terms, getattr(settings, 'TERM_CALENDAR_CACHE_TIMEOUT', 3600))
+
+
+def _load_terms(school_id):
+    cache = _term_calendar_cache()
+    terms = None if cache is None else cache.get(term_calendar_cache_key(school_id))
+    if terms is None:
+        terms = list(Term.objects.filter(school_id=school_id))
+        _share_terms(school_id, terms)
+    return terms
+
+
+def term_calendar(school):
+    """
+    Return the term calendar of a school, preferring the copy kept on the school instance and then the shared cache
+    over the database.
+    """
+    calendar = getattr(school, '_term_calendar', None)
+    if calendar is None:
+        calendar = TermCalendar(_load_terms(school.pk))
+        school._term_calendar = calendar
+    return calendar
+
+
+def current_term(school, today=None):
+    """
+    Return the current term of a school, which is its saved current term until that is over and then its term that
+    has not ended yet, or None when every term has ended. Nothing is saved, as the saved current terms of schools
+    are moved on by roll_current_terms.
+    """
+    today = today or timezone.localdate()
+    calendar = term_calendar(school)
+    if school.current_term_id is not None:
+        term = calendar.get(school.current_term_id) or school.current_term
+        if term.end_date >= today:
+            return term
+    return calendar.current_term(today)
+
+
+def roll_current_terms(schools, today=None):
+    """
+    Move every school of a queryset whose current term is over, or that has no current term, on to its term that has
+    not ended yet, as current_term finds it. When every term of a school has ended its last current term is kept, so
+    that terms added later become current. The terms of every school are read with a single query and the moved
+    schools are saved with a bulk update, which are returned.
+    """
+    today = today or timezone.localdate()
+    terms = defaultdict(list)
+    for term in Term.objects.filter(school__in=schools.values('pk')):
+        terms[term.school_id].append(term)
+
+    moved = []
+    for school in schools.only('id', 'current_term'):
+        calendar = TermCalendar(terms[school.pk])
+        term = calendar.get(school.current_term_id)
+        if term is not None and term.end_date >= today:
+            continue
+        term = calendar.current_term(today)
+        if term is not None and term.pk != school.current_term_id:
+            school.current_term = term
+            moved.append(school)
+    School.objects.bulk_update(moved, ['current_term'], batch_size=500)
+    return moved
+
+
+def invalidate_term_calendar(school_id):
+    cache = _term_calendar_cache()
+    if cache is None:
+        return
+    key = term_calendar_cache_key(school_id)
+    cache.delete(key)
+    # another request may cache the old committed terms before this transaction commits
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: cache.delete(key))
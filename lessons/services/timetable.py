@@ -0,0 +1,51 @@
+"""
+Timetable service that will be used to list the scheduled lessons of students, households and teachers.
+"""
+import datetime
+
+from django.db.models import Q
+from django.utils.timezone import make_aware
+
+from lessons.models import User
+from lessons.models.lesson import ScheduledLesson
+
+__all__ = ['scheduled_lessons', 'household_timetable', 'children_timetable', 'teacher_timetable']
+
+
+def scheduled_lessons(school, term=None):
+    """
+    Return the scheduled lessons of a school in start order, with the lesson, teacher and student of each of them
+    loaded. When a term is given, only lessons that start during the term are included.
+    """
+    schedule = ScheduledLesson.objects.filter(
+        school=school
+    ).select_related('lesson', 'teacher', 'student').order_by('start')
+    if term is not None:
+        day_after_term = term.end_date + datetime.timedelta(days=1)
+        schedule = schedule.filter(
+            start__gte=make_aware(datetime.datetime.combine(term.start_date, datetime.time.min)),
+            start__lt=make_aware(datetime.datetime.combine(day_after_term, datetime.time.min))
+        )
+    return schedule
+
+
+def household_timetable(school, user, term=None):
+    """
+    Return the scheduled lessons of a user and of their children with a single query.
+    """
+    household = User.objects.filter(Q(pk=user.pk) | Q(parent=user)).values('id')
+    return scheduled_lessons(school, term).filter(student__in=household)
+
+
+def children_timetable(school, user, term=None):
+    """
+    Return the scheduled lessons of the children of a user with a single query.
+    """
+    return scheduled_lessons(school, term).filter(student__in=User.objects.filter(parent=user).values('id'))
+
+
+def teacher_timetable(school, teacher, term=None):
+    """
+    Return the scheduled lessons taught by a teacher with a single query.
+    """
+    return scheduled_lessons(school, term).filter(teacher=teacher)
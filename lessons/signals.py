@@ -0,0 +1,115 @@
+"""
+Signal handlers that will be used in the music school management system.
+"""
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from lessons.models import Lesson, LessonBalance, School, Term, Transfer, User
+from lessons.services.ledger import refresh_lesson_balance, remove_lesson_balance
+from lessons.services.scheduling import sync_schedule
+from lessons.services.search import index_member_names
+from lessons.services.terms import invalidate_term_calendar, roll_current_terms
+
+
+@receiver(post_save, sender=Lesson)
+def refresh_lesson_ledger(sender, instance, raw=False, **kwargs):
+    """
+    Update the balance of a lesson whenever it is saved, as its price, student or fulfilment may have changed.
+    """
+    if raw:
+        return
+    refresh_lesson_balance(instance.pk)
+
+
+@receiver(post_save, sender=Lesson)
+def sync_lesson_schedule(sender, instance, raw=False, created=False, **kwargs):
+    """
+    Keep the school, student and teacher copied onto the scheduled lessons of a lesson in line with it whenever it is
+    saved.
+    """
+    if raw or created:
+        return
+    sync_schedule(instance)
+
+
+@receiver(post_save, sender=Transfer)
+def refresh_transfer_ledger(sender, instance, raw=False, **kwargs):
+    """
+    Update the balance of the lesson a transfer was paid towards whenever it is saved.
+    """
+    if raw:
+        return
+    refresh_lesson_balance(instance.lesson_id)
+
+
+@receiver(post_delete, sender=Transfer)
+def refresh_deleted_transfer_ledger(sender, instance, origin=None, **kwargs):
+    """
+    Update the balance of the lesson a transfer was paid towards when the transfer is deleted. Transfers deleted
+    along with their lesson or school leave the lesson balance to be removed with it, while those deleted along with
+    anything else, such as the user who paid them, are taken off the balance once the deletion is over.
+    """
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin_model is Transfer:
+        refresh_lesson_balance(instance.lesson_id)
+    elif origin_model not in (Lesson, School):
+        # the same cascade may still delete the lesson, as when its student is deleted, which leaves nothing to refresh
+        lesson_id = instance.lesson_id
+        transaction.on_commit(lambda: refresh_lesson_balance(lesson_id))
+
+
+@receiver(post_delete, sender=LessonBalance)
+def remove_lesson_ledger(sender, instance, **kwargs):
+    """
+    Remove the totals of a deleted lesson balance from the balance of its student.
+    """
+    remove_lesson_balance(instance)
+
+
+@receiver(post_save, sender=User)
+def index_user_names(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Update the name trigrams of a user whenever their names may have changed. Users loaded from fixtures are saved
+    without their search keys, which are filled in first.
+    """
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+    if raw:
+        instance.normalise_names()
+        User.objects.filter(pk=instance.pk).update(
+            first_name_key=instance.first_name_key,
+            last_name_key=instance.last_name_key
+        )
+    index_member_names([instance])
+
+
+@receiver(post_save, sender=School)
+def index_loaded_school_name(sender, instance, raw=False, **kwargs):
+    """
+    Fill in the name search key of schools loaded from fixtures, which are saved without it.
+    """
+    if raw:
+        instance.normalise_name()
+        School.objects.filter(pk=instance.pk).update(name_key=instance.name_key)
+
+
+@receiver(post_save, sender=Term)
+@receiver(post_delete, sender=Term)
+def invalidate_school_term_calendar(sender, instance, **kwargs):
+    """
+    Remove the cached term calendar of a school whenever one of its terms is saved or deleted.
+    """
+    invalidate_term_calendar(instance.school_id)
+
+
+@receiver(post_save, sender=Term)
+def roll_school_current_term(sender, instance, raw=False, **kwargs):
+    """
+    Move the current term of a school on whenever one of its terms is saved, as the school may have no current term
+    or a term may now have been added after its current term ended.
+    """
+    if raw:
+        return
+    roll_current_terms(School.objects.filter(pk=instance.school_id))
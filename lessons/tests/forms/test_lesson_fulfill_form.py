@@ -39,7 +39,7 @@ class LessonFulfillFormTestCase(TestCase):
         }
 
     def test_form_contains_required_fields(self):
-        form = LessonFulfillForm(data=self.form_input, initial=self.form_input)
+        form = LessonFulfillForm(data=self.form_input, initial=self.form_input, school=self.school)
         self.assertIn('day', form.fields)
         self.assertIn('time', form.fields)
         self.assertIn('interval', form.fields)
@@ -50,7 +50,7 @@ class LessonFulfillFormTestCase(TestCase):
         self.assertTrue(isinstance(day_field, forms.ChoiceField))
 
     def test_form_saves_correctly(self):
-        form = LessonFulfillForm(data=self.form_input, initial=self.form_input)
+        form = LessonFulfillForm(data=self.form_input, initial=self.form_input, school=self.school)
         lesson_count_before = Lesson.objects.count()
         lesson = form.save(commit=False)
         lesson.student = self.user
@@ -70,15 +70,15 @@ class LessonFulfillFormTestCase(TestCase):
 
     def test_form_uses_day_validation(self):
         self.form_input['day'] = 'Wrong_Day'
-        form = LessonFulfillForm(data=self.form_input, initial=self.form_input)
+        form = LessonFulfillForm(data=self.form_input, initial=self.form_input, school=self.school)
         self.assertFalse(form.is_valid())
 
     def test_form_uses_interval_validation(self):
         self.form_input['interval'] = -1
-        form = LessonFulfillForm(data=self.form_input, initial=self.form_input)
+        form = LessonFulfillForm(data=self.form_input, initial=self.form_input, school=self.school)
         self.assertFalse(form.is_valid())
 
     def test_form_uses_duration_validation(self):
         self.form_input['duration'] = -1.5
-        form = LessonFulfillForm(data=self.form_input, initial=self.form_input)
+        form = LessonFulfillForm(data=self.form_input, initial=self.form_input, school=self.school)
         self.assertFalse(form.is_valid())
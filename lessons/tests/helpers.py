@@ -1,3 +1,5 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 def reverse_with_next(url_name, next_url):
@@ -7,4 +9,22 @@ def reverse_with_next(url_name, next_url):
 
 class LoginTester:
     def _is_logged_in(self):
-        return '_auth_user_id' in self.client.session.keys() 
\ No newline at end of file
+        return '_auth_user_id' in self.client.session.keys()
+
+
+class QueryCountTester:
+    def assertQueriesDoNotGrow(self, url, add_rows, counts=(1, 5)):
+        """
+        Request a url after growing the rows it lists to each count with add_rows(n), and assert the number of
+        queries stays the same.
+        """
+        queries = []
+        added = 0
+        for count in counts:
+            add_rows(count - added)
+            added = count
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            queries.append(len(context))
+        self.assertEqual(len(set(queries)), 1, f"Queries grew with the number of rows: {queries}")
@@ -0,0 +1,67 @@
+"""
+Tests that will be used to test the benchmark command.
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.db.models import Q
+from django.test import TestCase
+
+from lessons.models import School, User
+from lessons.models.lesson import ScheduledLesson
+
+
+class BenchmarkCommandTestCase(TestCase):
+    """
+    Unit tests that will be used to test the benchmark command.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.output = os.path.join(directory.name, 'benchmark.json')
+
+    def test_benchmark_saves_results(self):
+        out = StringIO()
+        call_command(
+            'benchmark', '--students', '5', '--teachers', '2', '--requests', '2', '--warmup', '0',
+            '--output', self.output, stdout=out
+        )
+        with open(self.output) as output:
+            report = json.load(output)
+        self.assertEqual(report['students'], 5)
+        self.assertEqual(
+            set(report['endpoints']),
+            {'login', 'home', 'bookings', 'timetable', 'transfers', 'members', 'fulfil'}
+        )
+        for result in report['endpoints'].values():
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+            self.assertGreater(result['queries'], 0)
+            self.assertGreater(result['rows'], 0)
+        self.assertIn("Saved the results", out.getvalue())
+
+    def test_benchmark_timetable_has_lessons(self):
+        call_command(
+            'benchmark', '--students', '5', '--teachers', '2', '--requests', '2', '--warmup', '0',
+            '--output', self.output, '--keep', stdout=StringIO()
+        )
+        with open(self.output) as output:
+            timetable = json.load(output)['endpoints']['timetable']
+        client = User.objects.get(email=timetable['user'])
+        self.assertTrue(client.email.startswith('school'))
+        self.assertTrue(ScheduledLesson.objects.filter(Q(student=client) | Q(student__parent=client)).exists())
+
+    def test_benchmark_removes_seeded_school(self):
+        call_command(
+            'benchmark', '--students', '5', '--teachers', '2', '--requests', '2', '--warmup', '0',
+            '--output', self.output, stdout=StringIO()
+        )
+        self.assertFalse(School.objects.filter(name='Benchmark School').exists())
+        self.assertFalse(User.objects.filter(email__endswith='@example.org').exists())
+
+    def test_benchmark_needs_two_requests(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark', '--requests', '1', '--output', self.output, stdout=StringIO())
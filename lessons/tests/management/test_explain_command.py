@@ -0,0 +1,34 @@
+"""
+Tests that will be used to test the explain command.
+"""
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from lessons.management.commands.explain import full_scans
+from lessons.models import School, User
+
+
+class ExplainCommandTestCase(TestCase):
+    """
+    Unit tests that will be used to test the explain command.
+    """
+
+    def test_full_scans(self):
+        self.assertEqual(
+            full_scans('SELECT * FROM lessons_lesson WHERE title = %s', ['Music Lesson']),
+            ['SCAN lessons_lesson']
+        )
+        self.assertEqual(full_scans('SELECT * FROM lessons_lesson WHERE school_id = %s', [1]), [])
+
+    def test_explain_finds_no_full_scans(self):
+        out = StringIO()
+        call_command('explain', '--students', '5', '--teachers', '2', stdout=out)
+        self.assertIn("Explained members.", out.getvalue())
+        self.assertIn("No query scans a whole table.", out.getvalue())
+
+    def test_explain_removes_seeded_school(self):
+        call_command('explain', '--students', '5', '--teachers', '2', stdout=StringIO())
+        self.assertFalse(School.objects.filter(name='Explain School').exists())
+        self.assertFalse(User.objects.filter(email__endswith='@example.org').exists())
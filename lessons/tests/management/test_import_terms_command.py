@@ -0,0 +1,81 @@
+"""
+Tests that will be used to test the import_terms command.
+"""
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from lessons.models import School, Term, User
+
+
+class ImportTermsCommandTestCase(TestCase):
+    """
+    Unit tests that will be used to test the import_terms command.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.other_school = School.objects.create(
+            director=User.objects.get(email='foo@kangaroo.com'), name='Other School', description='Test'
+        )
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as file:
+            file.write(content)
+        return path
+
+    def test_import_csv(self):
+        path = self._write('terms.csv', (
+            "school,start_date,end_date\n"
+            f"1,2023-01-04,2023-03-31\n"
+            f"{self.other_school.id},2023-01-04,2023-03-31\n"
+            f"{self.other_school.id},2023-04-17,2023-07-21\n"
+        ))
+        out = StringIO()
+        call_command('import_terms', path, stdout=out)
+        self.assertEqual(Term.objects.count(), 3)
+        self.assertIn("Imported 3 terms into 2 schools.", out.getvalue())
+
+    def test_import_json_into_school(self):
+        path = self._write('terms.json', json.dumps([
+            {'start_date': '2023-01-04', 'end_date': '2023-03-31'},
+            {'start_date': '2023-04-17', 'end_date': '2023-07-21'},
+        ]))
+        call_command('import_terms', path, '--school', str(self.other_school.id), stdout=StringIO())
+        self.assertEqual(Term.objects.filter(school=self.other_school).count(), 2)
+
+    def test_check_saves_nothing(self):
+        path = self._write('terms.txt', "school,start_date,end_date\n1,2023-01-04,2023-03-31\n")
+        out = StringIO()
+        call_command('import_terms', path, '--format', 'csv', '--check', stdout=out)
+        self.assertFalse(Term.objects.exists())
+        self.assertIn("All 1 terms can be imported.", out.getvalue())
+
+    def test_import_reports_every_problem(self):
+        path = self._write('terms.csv', (
+            "school,start_date,end_date\n"
+            "1,2023-01-04,2023-03-31\n"
+            "1,2023-03-01,2023-05-26\n"
+            "999,2023-01-04,2023-03-31\n"
+        ))
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('import_terms', path, stdout=out)
+        self.assertIn("Row 2: the term overlaps the term of row 1.", out.getvalue())
+        self.assertIn("Row 3: school 999 does not exist.", out.getvalue())
+        self.assertFalse(Term.objects.exists())
+
+    def test_import_rejects_missing_file(self):
+        with self.assertRaises(CommandError):
+            call_command('import_terms', os.path.join(self.directory, 'missing.csv'), stdout=StringIO())
@@ -0,0 +1,52 @@
+"""
+Tests that will be used to test the import_transfers command.
+"""
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from lessons.models import Transfer
+
+
+class ImportTransfersCommandTestCase(TestCase):
+    """
+    Unit tests that will be used to test the import_transfers command.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/alternative_lesson.json'
+    ]
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'statement.csv')
+        with open(self.path, 'w') as file:
+            file.write("reference,amount\n1-1,20.00\n2-3,15.50\n1-3,5.00\n")
+
+    def test_import_statement(self):
+        out = StringIO()
+        call_command('import_transfers', self.path, school=1, stdout=out)
+        self.assertEqual(Transfer.objects.count(), 2)
+        self.assertIn("Line 3: This student has not booked this lesson.", out.getvalue())
+        self.assertIn("2 transfers imported, 1 lines rejected.", out.getvalue())
+
+    def test_check_saves_nothing(self):
+        out = StringIO()
+        call_command('import_transfers', self.path, school=1, check=True, stdout=out)
+        self.assertFalse(Transfer.objects.exists())
+        self.assertIn("2 transfers can be imported, 1 lines rejected.", out.getvalue())
+
+    def test_unknown_school(self):
+        with self.assertRaises(CommandError):
+            call_command('import_transfers', self.path, school=99, stdout=StringIO())
+
+    def test_missing_file(self):
+        with self.assertRaises(CommandError):
+            call_command('import_transfers', self.path + '.missing', school=1, stdout=StringIO())
@@ -0,0 +1,54 @@
+"""
+Tests that will be used to test the rebuild_ledger command.
+"""
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from lessons.models import Lesson, School, User, LessonBalance, StudentBalance
+
+
+class RebuildLedgerCommandTestCase(TestCase):
+    """
+    Unit tests that will be used to test the rebuild_ledger command.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.teacher = User.objects.get(email='foo@kangaroo.com')
+        self.student = User.objects.get(email='doe@kangaroo.com')
+        self.lesson = Lesson.objects.create(
+            school=self.school, student=self.student, teacher=self.teacher, price=Decimal('40.00'), fulfilled=True
+        )
+
+    def test_check_passes_when_ledger_matches(self):
+        out = StringIO()
+        call_command('rebuild_ledger', '--check', stdout=out)
+        self.assertIn("Every balance matches", out.getvalue())
+
+    def test_check_fails_when_ledger_differs(self):
+        Lesson.objects.update(price=Decimal('10.00'))
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command('rebuild_ledger', '--check', stdout=out)
+        self.assertIn(f"Lesson {self.lesson.id} has invoiced 40.00", out.getvalue())
+        self.assertEqual(LessonBalance.objects.get(lesson=self.lesson).invoiced, Decimal('40.00'))
+
+    def test_rebuild_repairs_ledger(self):
+        Lesson.objects.update(price=Decimal('10.00'))
+        out = StringIO()
+        call_command('rebuild_ledger', '--school', str(self.school.id), '--chunk-size', '1', stdout=out)
+        self.assertIn("Rebuilt the balances of 1 lessons", out.getvalue())
+        self.assertEqual(LessonBalance.objects.get(lesson=self.lesson).invoiced, Decimal('10.00'))
+        self.assertEqual(StudentBalance.objects.get(student=self.student).outstanding, Decimal('10.00'))
+
+    def test_unknown_school(self):
+        with self.assertRaises(CommandError):
+            call_command('rebuild_ledger', '--school', '999', stdout=StringIO())
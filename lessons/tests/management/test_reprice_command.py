@@ -0,0 +1,108 @@
+"""
+Tests that will be used to test the reprice command.
+"""
+import datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from lessons.models import Lesson, School, Term, User, LessonPrice
+from lessons.models.lesson import ScheduledLesson
+from lessons.services import create_schedule
+
+
+class RepriceCommandTestCase(TestCase):
+    """
+    Unit tests that will be used to test the reprice command.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.term = Term.objects.create(
+            school=self.school,
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2022, 10, 21)
+        )
+        self.other_term = Term.objects.create(
+            school=self.school,
+            start_date=datetime.date(2022, 10, 31),
+            end_date=datetime.date(2022, 12, 16)
+        )
+        self.lessons = [self._create_lesson(self.term, duration) for duration in [30, 45, 60]]
+        self.other_lesson = self._create_lesson(self.other_term, 30)
+        LessonPrice.objects.create(school=self.school, duration=30, price=Decimal('7.00'))
+
+    def _create_lesson(self, term, duration):
+        lesson = Lesson.objects.create(
+            school=self.school,
+            student=self.user,
+            teacher=self.user,
+            fulfilled=True,
+            day='Monday',
+            time=datetime.time(13, 0),
+            duration=duration,
+            start_date=term.start_date,
+            end_date=term.end_date,
+            price=Decimal('10.00')
+        )
+        create_schedule(lesson)
+        lesson.number_of_lessons = ScheduledLesson.objects.filter(lesson=lesson).count()
+        lesson.save(update_fields=['number_of_lessons'])
+        return lesson
+
+    def _call_command(self, *args, **kwargs):
+        out = StringIO()
+        call_command('reprice', *args, stdout=out, **kwargs)
+        return out.getvalue()
+
+    def test_reprice_school(self):
+        output = self._call_command(self.school.id)
+        self.assertIn("Repriced 4 lessons", output)
+        prices = [Lesson.objects.get(id=lesson.id).price for lesson in self.lessons]
+        self.assertEqual(prices, [Decimal('49.00'), Decimal('52.50'), Decimal('70.00')])
+        self.assertEqual(Lesson.objects.get(id=self.other_lesson.id).price, Decimal('49.00'))
+
+    def test_reprice_term(self):
+        self._call_command(self.school.id, term=self.other_term.id)
+        self.assertEqual(Lesson.objects.get(id=self.lessons[0].id).price, Decimal('10.00'))
+        self.assertEqual(Lesson.objects.get(id=self.other_lesson.id).price, Decimal('49.00'))
+
+    def test_reprice_ignores_unfulfilled_lessons(self):
+        Lesson.objects.filter(id=self.other_lesson.id).update(fulfilled=False)
+        self._call_command(self.school.id)
+        self.assertEqual(Lesson.objects.get(id=self.other_lesson.id).price, Decimal('10.00'))
+
+    def test_reprice_keeps_stored_number_of_lessons(self):
+        Lesson.objects.filter(id=self.other_lesson.id).update(number_of_lessons=2)
+        self._call_command(self.school.id)
+        other_lesson = Lesson.objects.get(id=self.other_lesson.id)
+        self.assertEqual(other_lesson.number_of_lessons, 2)
+        self.assertEqual(other_lesson.price, Decimal('14.00'))
+
+    def test_reprice_and_reschedule_recounts_lessons(self):
+        Lesson.objects.filter(id=self.other_lesson.id).update(number_of_lessons=2)
+        self._call_command(self.school.id, reschedule=True, chunk_size=2)
+        other_lesson = Lesson.objects.get(id=self.other_lesson.id)
+        self.assertEqual(other_lesson.number_of_lessons, 7)
+        self.assertEqual(other_lesson.price, Decimal('49.00'))
+
+    def test_reprice_and_reschedule(self):
+        Lesson.objects.filter(id=self.other_lesson.id).update(day='Tuesday')
+        self._call_command(self.school.id, reschedule=True)
+        starts = ScheduledLesson.objects.filter(lesson=self.other_lesson).values_list('start', flat=True)
+        self.assertTrue(all(start.strftime('%A') == 'Tuesday' for start in starts))
+
+    def test_reprice_unknown_school(self):
+        with self.assertRaises(CommandError):
+            self._call_command(0)
+
+    def test_reprice_term_of_other_school(self):
+        with self.assertRaises(CommandError):
+            self._call_command(self.school.id, term=0)
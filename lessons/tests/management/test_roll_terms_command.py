@@ -0,0 +1,88 @@
+"""
+Tests that will be used to test the roll_terms command.
+"""
+import datetime
+from io import StringIO
+
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+
+from lessons.models import School, Term, User
+
+
+class RollTermsCommandTestCase(TestCase):
+    """
+    Unit tests that will be used to test the roll_terms command.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.other_school = School.objects.create(
+            director=User.objects.get(email='foo@kangaroo.com'), name='Other School', description='Test'
+        )
+        self.autumn, self.spring = self._create_terms(self.school)
+        self.other_autumn, self.other_spring = self._create_terms(self.other_school)
+
+    def _create_terms(self, school):
+        terms = [
+            Term.objects.create(school=school, start_date=start_date, end_date=end_date)
+            for start_date, end_date in [
+                (datetime.date(2022, 9, 1), datetime.date(2022, 12, 16)),
+                (datetime.date(2023, 1, 4), datetime.date(2023, 3, 31)),
+            ]
+        ]
+        school.current_term = terms[0]
+        school.save()
+        return terms
+
+    def test_roll_terms_moves_schools_on(self):
+        out = StringIO()
+        call_command('roll_terms', '--date', '2022-12-20', stdout=out)
+        self.assertEqual(School.objects.get(id=1).current_term, self.spring)
+        self.assertEqual(School.objects.get(id=self.other_school.id).current_term, self.other_spring)
+        self.assertIn("Rolled the current term of 2 schools forward.", out.getvalue())
+
+    def test_roll_terms_leaves_current_terms(self):
+        out = StringIO()
+        call_command('roll_terms', '--date', '2022-12-16', stdout=out)
+        self.assertEqual(School.objects.get(id=1).current_term, self.autumn)
+        self.assertIn("Rolled the current term of 0 schools forward.", out.getvalue())
+
+    def test_roll_terms_past_last_term_keeps_current_term(self):
+        out = StringIO()
+        call_command('roll_terms', '--date', '2023-04-01', '--school', '1', stdout=out)
+        self.assertEqual(School.objects.get(id=1).current_term, self.autumn)
+        self.assertIn("Rolled the current term of 0 schools forward.", out.getvalue())
+
+    def test_roll_terms_gives_schools_without_current_term_one(self):
+        School.objects.filter(pk=self.other_school.pk).update(current_term=None)
+        out = StringIO()
+        call_command('roll_terms', '--date', '2022-10-01', stdout=out)
+        self.assertEqual(School.objects.get(id=1).current_term, self.autumn)
+        self.assertEqual(School.objects.get(id=self.other_school.id).current_term, self.other_autumn)
+        self.assertIn("Rolled the current term of 1 schools forward.", out.getvalue())
+
+    def test_roll_terms_moves_on_to_term_added_after_last_ended(self):
+        call_command('roll_terms', '--date', '2023-04-01', '--school', '1', stdout=StringIO())
+        summer = Term.objects.create(
+            school=self.school, start_date=datetime.date(2023, 4, 17), end_date=datetime.date(2023, 7, 21)
+        )
+        call_command('roll_terms', '--date', '2023-04-01', '--school', '1', stdout=StringIO())
+        self.assertEqual(School.objects.get(id=1).current_term, summer)
+
+    def test_roll_terms_queries_do_not_grow_with_schools(self):
+        with self.assertNumQueries(3):
+            call_command('roll_terms', '--date', '2022-12-20', stdout=StringIO())
+
+    def test_roll_terms_rejects_invalid_date(self):
+        with self.assertRaises(CommandError):
+            call_command('roll_terms', '--date', '20/12/2022', stdout=StringIO())
+
+    def test_roll_terms_rejects_unknown_school(self):
+        with self.assertRaises(CommandError):
+            call_command('roll_terms', '--school', '999', stdout=StringIO())
+
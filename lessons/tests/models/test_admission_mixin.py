@@ -147,3 +147,28 @@ class AdmissionMixinTestCase(TestCase):
         self.assertNotIn("Teacher", group_list)
         self.assertIn("Client", group_list)
         self.assertEqual(len(group_list), 1)
+
+    """
+    Test read paths
+    """
+
+    def test_getters_do_not_create_admission(self):
+        self.assertFalse(self.school.has_member(self.user))
+        self.assertFalse(self.school.get_ban(self.user))
+        self.assertFalse(self.school.is_client(self.user))
+        self.assertFalse(Admission.objects.filter(client=self.user, school=self.school).exists())
+
+    def test_getters_read_membership_in_one_query(self):
+        self.school.set_group_director(self.user)
+        with self.assertNumQueries(1):
+            self.assertTrue(self.school.is_director(self.user))
+
+    def test_leave_school_does_not_create_admission(self):
+        self.school.leave_school(self.user)
+        self.school.unban_member(self.user)
+        self.assertFalse(Admission.objects.filter(client=self.user, school=self.school).exists())
+
+    def test_ban_member_creates_admission(self):
+        self.school.ban_member(self.user)
+        self.assertTrue(self.school.get_ban(self.user))
+        self.assertFalse(self.school.has_member(self.user))
@@ -2,10 +2,12 @@
 Tests that will be used to test the Lesson model.
 """
 
+from decimal import Decimal
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
-from lessons.models import Lesson, User
+from lessons.models import Lesson, User, Transfer
 
 
 class LessonModelTestCase(TestCase):
@@ -276,3 +278,39 @@ class LessonModelTestCase(TestCase):
         self.other_lesson.price = 10.00
         self._assert_lesson_is_valid(self.lesson)
         self._assert_lesson_is_valid(self.other_lesson)
+
+    """
+    Test Payment Summary
+    """
+
+    def _pay(self, *amounts):
+        for amount in amounts:
+            Transfer.objects.create(user=self.user, school_id=1, lesson=self.lesson, amount=Decimal(amount))
+
+    def _assert_payment_status(self, status, total_paid):
+        self.assertEqual(self.lesson.payment_status, status)
+        self.assertEqual(self.lesson.total_paid, Decimal(total_paid))
+        summary = Lesson.objects.with_payment_summary().get(id=self.lesson.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(summary.payment_status, status)
+            self.assertEqual(summary.total_paid, Decimal(total_paid))
+
+    def test_payment_status_unpaid(self):
+        self._assert_payment_status("Unpaid", '0.00')
+
+    def test_payment_status_partially_paid(self):
+        self._pay('2.50', '3.00')
+        self._assert_payment_status("Partially Paid", '5.50')
+
+    def test_payment_status_paid(self):
+        self._pay('0.10', '0.20', '9.70')
+        self._assert_payment_status("Paid", '10.00')
+
+    def test_payment_status_overpaid(self):
+        self._pay('10.00', '0.01')
+        self._assert_payment_status("Overpaid", '10.01')
+
+    def test_payment_summary_of_many_lessons(self):
+        self._pay('10.00')
+        lessons = Lesson.objects.with_payment_summary().order_by('id')
+        self.assertEqual([lesson.payment_status for lesson in lessons], ["Paid", "Unpaid"])
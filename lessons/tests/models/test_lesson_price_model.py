@@ -0,0 +1,47 @@
+"""
+Tests that will be used to test the LessonPrice model.
+"""
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
+from django.test import TestCase
+
+from lessons.models import School, LessonPrice
+
+
+class LessonPriceModelTestCase(TestCase):
+    """
+    Unit tests that will be used to test the LessonPrice model.
+    """
+
+    fixtures = ['lessons/tests/fixtures/default_user.json', 'lessons/tests/fixtures/default_school.json']
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.lesson_price = LessonPrice.objects.create(school=self.school, duration=30, price=Decimal('6.00'))
+
+    def _assert_lesson_price_is_valid(self):
+        try:
+            self.lesson_price.full_clean()
+        except ValidationError:
+            self.fail("Lesson price is not valid.")
+
+    def _assert_lesson_price_is_invalid(self):
+        with self.assertRaises(ValidationError):
+            self.lesson_price.full_clean()
+
+    def test_lesson_price_is_valid(self):
+        self._assert_lesson_price_is_valid()
+
+    def test_duration_uses_steps_of_15(self):
+        self.lesson_price.duration = 40
+        self._assert_lesson_price_is_invalid()
+
+    def test_price_cannot_be_zero(self):
+        self.lesson_price.price = Decimal('0.00')
+        self._assert_lesson_price_is_invalid()
+
+    def test_duration_is_unique_per_school(self):
+        with self.assertRaises(IntegrityError):
+            LessonPrice.objects.create(school=self.school, duration=30, price=Decimal('7.00'))
@@ -0,0 +1,73 @@
+"""
+Tests that will be used to test loading a school together with a user's membership.
+"""
+from django.contrib.auth.models import AnonymousUser
+from django.test import TestCase
+
+from lessons.models import User, School, Admission
+from lessons.models.membership import SchoolMembership
+
+
+class SchoolMembershipTestCase(TestCase):
+    """
+    Unit tests that will be used to test the school membership snapshot.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school = School.objects.get(id=1)
+
+    def test_get_with_membership_uses_one_query(self):
+        self.school.set_group_director(self.user)
+        with self.assertNumQueries(1):
+            school = School.objects.get_with_membership(self.user, id=self.school.id)
+            self.assertEqual(school, self.school)
+            self.assertTrue(school.is_director(self.user))
+            self.assertTrue(school.is_administrator(self.user))
+            self.assertFalse(school.is_client(self.user))
+            self.assertEqual(school.has_member(self.user), 3)
+            self.assertFalse(school.get_ban(self.user))
+
+    def test_get_with_membership_of_non_member(self):
+        school = School.objects.get_with_membership(self.user, id=self.school.id)
+        membership = school.get_membership(self.user)
+        self.assertEqual(membership, SchoolMembership.null())
+        self.assertFalse(membership.exists)
+        self.assertEqual(membership.group_count, 0)
+
+    def test_get_with_membership_of_banned_member(self):
+        self.school.set_group_client(self.user)
+        self.school.ban_member(self.user)
+        school = School.objects.get_with_membership(self.user, id=self.school.id)
+        self.assertTrue(school.get_ban(self.user))
+        self.assertTrue(school.is_client(self.user))
+
+    def test_get_with_membership_of_anonymous_user(self):
+        school = School.objects.get_with_membership(AnonymousUser(), id=self.school.id)
+        self.assertFalse(school.get_membership(AnonymousUser()).exists)
+
+    def test_get_with_membership_of_missing_school(self):
+        with self.assertRaises(School.DoesNotExist):
+            School.objects.get_with_membership(self.user, id=0)
+
+    def test_setters_forget_cached_membership(self):
+        school = School.objects.get_with_membership(self.user, id=self.school.id)
+        self.assertFalse(school.is_client(self.user))
+        school.set_group_client(self.user)
+        self.assertTrue(school.is_client(self.user))
+        school.ban_member(self.user)
+        self.assertTrue(school.get_ban(self.user))
+        school.leave_school(self.user)
+        self.assertFalse(school.has_member(self.user))
+
+    def test_from_admission(self):
+        self.school.set_group_teacher(self.user)
+        admission = Admission.objects.get(school=self.school, client=self.user)
+        membership = SchoolMembership.from_admission(admission)
+        self.assertEqual(membership.admission_id, admission.id)
+        self.assertTrue(membership.in_group('Teacher'))
+        self.assertFalse(membership.is_banned)
@@ -0,0 +1,112 @@
+"""
+Performance tests that will be used to check the number of queries and time taken by every school page as schools
+grow.
+"""
+import random
+from time import perf_counter
+
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lessons.models import Lesson, Term, User
+from lessons.services import SEED_PASSWORD, seed_lessons, seed_school
+from msms.urls import school_urlpatterns
+
+SCALES = [10, 100, 1000]
+MAX_QUERIES = 25
+MAX_SECONDS = 3.0
+CLIENT_PAGES = ('client_lessons', 'client_transactions', 'timetable')
+TEACHER_PAGES = ('teacher_timetable',)
+
+
+class SchoolURLPerformanceTestCase(TestCase):
+    """
+    Requests every page of school_urlpatterns for schools seeded with 10, 100 and 1000 students, and fails when the
+    number of queries of a page grows with the school or exceeds MAX_QUERIES, or a page takes longer than MAX_SECONDS.
+    Client pages are requested by a seeded parent who books more lessons the larger the school, and teacher pages by
+    the seeded teacher with the most lessons, so their lists grow with the school too.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='director@example.org',
+            first_name='Marty',
+            last_name='Major',
+            password=SEED_PASSWORD
+        )
+        cls.schools = []
+        for scale in SCALES:
+            school = seed_school(f'School of {scale}', cls.user, students=scale, seed=scale)
+            school.set_group_teacher(cls.user)
+            school.set_group_client(cls.user)
+            cls.schools.append(school)
+
+        cls.clients, cls.teachers = {}, {}
+        for scale, school in zip(SCALES, cls.schools):
+            client = User.objects.get(email=f'school{school.id}.student.0@example.org')
+            teachers = list(User.objects.filter(email__startswith=f'school{school.id}.teacher.'))
+            seed_lessons(school, [client] * (scale // 10), teachers, list(Term.objects.filter(school=school)),
+                         random.Random(scale), fulfilled_ratio=1)
+            cls.clients[school.id] = client
+            cls.teachers[school.id] = User.objects.get(pk=Lesson.objects.filter(school=school).values(
+                'teacher'
+            ).annotate(lessons=Count('id')).order_by('-lessons', 'teacher').values_list('teacher', flat=True)[0])
+
+    def _url_kwargs(self, school):
+        lessons = Lesson.objects.filter(school=school).order_by('id')
+        return {
+            'modify_lesson': lessons.filter(fulfilled=False).values_list('id', flat=True).first(),
+            'booking_invoice': lessons.filter(fulfilled=True).values_list('id', flat=True).first(),
+            'fulfill_lesson': lessons.filter(fulfilled=False).values_list('id', flat=True).first(),
+            'edit_term': Term.objects.filter(school=school).values_list('id', flat=True).first(),
+            'manage_member': lessons.values_list('student_id', flat=True).first(),
+        }
+
+    def _reverse(self, pattern, school):
+        kwargs = {'school': school.id}
+        if 'pk' in pattern.pattern.converters:
+            pk = self._url_kwargs(school).get(pattern.name)
+            self.assertIsNotNone(pk, f"No object to request {pattern.name} with, add one to _url_kwargs.")
+            kwargs['pk'] = pk
+        return reverse(pattern.name, kwargs=kwargs)
+
+    def _user(self, pattern, school):
+        if pattern.name in CLIENT_PAGES:
+            return self.clients[school.id]
+        if pattern.name in TEACHER_PAGES:
+            return self.teachers[school.id]
+        return self.user
+
+    def _measure(self, url, user):
+        self.client.force_login(user)
+        with CaptureQueriesContext(connection) as queries:
+            started = perf_counter()
+            response = self.client.get(url)
+            elapsed = perf_counter() - started
+        self.assertEqual(response.status_code, 200, f"{url} responded with {response.status_code}.")
+        return len(queries), elapsed
+
+    def test_school_urls(self):
+        for pattern in school_urlpatterns:
+            with self.subTest(url=pattern.name):
+                measurements = [
+                    self._measure(self._reverse(pattern, school), self._user(pattern, school)) for school in self.schools
+                ]
+                counts = [count for count, _ in measurements]
+                self.assertEqual(len(set(counts)), 1, f"Queries of {pattern.name} grew with the school: {counts}")
+                self.assertLessEqual(max(counts), MAX_QUERIES)
+                for scale, (_, elapsed) in zip(SCALES, measurements):
+                    self.assertLess(elapsed, MAX_SECONDS, f"{pattern.name} took {elapsed:.2f}s with {scale} students.")
+
+    def test_client_and_teacher_lists_grow_with_school(self):
+        bookings = [Lesson.objects.filter(school=school, student=self.clients[school.id]).count()
+                    for school in self.schools]
+        taught = [Lesson.objects.filter(school=school, teacher=self.teachers[school.id]).count()
+                  for school in self.schools]
+        self.assertEqual(bookings, sorted(bookings))
+        self.assertLess(bookings[0], bookings[-1])
+        self.assertLess(taught[0], taught[-1])
@@ -0,0 +1,87 @@
+"""
+Tests that will be used to test the school directory service.
+"""
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from lessons.models import School, SchoolDirectoryEntry, User
+from lessons.services import directory_query, enrolled_schools, search_schools
+
+
+class SchoolDirectoryTestCase(TestCase):
+    """
+    Unit tests that will be used to test the school directory service.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json'
+    ]
+
+    def setUp(self):
+        self.director = User.objects.get(email='foo@kangaroo.com')
+        self.user = User.objects.get(email='doe@kangaroo.com')
+        self.schools = {
+            name: School.objects.create(director=self.director, name=name, description='Test')
+            for name in ['Piano Academy', 'École de Musique', 'Musique Musique', 'Drum School']
+        }
+
+    def _search(self, search):
+        return [school.name for school in search_schools(School.objects.all(), search).order_by('rank', 'id')]
+
+    def _assert_search(self, search, names):
+        """
+        Check that a search finds the same schools through the directory and without it.
+        """
+        self.assertEqual(self._search(search), names)
+        with patch('lessons.services.directory._has_directory', return_value=False):
+            self.assertEqual(self._search(search), names)
+
+    def test_directory_query(self):
+        self.assertEqual(directory_query('  École  "Piano" de '), '"ecole" """piano"""')
+
+    def test_directory_follows_school_names(self):
+        school = self.schools['Drum School']
+        self.assertEqual(SchoolDirectoryEntry.objects.get(school=school).name_key, 'drum school')
+        school.name = 'Guitar School'
+        school.save()
+        self.assertEqual(self._search('drum'), [])
+        self.assertEqual(self._search('guitar'), ['Guitar School'])
+        school.delete()
+        self.assertEqual(self._search('guitar'), [])
+
+    def test_fixture_schools_are_indexed(self):
+        school = School.objects.get(id=1)
+        self.assertEqual(school.name_key, school.name.casefold())
+        self.assertIn(school.name, self._search(school.name))
+
+    def test_search_ignores_case_and_accents(self):
+        self._assert_search('ECOLE', ['École de Musique'])
+        self._assert_search('académy', ['Piano Academy'])
+
+    def test_search_matches_substrings(self):
+        self._assert_search('pia aca', ['Piano Academy'])
+        self._assert_search('cademy', ['Piano Academy'])
+        self._assert_search('usiq cole', ['École de Musique'])
+        self._assert_search('rum choo', ['Drum School'])
+        self._assert_search('piano drum', [])
+
+    def test_search_matches_words_shorter_than_a_trigram(self):
+        self._assert_search('de', ['Piano Academy', 'École de Musique'])
+        self._assert_search('de musi', ['École de Musique'])
+        self._assert_search('x', [])
+
+    def test_search_ranks_better_matches_first(self):
+        self._assert_search('musique', ['Musique Musique', 'École de Musique'])
+
+    def test_blank_search_matches_every_school(self):
+        self.assertEqual(search_schools(School.objects.all(), '  ').count(), School.objects.count())
+
+    def test_enrolled_schools(self):
+        piano, drums = self.schools['Piano Academy'], self.schools['Drum School']
+        piano.set_group_client(self.user)
+        piano.set_group_teacher(self.user)
+        drums.set_group_client(self.user)
+        drums.leave_school(self.user)
+        self.assertEqual(list(enrolled_schools(School.objects.all(), self.user)), [piano])
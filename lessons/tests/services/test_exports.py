@@ -0,0 +1,54 @@
+"""
+Tests that will be used to test the export service.
+"""
+import csv
+import io
+
+from django.test import TestCase
+
+from lessons.models import Lesson, Transfer, User
+from lessons.services import BOOKING_COLUMNS, TRANSFER_COLUMNS, csv_rows
+
+
+class ExportTestCase(TestCase):
+    """
+    Unit tests that will be used to test the export of querysets as CSV files.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/other_lesson.json',
+        'lessons/tests/fixtures/alternative_lesson.json',
+        'lessons/tests/fixtures/default_transfer.json'
+    ]
+
+    def _read(self, lines):
+        return list(csv.reader(io.StringIO(''.join(lines))))
+
+    def test_header_and_rows(self):
+        rows = self._read(csv_rows(Transfer.objects.order_by('id'), TRANSFER_COLUMNS))
+        self.assertEqual(rows[0], [header for header, field in TRANSFER_COLUMNS])
+        self.assertEqual(rows[1][:3], ['1', '2', '3'])
+        self.assertEqual(rows[1][-1], '100.00')
+
+    def test_bookings_include_payment_summary(self):
+        lessons = Lesson.objects.with_payment_summary().order_by('id')
+        rows = self._read(csv_rows(lessons, BOOKING_COLUMNS))
+        self.assertEqual(len(rows), 4)
+        header = rows[0]
+        self.assertEqual(rows[3][header.index('payment_state')], 'Overpaid')
+        self.assertEqual(rows[1][header.index('payment_state')], 'Unpaid')
+
+    def test_rows_are_read_lazily(self):
+        lines = csv_rows(Transfer.objects.all(), TRANSFER_COLUMNS)
+        with self.assertNumQueries(0):
+            next(lines)
+        with self.assertNumQueries(1):
+            list(lines)
+
+    def test_formulas_are_escaped(self):
+        User.objects.filter(id=2).update(first_name='=HYPERLINK("x")')
+        rows = self._read(csv_rows(Transfer.objects.all(), TRANSFER_COLUMNS))
+        self.assertEqual(rows[1][3], '\'=HYPERLINK("x")')
@@ -0,0 +1,204 @@
+"""
+Tests that will be used to test the import service.
+"""
+import datetime
+import io
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from lessons.models import School, StudentBalance, Term, Transfer, User
+from lessons.services import (
+    TermRow, import_format, import_terms, import_transfers, parse_terms, read_rows, validate_terms
+)
+
+
+class TermImportTestCase(TestCase):
+    """
+    Unit tests that will be used to test the import of terms.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.other_school = School.objects.create(
+            director=User.objects.get(email='foo@kangaroo.com'), name='Other School', description='Test'
+        )
+        self.existing = Term.objects.create(
+            school=self.school, start_date=datetime.date(2022, 9, 1), end_date=datetime.date(2022, 12, 16)
+        )
+
+    def _row(self, row, school, start_date, end_date):
+        return TermRow(row, school.id, datetime.date.fromisoformat(start_date), datetime.date.fromisoformat(end_date))
+
+    def _messages(self, terms):
+        with self.assertRaises(ValidationError) as raised:
+            validate_terms(terms)
+        return raised.exception.messages
+
+    def test_import_format(self):
+        self.assertEqual(import_format('terms.CSV'), 'csv')
+        self.assertEqual(import_format('terms.json'), 'json')
+        with self.assertRaises(ValidationError):
+            import_format('terms.xlsx')
+
+    def test_read_csv_rows(self):
+        file = io.BytesIO(b'\xef\xbb\xbfschool,start_date,end_date\n1,2023-01-04,2023-03-31\n')
+        self.assertEqual(
+            read_rows(file, 'csv'),
+            [(1, {'school': '1', 'start_date': '2023-01-04', 'end_date': '2023-03-31'})]
+        )
+
+    def test_read_json_rows(self):
+        file = io.StringIO('[{"school": 1, "start_date": "2023-01-04", "end_date": "2023-03-31"}]')
+        self.assertEqual(parse_terms(read_rows(file, 'json')), [self._row(1, self.school, '2023-01-04', '2023-03-31')])
+        with self.assertRaises(ValidationError):
+            read_rows(io.StringIO('{"school": 1}'), 'json')
+
+    def test_parse_terms_reports_every_invalid_row(self):
+        rows = [
+            (1, {'school': 'one', 'start_date': '2023-01-04', 'end_date': '2023-03-31'}),
+            (2, {'school': '1', 'start_date': '04/01/2023', 'end_date': '2023-03-31'}),
+            (3, {'school': str(2 ** 63), 'start_date': '2023-01-04', 'end_date': '2023-03-31'}),
+            (4, {'school': '0', 'start_date': '2023-01-04', 'end_date': '2023-03-31'}),
+        ]
+        with self.assertRaises(ValidationError) as raised:
+            parse_terms(rows)
+        self.assertEqual(raised.exception.messages, [
+            "Row 1: the school must be a school number.",
+            "Row 2: the start and end dates must be written as YYYY-MM-DD.",
+            "Row 3: the school must be a school number.",
+            "Row 4: the school must be a school number.",
+        ])
+
+    def test_parse_terms_into_school(self):
+        rows = [(1, {'start_date': '2023-01-04', 'end_date': '2023-03-31'})]
+        self.assertEqual(parse_terms(rows, school_id=self.school.id)[0].school_id, self.school.id)
+
+    def test_validate_terms_finds_overlaps(self):
+        messages = self._messages([
+            self._row(1, self.school, '2022-12-01', '2022-12-31'),
+            self._row(2, self.other_school, '2023-01-04', '2023-03-31'),
+            self._row(3, self.other_school, '2023-03-31', '2023-05-26'),
+        ])
+        self.assertEqual(messages, [
+            f"Row 1: the term overlaps an existing term of school {self.school.id}.",
+            "Row 3: the term overlaps the term of row 2.",
+        ])
+
+    def test_validate_terms_finds_invalid_dates_and_schools(self):
+        messages = self._messages([
+            self._row(1, self.school, '2023-03-31', '2023-01-04'),
+            TermRow(2, 999, datetime.date(2023, 1, 4), datetime.date(2023, 3, 31)),
+            TermRow(3, 2 ** 63, datetime.date(2023, 1, 4), datetime.date(2023, 3, 31)),
+        ])
+        self.assertEqual(messages, [
+            "Row 1: the end date cannot be earlier or equal to the start date.",
+            "Row 2: school 999 does not exist.",
+            f"Row 3: school {2 ** 63} does not exist.",
+        ])
+
+    def test_validate_terms_queries_do_not_grow_with_schools(self):
+        terms = [
+            self._row(number, self.other_school, f'2023-0{number}-01', f'2023-0{number}-20') for number in range(1, 9)
+        ]
+        with self.assertNumQueries(2):
+            validate_terms(terms)
+
+    def test_import_terms(self):
+        created = import_terms([
+            self._row(1, self.school, '2023-01-04', '2023-03-31'),
+            self._row(2, self.other_school, '2023-01-04', '2023-03-31'),
+            self._row(3, self.other_school, '2023-04-17', '2023-07-21'),
+        ], today=datetime.date(2023, 4, 1))
+        self.assertEqual(len(created), 3)
+        self.assertEqual(Term.objects.filter(school=self.other_school).count(), 2)
+        self.assertEqual(School.objects.get(id=self.other_school.id).current_term, created[2])
+        self.assertIsNone(School.objects.get(id=1).current_term)
+
+    def test_invalid_import_saves_nothing(self):
+        with self.assertRaises(ValidationError):
+            import_terms([
+                self._row(1, self.other_school, '2023-01-04', '2023-03-31'),
+                self._row(2, self.school, '2022-09-01', '2022-09-30'),
+            ])
+        self.assertFalse(Term.objects.filter(school=self.other_school).exists())
+
+
+class TransferImportTestCase(TestCase):
+    """
+    Unit tests that will be used to test the import of the transfers of bank statements.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/other_lesson.json',
+        'lessons/tests/fixtures/alternative_lesson.json'
+    ]
+
+    def _rows(self, *lines):
+        return [(number, {'reference': reference, 'amount': amount})
+                for number, (reference, amount) in enumerate(lines, start=1)]
+
+    def test_import_transfers(self):
+        result = import_transfers(self._rows(('1-1', '20.00'), ('2-3', '15.50'), ('2-3', '4.50')), 1)
+        self.assertEqual(len(result.transfers), 3)
+        self.assertEqual(result.rejects, [])
+        self.assertEqual(Transfer.objects.filter(lesson_id=3).count(), 2)
+        self.assertEqual(StudentBalance.objects.get(school_id=1, student_id=2).paid, Decimal('20.00'))
+
+    def test_rejected_lines(self):
+        result = import_transfers(self._rows(
+            ('1-1', '20.00'),
+            ('1/1', '20.00'),
+            ('1-1', '-5'),
+            ('1-1', '1.001'),
+            ('99-1', '20.00'),
+            ('1-99', '20.00'),
+            ('1-3', '20.00'),
+            ('1-2', '20.00'),
+        ), 1)
+        self.assertEqual(len(result.transfers), 1)
+        self.assertEqual([row for row, reason in result.rejects], [2, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(result.rejects[0][1], "The reference must be in the format XXXX-YYYY.")
+        self.assertEqual(result.rejects[1][1], "The amount must be a number of pounds and pence from 0.01.")
+        self.assertEqual(result.rejects[3][1], "This user could not be found. You should refund this transfer.")
+        self.assertEqual(result.rejects[4][1], "This lesson could not be found. You should refund this transfer.")
+        self.assertEqual(
+            result.rejects[5][1], "This student has not booked this lesson. You should refund this transfer."
+        )
+        self.assertEqual(result.rejects[6][1], "This lesson has not been fulfilled yet.")
+
+    def test_references_too_large_to_be_ids_are_rejected(self):
+        result = import_transfers(self._rows(
+            (f'{2 ** 63}-1', '20.00'),
+            (f'1-{10 ** 30}', '20.00'),
+            ('1-1', '20.00'),
+        ), 1)
+        self.assertEqual(len(result.transfers), 1)
+        self.assertEqual(result.rejects, [
+            (1, "This user could not be found. You should refund this transfer."),
+            (2, "This lesson could not be found. You should refund this transfer."),
+        ])
+
+    def test_lesson_of_other_school_is_rejected(self):
+        result = import_transfers(self._rows(('1-1', '20.00')), 2)
+        self.assertEqual(result.rejects, [(1, "This lesson is not managed by this school")])
+        self.assertFalse(Transfer.objects.exists())
+
+    def test_queries_do_not_grow_with_lines(self):
+        with CaptureQueriesContext(connection) as queries:
+            result = import_transfers(self._rows(*[('1-1', '1.00'), ('2-3', '2.00'), ('1-2', '3.00')] * 100), 1)
+        self.assertEqual(len(result.transfers), 200)
+        statements = [query['sql'] for query in queries.captured_queries]
+        self.assertEqual(len([sql for sql in statements if sql.startswith('INSERT INTO "lessons_transfer"')]), 1)
+        self.assertEqual(len([sql for sql in statements if sql.startswith('SELECT "lessons_user"')]), 1)
+        self.assertLess(len(statements), 20)
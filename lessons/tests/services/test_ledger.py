@@ -0,0 +1,139 @@
+"""
+Tests that will be used to test the ledger service.
+"""
+from decimal import Decimal
+
+from django.test import TestCase
+
+from lessons.models import Lesson, School, Transfer, User, LessonBalance, StudentBalance
+from lessons.services import ledger_differences, rebuild_balances, student_ledger_differences
+
+
+class LedgerTestCase(TestCase):
+    """
+    Unit tests that will be used to test the ledger service.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.teacher = User.objects.get(email='foo@kangaroo.com')
+        self.student = User.objects.get(email='doe@kangaroo.com')
+        self.lesson = Lesson.objects.create(
+            school=self.school, student=self.student, teacher=self.teacher, price=Decimal('40.00')
+        )
+
+    def _fulfill(self, lesson):
+        lesson.fulfilled = True
+        lesson.save()
+
+    def _pay(self, lesson, amount):
+        return Transfer.objects.create(user=lesson.student, school=lesson.school, lesson=lesson, amount=amount)
+
+    def _student_balance(self, student=None):
+        return StudentBalance.objects.get(school=self.school, student=student or self.student)
+
+    def test_unfulfilled_lesson_is_not_invoiced(self):
+        balance = LessonBalance.objects.get(lesson=self.lesson)
+        self.assertEqual(balance.invoiced, Decimal('0.00'))
+        self.assertEqual(balance.outstanding, Decimal('0.00'))
+        self.assertFalse(StudentBalance.objects.exists())
+
+    def test_fulfilled_lesson_is_invoiced(self):
+        self._fulfill(self.lesson)
+        self.assertEqual(self.lesson.balance.invoiced, Decimal('40.00'))
+        self.assertEqual(self._student_balance().outstanding, Decimal('40.00'))
+
+    def test_transfers_are_paid(self):
+        self._fulfill(self.lesson)
+        self._pay(self.lesson, Decimal('15.50'))
+        self._pay(self.lesson, Decimal('4.50'))
+        balance = self._student_balance()
+        self.assertEqual(balance.invoiced, Decimal('40.00'))
+        self.assertEqual(balance.paid, Decimal('20.00'))
+        self.assertEqual(balance.outstanding, Decimal('20.00'))
+
+    def test_deleted_transfer_is_no_longer_paid(self):
+        self._fulfill(self.lesson)
+        transfer = self._pay(self.lesson, Decimal('15.50'))
+        transfer.delete()
+        self.assertEqual(self._student_balance().paid, Decimal('0.00'))
+        self.assertEqual(LessonBalance.objects.get(lesson=self.lesson).outstanding, Decimal('40.00'))
+
+    def test_transfers_of_deleted_payer_are_no_longer_paid(self):
+        self._fulfill(self.lesson)
+        payer = User.objects.create_user(
+            email='payer@kangaroo.com', first_name='Pay', last_name='Er', password='Password123'
+        )
+        Transfer.objects.create(user=payer, school=self.school, lesson=self.lesson, amount=Decimal('15.50'))
+        self.assertEqual(self._student_balance().paid, Decimal('15.50'))
+        with self.captureOnCommitCallbacks(execute=True):
+            payer.delete()
+        self.assertEqual(self._student_balance().paid, Decimal('0.00'))
+        self.assertEqual(LessonBalance.objects.get(lesson=self.lesson).outstanding, Decimal('40.00'))
+
+    def test_deleted_student_leaves_no_lesson_balance(self):
+        self._fulfill(self.lesson)
+        self._pay(self.lesson, Decimal('15.50'))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.student.delete()
+        self.assertFalse(LessonBalance.objects.exists())
+        self.assertFalse(StudentBalance.objects.exists())
+
+    def test_repriced_lesson_updates_student_balance(self):
+        self._fulfill(self.lesson)
+        self.lesson.price = Decimal('25.25')
+        self.lesson.save()
+        self.assertEqual(self._student_balance().invoiced, Decimal('25.25'))
+
+    def test_lesson_moved_to_another_student_takes_its_totals(self):
+        self._fulfill(self.lesson)
+        self._pay(self.lesson, Decimal('10.00'))
+        self.lesson.student = self.teacher
+        self.lesson.save()
+        self.assertEqual(self._student_balance().invoiced, Decimal('0.00'))
+        self.assertEqual(self._student_balance().paid, Decimal('0.00'))
+        self.assertEqual(self._student_balance(self.teacher).outstanding, Decimal('30.00'))
+
+    def test_deleted_lesson_is_removed_from_student_balance(self):
+        self._fulfill(self.lesson)
+        self._pay(self.lesson, Decimal('10.00'))
+        self.lesson.delete()
+        balance = self._student_balance()
+        self.assertEqual(balance.invoiced, Decimal('0.00'))
+        self.assertEqual(balance.paid, Decimal('0.00'))
+
+    def test_bulk_update_is_repaired_by_rebuild(self):
+        self._fulfill(self.lesson)
+        Lesson.objects.filter(pk=self.lesson.pk).update(price=Decimal('12.00'))
+        lessons = Lesson.objects.filter(pk=self.lesson.pk)
+        self.assertEqual(len(list(ledger_differences(lessons))), 1)
+        self.assertEqual(rebuild_balances(lessons), 1)
+        self.assertEqual(list(ledger_differences(lessons)), [])
+        self.assertEqual(self._student_balance().invoiced, Decimal('12.00'))
+
+    def test_rebuild_creates_missing_balances(self):
+        self._fulfill(self.lesson)
+        LessonBalance.objects.all().delete()
+        StudentBalance.objects.all().delete()
+        rebuild_balances(Lesson.objects.all())
+        self.assertEqual(LessonBalance.objects.get(lesson=self.lesson).invoiced, Decimal('40.00'))
+        self.assertEqual(self._student_balance().outstanding, Decimal('40.00'))
+
+    def test_student_ledger_differences(self):
+        self._fulfill(self.lesson)
+        StudentBalance.objects.update(paid=Decimal('3.00'))
+        self.assertEqual(len(list(student_ledger_differences(StudentBalance.objects.all()))), 1)
+
+    def test_student_ledger_differences_only_checks_given_balances(self):
+        self._fulfill(self.lesson)
+        other_lesson = Lesson.objects.create(
+            school=self.school, student=self.teacher, teacher=self.teacher, price=Decimal('25.00'), fulfilled=True
+        )
+        StudentBalance.objects.update(paid=Decimal('3.00'))
+        balances = StudentBalance.objects.filter(student=other_lesson.student)
+        self.assertEqual([balance.student_id for balance in student_ledger_differences(balances)], [self.teacher.id])
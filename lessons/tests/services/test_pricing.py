@@ -0,0 +1,104 @@
+"""
+Tests that will be used to test the pricing service.
+"""
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+
+from lessons.models import Lesson, School, Term, LessonPrice
+from lessons.models.lesson import ScheduledLesson
+from lessons.services import create_schedule, unit_price, lesson_count, lesson_price, reprice_lessons, reprice_term
+
+
+class PricingTestCase(TestCase):
+    """
+    Unit tests that will be used to test the pricing service.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.term = Term.objects.create(
+            school=self.school,
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2022, 10, 21)
+        )
+        self.lesson = Lesson.objects.get(title='Test Lesson')
+        self.lesson.day = 'Monday'
+        self.lesson.duration = 45
+        self.lesson.start_date = datetime.date(2022, 9, 1)
+        self.lesson.end_date = datetime.date(2022, 10, 21)
+        self.lesson.save()
+
+    def test_unit_price_uses_default_hourly_rate(self):
+        self.assertEqual(unit_price(self.school.id, 30), Decimal('5.00'))
+        self.assertEqual(unit_price(self.school.id, 45), Decimal('7.50'))
+        self.assertEqual(unit_price(self.school.id, 60), Decimal('10.00'))
+
+    def test_unit_price_uses_price_table(self):
+        LessonPrice.objects.create(school=self.school, duration=45, price=Decimal('12.25'))
+        self.assertEqual(unit_price(self.school.id, 45), Decimal('12.25'))
+        self.assertEqual(unit_price(self.school.id, 30), Decimal('5.00'))
+
+    def test_lesson_count_without_dates(self):
+        self.lesson.start_date = None
+        self.assertEqual(lesson_count(self.lesson), 0)
+
+    def test_lesson_count_does_not_query(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(lesson_count(self.lesson), 7)
+
+    def test_lesson_price_is_decimal(self):
+        price = lesson_price(self.lesson)
+        self.assertIsInstance(price, Decimal)
+        self.assertEqual(price, Decimal('52.50'))
+
+    def test_lesson_price_with_count(self):
+        self.assertEqual(lesson_price(self.lesson, count=2), Decimal('15.00'))
+
+    def test_reprice_lessons_uses_one_query(self):
+        create_schedule(self.lesson)
+        self.lesson.number_of_lessons = 7
+        self.lesson.save()
+        LessonPrice.objects.create(school=self.school, duration=45, price=Decimal('8.10'))
+        # the durations being repriced and the update
+        with self.assertNumQueries(2):
+            self.assertEqual(reprice_lessons(Lesson.objects.filter(id=self.lesson.id)), 1)
+        self.lesson.refresh_from_db()
+        self.assertEqual(self.lesson.number_of_lessons, 7)
+        self.assertEqual(self.lesson.price, Decimal('56.70'))
+        self.assertEqual(self.lesson.price, lesson_price(self.lesson))
+
+    def test_reprice_lessons_keeps_number_of_lessons(self):
+        create_schedule(self.lesson)
+        self.lesson.number_of_lessons = 3
+        self.lesson.save()
+        reprice_lessons(Lesson.objects.filter(id=self.lesson.id))
+        self.lesson.refresh_from_db()
+        self.assertEqual(self.lesson.number_of_lessons, 3)
+        self.assertEqual(self.lesson.price, Decimal('22.50'))
+
+    def test_reprice_term(self):
+        create_schedule(self.lesson)
+        self.lesson.number_of_lessons = 7
+        self.lesson.save()
+        other_lesson = Lesson.objects.create(
+            school=self.school,
+            student=self.lesson.student,
+            teacher=self.lesson.teacher,
+            fulfilled=True,
+            start_date=datetime.date(2023, 1, 3),
+            end_date=datetime.date(2023, 2, 10),
+            price=Decimal('99.00')
+        )
+        self.assertEqual(reprice_term(self.term), 1)
+        self.lesson.refresh_from_db()
+        other_lesson.refresh_from_db()
+        self.assertEqual(self.lesson.price, Decimal('52.50'))
+        self.assertEqual(other_lesson.price, Decimal('99.00'))
+        self.assertEqual(ScheduledLesson.objects.filter(lesson=self.lesson).count(), 7)
@@ -0,0 +1,96 @@
+"""
+Tests that will be used to test the recurrence engine.
+"""
+import datetime
+
+from django.test import TestCase
+
+from lessons.models import Lesson, School, Term
+from lessons.services import TermIndex, first_lesson_date, occurrence_dates, count_occurrences
+
+
+class RecurrenceTestCase(TestCase):
+    """
+    Unit tests that will be used to test the recurrence engine.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.first_term = Term.objects.create(
+            school=self.school,
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2022, 10, 21)
+        )
+        self.second_term = Term.objects.create(
+            school=self.school,
+            start_date=datetime.date(2022, 10, 31),
+            end_date=datetime.date(2022, 12, 16)
+        )
+        self.terms = Term.objects.filter(school=self.school)
+        self.lesson = Lesson.objects.get(title='Test Lesson')
+        self.lesson.day = 'Monday'
+        self.lesson.interval = 1
+        self.lesson.start_date = datetime.date(2022, 9, 1)
+        self.lesson.end_date = datetime.date(2022, 12, 16)
+
+    """
+    Test term index
+    """
+
+    def test_term_containing(self):
+        term_index = TermIndex(self.terms)
+        self.assertEqual(term_index.term_containing(datetime.date(2022, 9, 1)), self.first_term)
+        self.assertEqual(term_index.term_containing(datetime.date(2022, 10, 21)), self.first_term)
+        self.assertIsNone(term_index.term_containing(datetime.date(2022, 10, 24)))
+        self.assertEqual(term_index.term_containing(datetime.date(2022, 11, 1)), self.second_term)
+        self.assertIsNone(term_index.term_containing(datetime.date(2022, 8, 31)))
+        self.assertIsNone(term_index.term_containing(datetime.date(2022, 12, 17)))
+
+    def test_term_index_sorts_terms(self):
+        term_index = TermIndex(reversed(list(self.terms)))
+        self.assertEqual(term_index.terms, [self.first_term, self.second_term])
+
+    def test_overlapping(self):
+        term_index = TermIndex(self.terms)
+        self.assertEqual(term_index.overlapping(datetime.date(2022, 10, 1), datetime.date(2022, 11, 1)),
+                         [self.first_term, self.second_term])
+        self.assertEqual(term_index.overlapping(datetime.date(2022, 10, 22), datetime.date(2022, 10, 30)), [])
+        self.assertEqual(term_index.overlapping(datetime.date(2022, 11, 1), datetime.date(2023, 1, 1)),
+                         [self.second_term])
+
+    """
+    Test occurrences
+    """
+
+    def test_first_lesson_date(self):
+        self.assertEqual(first_lesson_date(self.lesson), datetime.date(2022, 9, 5))
+
+    def test_occurrence_dates_skip_holidays(self):
+        dates = list(occurrence_dates(self.lesson, self.terms))
+        self.assertNotIn(datetime.date(2022, 10, 24), dates)
+        self.assertIn(datetime.date(2022, 10, 17), dates)
+        self.assertIn(datetime.date(2022, 10, 31), dates)
+        self.assertEqual(len(dates), 14)
+
+    def test_occurrence_dates_without_terms(self):
+        dates = list(occurrence_dates(self.lesson))
+        self.assertIn(datetime.date(2022, 10, 24), dates)
+        self.assertEqual(len(dates), 15)
+
+    def test_count_occurrences_matches_dates(self):
+        for interval in range(1, 5):
+            for day in ['Monday', 'Wednesday', 'Friday', 'Sunday']:
+                self.lesson.interval = interval
+                self.lesson.day = day
+                self.assertEqual(count_occurrences(self.lesson, self.terms),
+                                 len(list(occurrence_dates(self.lesson, self.terms))))
+                self.assertEqual(count_occurrences(self.lesson), len(list(occurrence_dates(self.lesson))))
+
+    def test_count_occurrences_after_end_date(self):
+        self.lesson.end_date = datetime.date(2022, 9, 2)
+        self.assertEqual(count_occurrences(self.lesson, self.terms), 0)
@@ -0,0 +1,146 @@
+"""
+Tests that will be used to test the scheduling engine.
+"""
+import datetime
+
+from django.test import TestCase
+
+from lessons.models import Lesson, School, Term, User
+from lessons.models.lesson import ScheduledLesson
+from lessons.services import ScheduleChanges, build_schedule, create_schedule, reschedule, sync_schedule
+
+
+class SchedulingTestCase(TestCase):
+    """
+    Unit tests that will be used to test the scheduling engine.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.lesson = Lesson.objects.get(title='Test Lesson')
+        self.lesson.day = 'Wednesday'
+        self.lesson.time = datetime.time(13, 0)
+        self.lesson.interval = 1
+        self.lesson.duration = 45
+        # a Monday to a Friday two weeks later
+        self.lesson.start_date = datetime.date(2022, 9, 5)
+        self.lesson.end_date = datetime.date(2022, 9, 23)
+
+    def test_build_schedule(self):
+        schedule = build_schedule(self.lesson)
+        self.assertEqual([sl.start.date() for sl in schedule], [
+            datetime.date(2022, 9, 7),
+            datetime.date(2022, 9, 14),
+            datetime.date(2022, 9, 21),
+        ])
+        for sl in schedule:
+            self.assertEqual(sl.start.time(), datetime.time(13, 0))
+            self.assertEqual(sl.end - sl.start, datetime.timedelta(minutes=45))
+
+    def test_build_schedule_uses_interval(self):
+        self.lesson.interval = 2
+        self.assertEqual(len(build_schedule(self.lesson)), 2)
+
+    def test_build_schedule_includes_end_date(self):
+        self.lesson.end_date = datetime.date(2022, 9, 21)
+        self.assertEqual(len(build_schedule(self.lesson)), 3)
+
+    def test_build_schedule_skips_holidays(self):
+        Term.objects.create(
+            school=School.objects.get(id=1),
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2022, 9, 9)
+        )
+        Term.objects.create(
+            school=School.objects.get(id=1),
+            start_date=datetime.date(2022, 9, 19),
+            end_date=datetime.date(2022, 9, 30)
+        )
+        schedule = build_schedule(self.lesson, Term.objects.all())
+        self.assertEqual([sl.start.date() for sl in schedule], [
+            datetime.date(2022, 9, 7),
+            datetime.date(2022, 9, 21),
+        ])
+
+    def test_create_schedule_uses_one_insert(self):
+        self.lesson.end_date = datetime.date(2023, 7, 21)
+        # a single insert wrapped in a savepoint
+        with self.assertNumQueries(3):
+            schedule = create_schedule(self.lesson)
+        self.assertEqual(len(schedule), 46)
+        self.assertEqual(ScheduledLesson.objects.filter(lesson=self.lesson).count(), 46)
+
+    """
+    Test rescheduling
+    """
+
+    def test_reschedule_without_changes(self):
+        create_schedule(self.lesson)
+        ids = set(ScheduledLesson.objects.values_list('id', flat=True))
+        changes = reschedule(self.lesson)
+        self.assertEqual(changes, ScheduleChanges(created=0, updated=0, deleted=0))
+        self.assertEqual(set(ScheduledLesson.objects.values_list('id', flat=True)), ids)
+
+    def test_reschedule_moves_existing_lessons(self):
+        create_schedule(self.lesson)
+        ids = set(ScheduledLesson.objects.values_list('id', flat=True))
+        self.lesson.day = 'Thursday'
+        self.lesson.time = datetime.time(15, 30)
+        changes = reschedule(self.lesson)
+        self.assertEqual(changes, ScheduleChanges(created=0, updated=3, deleted=0))
+        self.assertEqual(set(ScheduledLesson.objects.values_list('id', flat=True)), ids)
+        self._assert_schedule_matches(self.lesson)
+
+    def test_reschedule_inserts_missing_lessons(self):
+        create_schedule(self.lesson)
+        self.lesson.end_date = datetime.date(2022, 10, 7)
+        changes = reschedule(self.lesson)
+        self.assertEqual(changes, ScheduleChanges(created=2, updated=0, deleted=0))
+        self._assert_schedule_matches(self.lesson)
+
+    def test_reschedule_deletes_extra_lessons(self):
+        create_schedule(self.lesson)
+        self.lesson.interval = 2
+        changes = reschedule(self.lesson)
+        self.assertEqual(changes, ScheduleChanges(created=0, updated=0, deleted=1))
+        self._assert_schedule_matches(self.lesson)
+
+    def test_reschedule_uses_constant_queries(self):
+        self.lesson.end_date = datetime.date(2023, 7, 21)
+        create_schedule(self.lesson)
+        self.lesson.day = 'Friday'
+        # savepoint, select, update, release savepoint
+        with self.assertNumQueries(4):
+            changes = reschedule(self.lesson)
+        self.assertEqual(changes.updated, 46)
+        self._assert_schedule_matches(self.lesson)
+
+    def _assert_schedule_matches(self, lesson):
+        saved = list(ScheduledLesson.objects.filter(lesson=lesson).order_by('start').values_list('start', 'end'))
+        self.assertEqual(saved, [(sl.start, sl.end) for sl in build_schedule(lesson)])
+
+    def test_schedule_copies_lesson(self):
+        for sl in create_schedule(self.lesson):
+            self.assertEqual(
+                (sl.school_id, sl.student_id, sl.teacher_id),
+                (self.lesson.school_id, self.lesson.student_id, self.lesson.teacher_id)
+            )
+
+    def test_saving_lesson_syncs_schedule(self):
+        self.lesson.save()
+        create_schedule(self.lesson)
+        teacher = User.objects.create_user(
+            email='teacher@kangaroo.com',
+            first_name='New',
+            last_name='Teacher',
+            password='Password123'
+        )
+        self.lesson.teacher = teacher
+        self.lesson.save()
+        self.assertEqual(set(ScheduledLesson.objects.filter(lesson=self.lesson).values_list('teacher', flat=True)),
+                         {teacher.id})
+        self.assertEqual(sync_schedule(self.lesson), 0)
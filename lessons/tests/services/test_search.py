@@ -0,0 +1,67 @@
+"""
+Tests that will be used to test the member search service.
+"""
+from django.test import TestCase
+
+from lessons.models import Admission, NameTrigram, School, User
+from lessons.models.search import normalise_name, name_trigrams
+from lessons.services import search_members
+
+
+class MemberSearchTestCase(TestCase):
+    """
+    Unit tests that will be used to test the member search service.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.members = {
+            name: self._admit(*name.split()) for name in ['Zoë Smith', 'Ann Goldsmith', 'Jan Schmidt', 'Anna Jones']
+        }
+
+    def _admit(self, first_name, last_name):
+        user = User.objects.create_user(
+            email=f'{first_name}.{last_name}@example.org'.lower(),
+            first_name=first_name,
+            last_name=last_name,
+            password='Password123'
+        )
+        self.school.set_group_client(user)
+        return user
+
+    def _search(self, first_name='', last_name=''):
+        admissions = search_members(Admission.objects.filter(school=self.school), first_name, last_name)
+        return {f'{admission.client.first_name} {admission.client.last_name}' for admission in admissions}
+
+    def test_normalise_name(self):
+        self.assertEqual(normalise_name('  Zoë   SMITH '), 'zoe smith')
+        self.assertEqual(name_trigrams('smith'), {'smi', 'mit', 'ith'})
+
+    def test_user_names_are_indexed_on_save(self):
+        user = self.members['Zoë Smith']
+        self.assertEqual(user.first_name_key, 'zoe')
+        self.assertTrue(NameTrigram.objects.filter(user=user, trigram='smi').exists())
+        user.last_name = 'Brown'
+        user.save()
+        self.assertFalse(NameTrigram.objects.filter(user=user, trigram='smi').exists())
+        self.assertTrue(NameTrigram.objects.filter(user=user, trigram='row').exists())
+
+    def test_search_is_substring_and_ignores_case_and_accents(self):
+        self.assertEqual(self._search(last_name='SMITH'), {'Zoë Smith', 'Ann Goldsmith'})
+        self.assertEqual(self._search(first_name='zoe'), {'Zoë Smith'})
+        self.assertEqual(self._search(first_name='ann', last_name='smi'), {'Ann Goldsmith'})
+
+    def test_short_search_matches_within_names(self):
+        self.assertEqual(self._search(first_name='an'), {'Ann Goldsmith', 'Jan Schmidt', 'Anna Jones'})
+        self.assertEqual(self._search(last_name='mi'), {'Zoë Smith', 'Ann Goldsmith', 'Jan Schmidt'})
+        self.assertEqual(self._search(first_name='NN', last_name='s'), {'Ann Goldsmith', 'Anna Jones'})
+
+    def test_empty_search_matches_every_member(self):
+        self.assertEqual(len(self._search()), Admission.objects.filter(school=self.school).count())
+
+    def test_trigrams_from_both_names_must_all_match(self):
+        self.assertEqual(self._search(first_name='jan', last_name='jones'), set())
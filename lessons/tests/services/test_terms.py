@@ -0,0 +1,147 @@
+"""
+Tests that will be used to test the term calendar service.
+"""
+import datetime
+
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from lessons.models import School, Term, User
+from lessons.services import TermCalendar, current_term, roll_current_terms, term_calendar
+from lessons.services.terms import term_calendar_cache_key
+
+
+class TermCalendarTestCase(TestCase):
+    """
+    Unit tests that will be used to test the term calendar service.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.terms = [
+            Term.objects.create(school=self.school, start_date=start_date, end_date=end_date)
+            for start_date, end_date in [
+                (datetime.date(2022, 9, 1), datetime.date(2022, 10, 21)),
+                (datetime.date(2023, 1, 4), datetime.date(2023, 2, 10)),
+                (datetime.date(2022, 10, 31), datetime.date(2022, 12, 16)),
+            ]
+        ]
+        self.autumn, self.spring, self.winter = self.terms
+        self.calendar = TermCalendar(self.terms)
+        self.other_school = School.objects.create(
+            director=User.objects.get(email='foo@kangaroo.com'), name='Other School', description='Test'
+        )
+
+    def test_current_term(self):
+        self.assertEqual(self.calendar.current_term(datetime.date(2022, 8, 1)), self.autumn)
+        self.assertEqual(self.calendar.current_term(datetime.date(2022, 10, 21)), self.autumn)
+        self.assertEqual(self.calendar.current_term(datetime.date(2022, 10, 24)), self.winter)
+        self.assertIsNone(self.calendar.current_term(datetime.date(2023, 2, 11)))
+
+    def test_next_term(self):
+        self.assertEqual(self.calendar.next_term(self.autumn), self.winter)
+        self.assertEqual(self.calendar.next_term(self.winter), self.spring)
+        self.assertIsNone(self.calendar.next_term(self.spring))
+
+    def test_term_containing(self):
+        self.assertEqual(self.calendar.term_containing(datetime.date(2022, 11, 1)), self.winter)
+        self.assertIsNone(self.calendar.term_containing(datetime.date(2022, 12, 25)))
+
+    def test_term_calendar_is_loaded_once_per_school_instance(self):
+        term_calendar(self.school)
+        with self.assertNumQueries(0):
+            self.assertEqual(len(term_calendar(self.school)), 3)
+
+    def test_current_term_moves_on_without_saving(self):
+        self.school.current_term = self.autumn
+        self.school.save()
+        self.assertEqual(current_term(self.school, datetime.date(2022, 10, 10)), self.autumn)
+        with self.assertNumQueries(0):
+            self.assertEqual(current_term(self.school, datetime.date(2022, 12, 1)), self.winter)
+        self.assertEqual(School.objects.get(id=1).current_term, self.autumn)
+
+    def test_current_term_stays_within_school(self):
+        Term.objects.create(
+            school=self.other_school, start_date=datetime.date(2022, 10, 24), end_date=datetime.date(2022, 10, 28)
+        )
+        self.school.current_term = self.autumn
+        self.school.save()
+        self.assertEqual(current_term(self.school, datetime.date(2022, 10, 25)), self.winter)
+
+    def test_school_without_terms(self):
+        self.assertIsNone(current_term(self.other_school))
+
+    def test_school_without_current_term_has_one(self):
+        self.assertEqual(current_term(self.school, datetime.date(2022, 10, 24)), self.winter)
+        self.assertIsNone(School.objects.get(id=1).current_term)
+        roll_current_terms(School.objects.filter(id=1), datetime.date(2022, 10, 24))
+        self.assertEqual(School.objects.get(id=1).current_term, self.winter)
+
+    def test_term_added_after_last_term_ended_becomes_current(self):
+        self.school.current_term = self.spring
+        self.school.save()
+        self.assertIsNone(current_term(self.school, datetime.date(2023, 3, 1)))
+        roll_current_terms(School.objects.filter(id=1), datetime.date(2023, 3, 1))
+        self.assertEqual(School.objects.get(id=1).current_term, self.spring)
+
+        summer = Term.objects.create(
+            school=self.school, start_date=datetime.date(2023, 4, 17), end_date=datetime.date(2023, 7, 21)
+        )
+        school = School.objects.get(id=1)
+        self.assertEqual(current_term(school, datetime.date(2023, 3, 1)), summer)
+        roll_current_terms(School.objects.filter(id=1), datetime.date(2023, 3, 1))
+        self.assertEqual(School.objects.get(id=1).current_term, summer)
+
+    def test_saving_term_rolls_current_term(self):
+        today = timezone.localdate()
+        self.school.current_term = self.spring
+        self.school.save()
+        term = Term.objects.create(
+            school=self.school, start_date=today, end_date=today + datetime.timedelta(days=30)
+        )
+        self.assertEqual(School.objects.get(id=1).current_term, term)
+        self.assertIsNone(School.objects.get(id=self.other_school.id).current_term)
+
+
+@override_settings(TERM_CALENDAR_CACHE_ALIAS='default')
+class TermCalendarCacheTestCase(TransactionTestCase):
+    """
+    Unit tests that will be used to test the shared term calendar cache and its invalidation. Terms are only shared
+    outside of transactions, so these tests do not run inside one.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.school = School.objects.get(id=1)
+        self.term = Term.objects.create(
+            school=self.school, start_date=datetime.date(2022, 9, 1), end_date=datetime.date(2022, 10, 21)
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_term_calendar_is_cached_between_instances(self):
+        term_calendar(self.school)
+        with self.assertNumQueries(0):
+            self.assertEqual(term_calendar(School(id=1)).terms, [self.term])
+
+    def test_saving_term_invalidates_cache(self):
+        term_calendar(self.school)
+        self.term.end_date = datetime.date(2022, 10, 28)
+        self.term.save()
+        self.assertIsNone(cache.get(term_calendar_cache_key(self.school.id)))
+        self.assertEqual(term_calendar(School(id=1)).terms[0].end_date, datetime.date(2022, 10, 28))
+
+    def test_deleting_term_invalidates_cache(self):
+        term_calendar(self.school)
+        self.term.delete()
+        self.assertEqual(len(term_calendar(School(id=1))), 0)
@@ -0,0 +1,95 @@
+"""
+Tests that will be used to test the timetable service.
+"""
+import datetime
+
+from django.test import TestCase
+
+from lessons.models import Lesson, School, Term, User
+from lessons.services import create_schedule, household_timetable, children_timetable, teacher_timetable
+
+
+class TimetableTestCase(TestCase):
+    """
+    Unit tests that will be used to test the timetable service.
+    """
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_school.json'
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.teacher = User.objects.get(email='foo@kangaroo.com')
+        self.parent = User.objects.get(email='doe@kangaroo.com')
+        self.term = Term.objects.create(
+            school=self.school,
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2022, 10, 21)
+        )
+        self.children = [
+            User.objects.create_user(
+                email=f'child{number}@kangaroo.com',
+                first_name='Child',
+                last_name=str(number),
+                password='Password123',
+                parent=self.parent
+            ) for number in range(3)
+        ]
+        self.parent_lesson = self._create_lesson(self.parent, datetime.date(2022, 9, 1))
+        self.child_lessons = [self._create_lesson(child, datetime.date(2022, 9, 1)) for child in self.children]
+        self.later_lesson = self._create_lesson(self.parent, datetime.date(2023, 1, 2))
+
+    def _create_lesson(self, student, start_date):
+        lesson = Lesson.objects.create(
+            school=self.school,
+            student=student,
+            teacher=self.teacher,
+            fulfilled=True,
+            day='Monday',
+            time=datetime.time(13, 0),
+            interval=1,
+            duration=30,
+            start_date=start_date,
+            end_date=start_date + datetime.timedelta(weeks=4)
+        )
+        create_schedule(lesson)
+        return lesson
+
+    def test_household_timetable_includes_user_and_children(self):
+        schedule = household_timetable(self.school, self.parent, self.term)
+        self.assertEqual(
+            {scheduled.lesson_id for scheduled in schedule},
+            {self.parent_lesson.id} | {lesson.id for lesson in self.child_lessons}
+        )
+
+    def test_household_timetable_without_term_includes_every_lesson(self):
+        schedule = household_timetable(self.school, self.parent)
+        self.assertIn(self.later_lesson.id, {scheduled.lesson_id for scheduled in schedule})
+
+    def test_household_timetable_is_one_query(self):
+        with self.assertNumQueries(1):
+            schedule = list(household_timetable(self.school, self.parent, self.term))
+            for scheduled in schedule:
+                str(scheduled.lesson)
+                str(scheduled.teacher)
+                str(scheduled.student)
+        self.assertEqual(schedule, sorted(schedule, key=lambda scheduled: scheduled.start))
+
+    def test_children_timetable_excludes_user(self):
+        schedule = children_timetable(self.school, self.parent, self.term)
+        self.assertNotIn(self.parent_lesson.id, {scheduled.lesson_id for scheduled in schedule})
+        self.assertEqual(schedule.count(), 3 * 4)
+
+    def test_teacher_timetable(self):
+        self.assertEqual(teacher_timetable(self.school, self.teacher, self.term).count(), 4 * 4)
+        self.assertEqual(teacher_timetable(self.school, self.parent, self.term).count(), 0)
+
+    def test_term_timetable_only_includes_lessons_starting_in_term(self):
+        lesson = self._create_lesson(self.parent, datetime.date(2022, 10, 10))
+        schedule = household_timetable(self.school, self.parent, self.term).filter(lesson=lesson)
+        self.assertEqual([scheduled.start.date() for scheduled in schedule], [
+            datetime.date(2022, 10, 10),
+            datetime.date(2022, 10, 17),
+        ])
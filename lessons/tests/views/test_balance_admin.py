@@ -0,0 +1,29 @@
+from django.contrib import admin
+from django.test import TestCase
+from django.urls import reverse
+
+from lessons.models import User, LessonBalance, StudentBalance
+
+
+class BalanceAdminTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        User.objects.filter(pk=self.user.pk).update(is_staff=True, is_superuser=True)
+
+    def test_balances_are_read_only(self):
+        self.client.login(email=self.user.email, password="Password123")
+        for model in [LessonBalance, StudentBalance]:
+            model_admin = admin.site._registry[model]
+            request = self.client.get(reverse(f'admin:lessons_{model._meta.model_name}_changelist')).wsgi_request
+            self.assertFalse(model_admin.has_add_permission(request))
+            self.assertFalse(model_admin.has_change_permission(request))
+            self.assertFalse(model_admin.has_delete_permission(request))
+
+    def test_cannot_add_balance(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(reverse('admin:lessons_studentbalance_add'))
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,70 @@
+import csv
+import io
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+
+from lessons.models import User, School, Lesson, StudentBalance
+from lessons.services import rebuild_balances
+
+
+class ExportViewsTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/other_lesson.json',
+        'lessons/tests/fixtures/alternative_lesson.json',
+        'lessons/tests/fixtures/default_transfer.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.student = User.objects.get(email='doe@kangaroo.com')
+        rebuild_balances(Lesson.objects.all())
+
+    def _export(self, name, query=''):
+        response = self.client.get(reverse(name, kwargs={'school': self.school.id}) + query)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        content = b''.join(response.streaming_content).decode()
+        return response, list(csv.DictReader(io.StringIO(content)))
+
+    def test_export_urls(self):
+        self.assertEqual(reverse('export_bookings', kwargs={'school': 1}), '/school/1/bookings/export/')
+        self.assertEqual(reverse('export_transfers', kwargs={'school': 1}), '/school/1/transfers/export/')
+        self.assertEqual(reverse('export_balances', kwargs={'school': 1}), '/school/1/balances/export/')
+
+    def test_export_bookings(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response, rows = self._export('export_bookings')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="school-1-bookings.csv"')
+        self.assertEqual([row['booking'] for row in rows], ['2', '1', '3'])
+        self.assertEqual(rows[2]['paid'], '100.00')
+
+    def test_export_transfers(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response, rows = self._export('export_transfers')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="school-1-transfers.csv"')
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0]['student'], rows[0]['booking'], rows[0]['amount']), ('2', '3', '100.00'))
+
+    def test_export_balances_in_arrears(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response, rows = self._export('export_balances')
+        self.assertEqual(len(rows), 2)
+        response, rows = self._export('export_balances', '?arrears=1')
+        self.assertEqual([row['student'] for row in rows], ['1'])
+        self.assertEqual(rows[0]['outstanding'], '10.00')
+        self.assertEqual(StudentBalance.objects.get(student_id=2).outstanding, Decimal('-90.00'))
+
+    def test_client_cannot_export(self):
+        self.client.login(email=self.student.email, password="Password123")
+        for name in ('export_bookings', 'export_transfers', 'export_balances'):
+            response = self.client.get(reverse(name, kwargs={'school': self.school.id}))
+            self.assertRedirects(response, reverse('home'), status_code=302, target_status_code=200)
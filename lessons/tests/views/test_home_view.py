@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 from django.test import TestCase
 
 from django.urls import reverse
 
 from lessons.models import User, School
+from lessons.views import HomeView
 
 
 class HomeViewTestCase(TestCase):
@@ -28,3 +31,32 @@ class HomeViewTestCase(TestCase):
         self.assertTemplateUsed(response, 'school/list_school.html')
         self.assertContains(response, self.school.name)
         self.assertContains(response, second_school.name)
+
+    def test_search_home(self):
+        self.client.login(email=self.user.email, password="Password123")
+        School.objects.create(director=self.user, name="École Piano", description="Test")
+        response = self.client.get(self.url, {'search': 'ecole'})
+        self.assertEqual([school.name for school in response.context['schools']], ["École Piano"])
+
+    def test_enrolled_home(self):
+        self.client.login(email=self.user.email, password="Password123")
+        School.objects.create(director=self.user, name="New School", description="Test")
+        self.school.set_group_client(self.user)
+        response = self.client.get(self.url, {'enrolled': 'on'})
+        self.assertEqual(list(response.context['schools']), [self.school])
+
+    @patch.object(HomeView, 'page_size', 2)
+    def test_home_pages_keep_search_ranking(self):
+        self.client.login(email=self.user.email, password="Password123")
+        for number in range(4):
+            School.objects.create(director=self.user, name=f"Music {'Music ' * number}School", description="Test")
+        names, query = [], 'search=music'
+        while True:
+            response = self.client.get(f'{self.url}?{query}')
+            names.extend(school.name for school in response.context['schools'])
+            if not response.context['page']['has_next']:
+                break
+            query = response.context['page']['next_query']
+            self.assertIn('search=music', query)
+        self.assertEqual(names[0], "Music Music Music Music School")
+        self.assertEqual(len(names), 4)
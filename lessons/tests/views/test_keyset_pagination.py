@@ -0,0 +1,123 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lessons.models import User, School, Lesson, Transfer
+from lessons.views import BookingListView, SchoolTransferListView, SchoolUserListView
+from lessons.views.mixins import decode_cursor, encode_cursor
+
+
+class KeysetPaginationTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.school.set_group_super_administrator(self.user)
+        self.student = User.objects.get(email='doe@kangaroo.com')
+        self.lessons = [
+            Lesson.objects.create(
+                school=self.school, student=self.student, teacher=self.user, title=f'Lesson {number}',
+                fulfilled=number % 2 == 0, price=Decimal('10.00')
+            ) for number in range(7)
+        ]
+        self.client.login(email=self.user.email, password="Password123")
+
+    def _walk(self, url, name):
+        """
+        Follow the next links from the first page and return the rows of every page.
+        """
+        pages, query = [], ''
+        while True:
+            response = self.client.get(f'{url}?{query}')
+            self.assertEqual(response.status_code, 200)
+            pages.append(list(response.context[name]))
+            if not response.context['page']['has_next']:
+                return pages, response
+            query = response.context['page']['next_query']
+
+    def test_cursor_round_trip(self):
+        self.assertEqual(decode_cursor(encode_cursor([True, 12]), 2), [True, 12])
+
+    def test_invalid_cursor(self):
+        url = reverse('school_bookings', kwargs={'school': self.school.id})
+        self.assertEqual(self.client.get(url, {'after': 'not a cursor'}).status_code, 404)
+        self.assertEqual(self.client.get(url, {'after': encode_cursor([1])}).status_code, 404)
+
+    def test_cursor_of_wrong_types(self):
+        for name in ['school_bookings', 'school_transfers', 'members', 'school_balances']:
+            url = reverse(name, kwargs={'school': self.school.id})
+            for direction in ['after', 'before']:
+                response = self.client.get(url, {direction: encode_cursor(['x', 'y'])})
+                self.assertEqual(response.status_code, 404)
+
+    def test_cursor_of_wrong_nested_types(self):
+        url = reverse('school_bookings', kwargs={'school': self.school.id})
+        self.assertEqual(self.client.get(url, {'after': encode_cursor([[True], {'id': 1}])}).status_code, 404)
+        self.assertEqual(self.client.get(url, {'after': encode_cursor([True, None])}).status_code, 404)
+
+    def test_cursor_out_of_range(self):
+        url = reverse('school_transfers', kwargs={'school': self.school.id})
+        self.assertEqual(self.client.get(url, {'after': encode_cursor([2 ** 70])}).status_code, 404)
+
+    def test_home_cursor_of_wrong_types(self):
+        url = reverse('home')
+        self.assertEqual(self.client.get(url, {'after': encode_cursor(['a', 'x'])}).status_code, 404)
+        response = self.client.get(url, {'search': 'music', 'after': encode_cursor(['x', 'a', 1])})
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.client.get(url, {'after': 'not a cursor'}).status_code, 404)
+
+    @patch.object(BookingListView, 'page_size', 3)
+    def test_bookings_are_paged_by_fulfilment_and_id(self):
+        url = reverse('school_bookings', kwargs={'school': self.school.id})
+        pages, _ = self._walk(url, 'lessons')
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        expected = sorted(self.lessons, key=lambda lesson: (lesson.fulfilled, lesson.id))
+        self.assertEqual([lesson.id for page in pages for lesson in page], [lesson.id for lesson in expected])
+
+    @patch.object(BookingListView, 'page_size', 3)
+    def test_bookings_previous_page(self):
+        url = reverse('school_bookings', kwargs={'school': self.school.id})
+        pages, last = self._walk(url, 'lessons')
+        self.assertTrue(last.context['page']['has_previous'])
+        response = self.client.get(f"{url}?{last.context['page']['previous_query']}")
+        self.assertEqual(list(response.context['lessons']), pages[-2])
+        self.assertTrue(response.context['page']['has_next'])
+
+    @patch.object(BookingListView, 'page_size', 2)
+    def test_later_pages_cost_the_same_as_the_first(self):
+        url = reverse('school_bookings', kwargs={'school': self.school.id})
+        with CaptureQueriesContext(connection) as first_page:
+            response = self.client.get(url)
+        with CaptureQueriesContext(connection) as second_page:
+            self.client.get(f"{url}?{response.context['page']['next_query']}")
+        self.assertEqual(len(first_page), len(second_page))
+
+    @patch.object(SchoolTransferListView, 'page_size', 2)
+    def test_transfers_are_paged_by_id(self):
+        transfers = [
+            Transfer.objects.create(user=self.student, school=self.school, lesson=lesson, amount=Decimal('5.00'))
+            for lesson in self.lessons
+        ]
+        url = reverse('school_transfers', kwargs={'school': self.school.id})
+        pages, _ = self._walk(url, 'transfers')
+        self.assertEqual([transfer.id for page in pages for transfer in page], [transfer.id for transfer in transfers])
+        self.assertContains(self.client.get(url), 'Next')
+
+    @patch.object(SchoolUserListView, 'page_size', 1)
+    def test_members_pages_keep_search(self):
+        self.school.set_group_client(self.student)
+        url = reverse('members', kwargs={'school': self.school.id})
+        response = self.client.get(url, {'search_last_name': ''})
+        self.assertIn('search_last_name=', response.context['page']['next_query'])
+        pages, _ = self._walk(url, 'school_admissions')
+        self.assertEqual(len(pages), 2)
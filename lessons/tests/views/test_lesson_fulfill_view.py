@@ -0,0 +1,71 @@
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lessons.models import User, School, Lesson, StudentBalance
+from lessons.models.lesson import ScheduledLesson
+
+
+class LessonFulfillViewTestCase(TestCase):
+
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.other_user = User.objects.get(email='doe@kangaroo.com')
+        self.lesson = Lesson.objects.create(school=self.school, student=self.other_user, teacher=self.user)
+        self.url = reverse('fulfill_lesson', kwargs={'school': self.school.id, 'pk': self.lesson.id})
+        self.form_input = {
+            'day': 'Monday',
+            'time': '13:00',
+            'number_of_lessons': 1,
+            'duration': 60,
+            'interval': 1,
+            'start_date': '2022-09-01',
+            'end_date': '2022-10-21',
+        }
+
+    def test_fulfill_lesson_creates_schedule(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(self.url, self.form_input)
+        self.assertRedirects(response, reverse('school_bookings', kwargs={'school': self.school.id}),
+                             status_code=302, target_status_code=200)
+        self.lesson.refresh_from_db()
+        self.assertTrue(self.lesson.fulfilled)
+        self.assertEqual(self.lesson.number_of_lessons, 7)
+        schedule = ScheduledLesson.objects.filter(lesson=self.lesson).order_by('start')
+        self.assertEqual(schedule.count(), 7)
+        self.assertEqual(schedule.first().start.date(), datetime.date(2022, 9, 5))
+        self.assertEqual(schedule.last().start.date(), datetime.date(2022, 10, 17))
+
+    def test_fulfill_lesson_queries_do_not_grow_with_schedule(self):
+        self.client.login(email=self.user.email, password="Password123")
+        self.form_input['end_date'] = '2022-09-30'
+        # the first invoice of a student opens their balance, which is not what is being measured
+        StudentBalance.objects.create(school=self.school, student=self.other_user)
+        with CaptureQueriesContext(connection) as short_booking:
+            self.client.post(self.url, self.form_input)
+        ScheduledLesson.objects.all().delete()
+        self.form_input['end_date'] = '2023-07-21'
+        with CaptureQueriesContext(connection) as long_booking:
+            self.client.post(self.url, self.form_input)
+        self.assertEqual(len(short_booking), len(long_booking))
+        self.assertEqual(ScheduledLesson.objects.filter(lesson=self.lesson).count(), 46)
+
+    def test_fulfill_page_reads_school_once(self):
+        self.client.login(email=self.user.email, password="Password123")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        school_reads = [query['sql'] for query in queries.captured_queries
+                        if query['sql'].startswith('SELECT') and 'FROM "lessons_school"' in query['sql']]
+        self.assertEqual(len(school_reads), 1)
@@ -0,0 +1,80 @@
+import datetime
+
+from django.test import TestCase
+from django.urls import reverse
+
+from lessons.models import User, School, Lesson
+from lessons.models.lesson import ScheduledLesson
+from lessons.services import create_schedule, lesson_price
+
+
+class LessonModifyViewTestCase(TestCase):
+
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.teacher = User.objects.get(email='doe@kangaroo.com')
+        self.school.set_group_teacher(self.teacher)
+        self.lesson = Lesson.objects.create(
+            school=self.school,
+            student=self.user,
+            teacher=self.teacher,
+            fulfilled=True,
+            day='Monday',
+            time=datetime.time(13, 0),
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2022, 10, 21)
+        )
+        create_schedule(self.lesson)
+        self.url = reverse('modify_lesson', kwargs={'school': self.school.id, 'pk': self.lesson.id})
+        self.form_input = {
+            'title': 'Music Lesson',
+            'instrument': 'Piano',
+            'number_of_lessons': 7,
+            'teacher': self.teacher.id,
+            'day': 'Tuesday',
+            'time': '15:00',
+            'interval': 1,
+            'duration': 30,
+            'information': '',
+        }
+
+    def test_modify_fulfilled_lesson_moves_schedule(self):
+        ids = set(ScheduledLesson.objects.filter(lesson=self.lesson).values_list('id', flat=True))
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(self.url, self.form_input)
+        self.assertRedirects(response, reverse('client_lessons', kwargs={'school': self.school.id}),
+                             status_code=302, fetch_redirect_response=False)
+        schedule = ScheduledLesson.objects.filter(lesson=self.lesson).order_by('start')
+        self.assertEqual(set(schedule.values_list('id', flat=True)), ids)
+        self.assertEqual(schedule.first().start.date(), datetime.date(2022, 9, 6))
+        self.assertEqual(schedule.first().start.time(), datetime.time(15, 0))
+
+    def test_modify_fulfilled_lesson_changes_schedule_size(self):
+        self.form_input['interval'] = 2
+        self.client.login(email=self.user.email, password="Password123")
+        self.client.post(self.url, self.form_input)
+        self.assertEqual(ScheduledLesson.objects.filter(lesson=self.lesson).count(), 4)
+
+    def test_modify_fulfilled_lesson_counts_new_schedule(self):
+        self.form_input['interval'] = 2
+        self.client.login(email=self.user.email, password="Password123")
+        self.client.post(self.url, self.form_input)
+        self.lesson.refresh_from_db()
+        self.assertEqual(self.lesson.number_of_lessons, 4)
+        self.assertEqual(self.lesson.price, lesson_price(self.lesson, count=4))
+
+    def test_modify_unfulfilled_lesson_has_no_schedule(self):
+        self.lesson.fulfilled = False
+        self.lesson.save()
+        ScheduledLesson.objects.all().delete()
+        self.client.login(email=self.user.email, password="Password123")
+        self.client.post(self.url, self.form_input)
+        self.assertFalse(ScheduledLesson.objects.filter(lesson=self.lesson).exists())
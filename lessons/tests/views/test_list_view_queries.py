@@ -0,0 +1,102 @@
+import datetime
+from decimal import Decimal
+
+from django.test import TestCase
+from django.urls import reverse
+
+from lessons.models import User, School, Lesson, Transfer, Term
+from lessons.services import create_schedule
+from lessons.tests.helpers import QueryCountTester
+
+
+class ListViewQueriesTestCase(TestCase, QueryCountTester):
+    """
+    Tests that the list views load the relations their templates use in the same queries as their rows.
+    """
+
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.staff = User.objects.get(email='foo@kangaroo.com')
+        self.client_user = User.objects.get(email='doe@kangaroo.com')
+        self.school.set_group_administrator(self.staff)
+        self.school.set_group_teacher(self.staff)
+        self.school.set_group_client(self.client_user)
+        self.school.current_term = Term.objects.create(
+            school=self.school,
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2100, 10, 21)
+        )
+        self.school.save()
+        self.students = 0
+
+    def _add_lessons(self, count):
+        for _ in range(count):
+            self.students += 1
+            student = User.objects.create_user(
+                email=f'student{self.students}@kangaroo.com',
+                first_name='Student',
+                last_name=str(self.students),
+                password='Password123',
+                parent=self.client_user
+            )
+            teacher = User.objects.create_user(
+                email=f'teacher{self.students}@kangaroo.com',
+                first_name='Teacher',
+                last_name=str(self.students),
+                password='Password123'
+            )
+            lesson = Lesson.objects.create(
+                school=self.school,
+                student=student,
+                teacher=teacher,
+                title=f'Lesson {self.students}',
+                fulfilled=True,
+                price=Decimal('40.00'),
+                day='Monday',
+                time=datetime.time(13, 0),
+                start_date=datetime.date(2022, 9, 1),
+                end_date=datetime.date(2022, 9, 30)
+            )
+            create_schedule(lesson)
+
+    def _add_transfers(self, count):
+        self._add_lessons(count)
+        for lesson in Lesson.objects.filter(transfer__isnull=True):
+            Transfer.objects.create(user=self.client_user, school=self.school, lesson=lesson, amount=Decimal('5.00'))
+
+    def _get_url(self, name):
+        return reverse(name, kwargs={'school': self.school.id})
+
+    def test_booking_list_queries(self):
+        self.client.login(email=self.staff.email, password="Password123")
+        self.assertQueriesDoNotGrow(self._get_url('school_bookings'), self._add_lessons)
+
+    def test_lesson_list_queries(self):
+        self.client.login(email=self.client_user.email, password="Password123")
+        self.assertQueriesDoNotGrow(self._get_url('client_lessons'), self._add_lessons)
+
+    def test_timetable_queries(self):
+        self.client.login(email=self.client_user.email, password="Password123")
+        self.assertQueriesDoNotGrow(self._get_url('timetable'), self._add_lessons)
+
+    def test_teacher_timetable_queries(self):
+        self.client.login(email=self.staff.email, password="Password123")
+        Lesson.objects.update(teacher=self.staff)
+        self.assertQueriesDoNotGrow(
+            self._get_url('teacher_timetable'),
+            lambda count: (self._add_lessons(count), Lesson.objects.update(teacher=self.staff))
+        )
+
+    def test_school_transfer_list_queries(self):
+        self.client.login(email=self.staff.email, password="Password123")
+        self.assertQueriesDoNotGrow(self._get_url('school_transfers'), self._add_transfers)
+
+    def test_transactions_list_queries(self):
+        self.client.login(email=self.client_user.email, password="Password123")
+        self.assertQueriesDoNotGrow(self._get_url('client_transactions'), self._add_transfers)
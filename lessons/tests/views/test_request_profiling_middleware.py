@@ -0,0 +1,46 @@
+import json
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from lessons.models import User, School
+
+
+@override_settings(REQUEST_PROFILING=True)
+class RequestProfilingMiddlewareTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.url = reverse('school_bookings', kwargs={'school': self.school.id})
+        self.client.login(email=self.user.email, password="Password123")
+
+    def test_server_timing_header(self):
+        with self.assertLogs('msms.requests', level='INFO'):
+            response = self.client.get(self.url)
+        timing = response['Server-Timing']
+        self.assertRegex(timing, r'db;desc="\d+ queries";dur=[\d.]+')
+        self.assertIn('slowest-query;dur=', timing)
+        self.assertIn('template;dur=', timing)
+        self.assertIn('total;dur=', timing)
+
+    def test_structured_log_line(self):
+        with self.assertLogs('msms.requests', level='INFO') as logs:
+            self.client.get(self.url)
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(record['view'], 'school_bookings')
+        self.assertEqual(record['status'], 200)
+        self.assertEqual(record['path'], self.url)
+        self.assertGreater(record['queries'], 0)
+        self.assertIsNotNone(record['slowest_query'])
+        self.assertIsNotNone(record['template_ms'])
+
+    @override_settings(REQUEST_PROFILING=False)
+    def test_disabled_by_default(self):
+        response = self.client.get(self.url)
+        self.assertFalse(response.has_header('Server-Timing'))
@@ -0,0 +1,80 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from lessons.models import User, School, Lesson, StudentBalance
+from lessons.views import SchoolBalanceListView
+from lessons.services import rebuild_balances
+
+
+class SchoolBalanceListViewTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/alternative_lesson.json',
+        'lessons/tests/fixtures/default_transfer.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.url = reverse('school_balances', kwargs={'school': self.school.id})
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.student = User.objects.get(email='doe@kangaroo.com')
+        Lesson.objects.filter(id=3).update(price=Decimal('150.00'))
+        rebuild_balances(Lesson.objects.all())
+
+    def test_balances_url(self):
+        self.assertEqual(self.url, f'/school/{self.school.id}/balances/')
+
+    def test_get_balances(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'transfer/balances.html')
+        self.assertEqual(len(response.context['balances']), 1)
+        self.assertContains(response, 'Outstanding: £50.00')
+
+    @patch.object(SchoolBalanceListView, 'page_size', 2)
+    def test_get_balances_a_page_at_a_time(self):
+        students = [
+            User.objects.create_user(
+                email=f'student{number}@example.org', first_name='Student', last_name=str(number),
+                password='Password123'
+            )
+            for number in range(3)
+        ]
+        StudentBalance.objects.bulk_create([
+            StudentBalance(school=self.school, student=student, invoiced=Decimal('20.00'), outstanding=Decimal('20.00'))
+            for student in students
+        ])
+        self.client.login(email=self.user.email, password="Password123")
+        first = self.client.get(self.url)
+        second = self.client.get(f"{self.url}?{first.context['page']['next_query']}")
+        balances = list(first.context['balances']) + list(second.context['balances'])
+        self.assertEqual([balance.outstanding for balance in balances], [
+            Decimal('50.00'), Decimal('20.00'), Decimal('20.00'), Decimal('20.00')
+        ])
+        self.assertEqual(len({balance.id for balance in balances}), 4)
+        self.assertFalse(second.context['page']['has_next'])
+
+    def test_get_balances_in_arrears(self):
+        StudentBalance.objects.update(paid=Decimal('150.00'), outstanding=Decimal('0.00'))
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url, {'arrears': 1})
+        self.assertEqual(len(response.context['balances']), 0)
+
+    def test_client_cannot_get_balances(self):
+        self.client.login(email=self.student.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse('home'), status_code=302, target_status_code=200)
+
+    def test_client_transactions_show_own_balance(self):
+        self.school.set_group_client(self.student)
+        self.client.login(email=self.student.email, password="Password123")
+        response = self.client.get(reverse('client_transactions', kwargs={'school': self.school.id}))
+        self.assertEqual(response.context['balance'].outstanding, Decimal('50.00'))
+        self.assertContains(response, 'Outstanding: £50.00')
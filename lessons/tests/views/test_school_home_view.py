@@ -2,7 +2,7 @@ from django.test import TestCase
 
 from django.urls import reverse
 
-from lessons.models import User, School
+from lessons.models import User, School, Admission
 
 
 class SchoolHomeViewTestCase(TestCase):
@@ -26,3 +26,18 @@ class SchoolHomeViewTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'school/home.html')
         self.assertContains(response, self.school.name)
+
+    def test_get_school_home_loads_school_once(self):
+        self.school.set_group_director(self.user)
+        self.client.login(email=self.user.email, password="Password123")
+        # session, user, school with membership, system groups and the school director
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse('manage_school', kwargs={'school': self.school.id}))
+
+    def test_get_school_home_does_not_create_admission(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Admission.objects.filter(school=self.school, client=self.user).exists())
@@ -40,3 +40,14 @@ class SchoolUserListViewTestCase(TestCase):
         self.assertContains(response, self.student.first_name)
         self.assertContains(response, self.student.last_name)
         self.assertContains(response, self.student.email)
+
+    def test_search_user_list(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url, {'search_last_name': self.student.last_name[1:].upper()})
+        self.assertEqual([admission.client for admission in response.context['school_admissions']], [self.student])
+
+    def test_user_list_annotates_group_counts(self):
+        self.school.set_group_teacher(self.student)
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url, {'search_first_name': self.student.first_name})
+        self.assertEqual(response.context['school_admissions'][0].group_count, 2)
@@ -0,0 +1,59 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+
+from lessons.models import User, School, Term
+
+
+class TermImportViewTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.url = reverse('import_terms', kwargs={'school': self.school.id})
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.student = User.objects.get(email='doe@kangaroo.com')
+
+    def _upload(self, content, name='terms.csv'):
+        return {'file': SimpleUploadedFile(name, content.encode(), content_type='text/csv')}
+
+    def test_import_terms_url(self):
+        self.assertEqual(self.url, f'/school/{self.school.id}/terms/import/')
+
+    def test_get_import_terms(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'terms/import_terms.html')
+
+    def test_import_terms(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(self.url, self._upload(
+            "start_date,end_date\n2023-01-04,2023-03-31\n2023-04-17,2023-07-21\n"
+        ))
+        self.assertRedirects(response, reverse('terms', kwargs={'school': self.school.id}))
+        self.assertEqual(Term.objects.filter(school=self.school).count(), 2)
+
+    def test_import_overlapping_terms(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(self.url, self._upload(
+            "start_date,end_date\n2023-01-04,2023-03-31\n2023-03-01,2023-07-21\n"
+        ))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Row 2: the term overlaps the term of row 1.")
+        self.assertFalse(Term.objects.exists())
+
+    def test_import_unsupported_file(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(self.url, self._upload("start_date", name='terms.xlsx'))
+        self.assertContains(response, "Only CSV and JSON files can be imported.")
+
+    def test_client_cannot_import_terms(self):
+        self.client.login(email=self.student.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse('home'), status_code=302, target_status_code=200)
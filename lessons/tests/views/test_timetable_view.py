@@ -0,0 +1,69 @@
+import datetime
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lessons.models import User, School, Lesson
+from lessons.services import create_schedule
+
+
+class TimetableViewTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.url = reverse('timetable', kwargs={'school': self.school.id})
+        self.teacher = User.objects.get(email='foo@kangaroo.com')
+        self.user = User.objects.get(email='doe@kangaroo.com')
+        self.school.set_group_client(self.user)
+
+    def _add_child(self, number):
+        child = User.objects.create_user(
+            email=f'child{number}@kangaroo.com',
+            first_name='Child',
+            last_name=str(number),
+            password='Password123',
+            parent=self.user
+        )
+        lesson = Lesson.objects.create(
+            school=self.school,
+            student=child,
+            teacher=self.teacher,
+            title=f'Lesson of child {number}',
+            fulfilled=True,
+            day='Monday',
+            time=datetime.time(13, 0),
+            start_date=datetime.date(2022, 9, 1),
+            end_date=datetime.date(2022, 9, 30)
+        )
+        create_schedule(lesson)
+
+    def test_timetable_url(self):
+        self.assertEqual(self.url, f'/school/{self.school.id}/timetable/')
+
+    def test_get_timetable_includes_children(self):
+        self._add_child(1)
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'timetable/timetable.html')
+        self.assertEqual(len(response.context['schedule']), 4)
+        self.assertContains(response, 'Child 1')
+
+    def test_timetable_queries_do_not_grow_with_children(self):
+        self._add_child(1)
+        self.client.login(email=self.user.email, password="Password123")
+        with CaptureQueriesContext(connection) as one_child:
+            self.client.get(self.url)
+        for number in range(2, 6):
+            self._add_child(number)
+        with CaptureQueriesContext(connection) as five_children:
+            response = self.client.get(self.url)
+        self.assertEqual(len(response.context['schedule']), 5 * 4)
+        self.assertEqual(len(one_child), len(five_children))
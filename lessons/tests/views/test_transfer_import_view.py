@@ -0,0 +1,72 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.urls import reverse
+
+from lessons.models import User, School, Transfer
+
+
+class TransferImportViewTestCase(TestCase):
+    fixtures = [
+        'lessons/tests/fixtures/default_user.json',
+        'lessons/tests/fixtures/default_school.json',
+        'lessons/tests/fixtures/other_user.json',
+        'lessons/tests/fixtures/default_lesson.json',
+        'lessons/tests/fixtures/alternative_lesson.json',
+    ]
+
+    def setUp(self):
+        self.school = School.objects.get(id=1)
+        self.url = reverse('import_transfers', kwargs={'school': self.school.id})
+        self.user = User.objects.get(email='foo@kangaroo.com')
+        self.school.set_group_administrator(self.user)
+        self.student = User.objects.get(email='doe@kangaroo.com')
+
+    def _upload(self, content, name='statement.csv'):
+        return {'file': SimpleUploadedFile(name, content.encode(), content_type='text/csv')}
+
+    def test_import_transfers_url(self):
+        self.assertEqual(self.url, f'/school/{self.school.id}/transfers/import/')
+
+    def test_get_import_transfers(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'transfer/import_transfers.html')
+
+    def test_import_transfers(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(
+            self.url, self._upload("reference,amount\n1-1,20.00\n2-3,15.50\n1-9,5.00\n"), follow=True
+        )
+        self.assertRedirects(response, self.url, status_code=302, target_status_code=200)
+        self.assertEqual(Transfer.objects.filter(school=self.school).count(), 2)
+        self.assertEqual(response.context['imported'], 2)
+        self.assertEqual(response.context['rejects'], [
+            [3, "This lesson could not be found. You should refund this transfer."]
+        ])
+        self.assertContains(response, "Imported 2 transfers, rejected 1 line.")
+        self.assertContains(response, "Line 3:")
+
+    def test_refreshing_after_import_does_not_import_again(self):
+        self.client.login(email=self.user.email, password="Password123")
+        self.client.post(self.url, self._upload("reference,amount\n1-1,20.00\n"), follow=True)
+        response = self.client.get(self.url)
+        self.assertNotIn('imported', response.context)
+        self.assertNotContains(response, "Statement")
+        self.assertEqual(Transfer.objects.filter(school=self.school).count(), 1)
+
+    def test_import_file_without_columns(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(self.url, self._upload("name,total\n1-1,20.00\n"))
+        self.assertContains(response, "The file must have reference and amount columns.")
+        self.assertFalse(Transfer.objects.exists())
+
+    def test_import_unsupported_file(self):
+        self.client.login(email=self.user.email, password="Password123")
+        response = self.client.post(self.url, self._upload("[]", name='statement.json'))
+        self.assertContains(response, "Only CSV files can be imported.")
+
+    def test_client_cannot_import_transfers(self):
+        self.client.login(email=self.student.email, password="Password123")
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse('home'), status_code=302, target_status_code=200)
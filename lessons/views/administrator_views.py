@@ -1,13 +1,14 @@
 """
 Views that will be used in the music school management system.
 """
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.urls import reverse
 from django.views.generic import ListView, FormView, UpdateView
 
 from lessons.forms import ManageMemberForm
 from lessons.models import User, School, Admission
-from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin
+from lessons.services import search_members
+from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin, KeysetPaginationMixin, get_request_school
 
 
 class ManageStudentView(SchoolGroupRestrictedMixin, FormView):  # SchoolObjectMixin
@@ -22,7 +23,7 @@ class ManageStudentView(SchoolGroupRestrictedMixin, FormView):  # SchoolObjectMi
     allowed_group = "Director"
 
     def dispatch(self, *args, **kwargs):
-        school = School.objects.get(id=self.kwargs['school'])
+        school = get_request_school(self.request, self.kwargs['school'])
         if self.kwargs['pk'] == school.director_id:
             return self.handle_no_permission()
         return super().dispatch(*args, **kwargs)
@@ -32,15 +33,14 @@ class ManageStudentView(SchoolGroupRestrictedMixin, FormView):  # SchoolObjectMi
 
     def get_context_data(self, **kwargs):
         context = super(ManageStudentView, self).get_context_data(**kwargs)
-        school = School.objects.get(id=self.kwargs['school'])
+        school = get_request_school(self.request, self.kwargs['school'])
         context['school'] = school
-        admission = Admission.objects.get(school=school, client=self.request.user)
-        context['school_user_groups'] = admission.groups.all()
+        context['school_user_groups'] = school.get_membership(self.request.user).group_names
         return context
 
     def get_initial(self):
         initial = super().get_initial()
-        school = School.objects.get(id=self.kwargs['school'])
+        school = get_request_school(self.request, self.kwargs['school'])
         initial['client'] = school.is_client(self.kwargs['pk'])
         initial['teacher'] = school.is_teacher(self.kwargs['pk'])
         initial['administrator'] = school.is_administrator(self.kwargs['pk'])
@@ -49,7 +49,7 @@ class ManageStudentView(SchoolGroupRestrictedMixin, FormView):  # SchoolObjectMi
         return initial
 
     def form_valid(self, form):
-        school = School.objects.get(id=self.kwargs['school'])
+        school = get_request_school(self.request, self.kwargs['school'])
         school.leave_school(self.kwargs['pk'])
 
         if form.cleaned_data.get('client'):
@@ -75,9 +75,9 @@ class ManageStudentView(SchoolGroupRestrictedMixin, FormView):  # SchoolObjectMi
         return reverse('members', kwargs={'school': self.kwargs['school']})  # self.school_id
 
 
-class SchoolUserListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
+class SchoolUserListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, KeysetPaginationMixin, ListView):
     """
-    View that displays a list of users to the administrator.
+    View that displays a list of users to the administrator, a page at a time in order of admission.
     """
     
     model = User
@@ -88,11 +88,12 @@ class SchoolUserListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView
     def get_queryset(self):
         first_name_query = self.request.GET.get('search_first_name', "")
         last_name_query = self.request.GET.get('search_last_name', "")
-        context = Admission.objects.filter(Q(school=self.school_instance),
-                                           Q(client__first_name__contains=first_name_query),
-                                           Q(client__last_name__contains=last_name_query),
-                                           ~Q(school=self.school_instance, groups__name='Director'))
-        return context
+        admissions = Admission.objects.filter(Q(school=self.school_instance),
+                                              ~Q(school=self.school_instance, groups__name='Director'))
+        admissions = search_members(admissions, first_name_query, last_name_query)
+        return admissions.annotate(group_count=Count('groups')).filter(group_count__gt=0).select_related(
+            'client'
+        ).prefetch_related('groups', 'client__children')
 
 
     def get_context_data(self, **kwargs):
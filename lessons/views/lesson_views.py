@@ -2,7 +2,7 @@
 Views that will be used in the music school management system.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from time import time
 from unicodedata import name
 from django.contrib.auth.decorators import login_required
@@ -13,13 +13,14 @@ from django.shortcuts import redirect, get_object_or_404
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.views.generic import CreateView, UpdateView, ListView
-from django.utils.timezone import make_aware
 
 from lessons.forms import LessonModifyForm, LessonFulfillForm, LessonRequestForm
 from lessons.helpers import lesson_fulfilled_restricted
 from lessons.models import Lesson, User, School, Term, Transfer
-from lessons.models.lesson import ScheduledLesson
-from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin
+from lessons.services import BOOKING_COLUMNS, create_schedule, reschedule, lesson_count, lesson_price, term_calendar
+from lessons.views.mixins import (
+    SchoolObjectMixin, SchoolGroupRestrictedMixin, KeysetPaginationMixin, CSVExportMixin, get_request_school
+)
 
 
 class LessonListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
@@ -33,13 +34,10 @@ class LessonListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
     allowed_group = "Client"
 
     def get_queryset(self):
-        return super().get_queryset().filter(school=self.kwargs['school'])
-
-    def get_context_data(self, **kwargs):
-        context = super(LessonListView, self).get_context_data(**kwargs)
-        context['lessons'] = context['lessons'].filter(
-            Q(student=self.request.user) | Q(student__parent=self.request.user)).order_by('-fulfilled')
-        return context
+        return super().get_queryset().filter(
+            Q(student=self.request.user) | Q(student__parent=self.request.user),
+            school=self.kwargs['school']
+        ).select_related('student', 'teacher').with_payment_summary().order_by('-fulfilled')
 
 
 class LessonRequestView(SchoolGroupRestrictedMixin, SchoolObjectMixin, CreateView):
@@ -64,11 +62,7 @@ class LessonRequestView(SchoolGroupRestrictedMixin, SchoolObjectMixin, CreateVie
     def form_valid(self, form):
         super().form_valid(form)
         lesson = form.save(commit=False)
-        number_of_lessons = ScheduledLesson.objects.filter(
-            lesson=lesson
-        ).count()
-        lesson.price = (lesson.duration / 60) * number_of_lessons * 10
-        
+        lesson.price = lesson_price(lesson)
         lesson.save()
         return HttpResponseRedirect(self.get_success_url())
 
@@ -97,24 +91,17 @@ class LessonModifyView(LoginRequiredMixin, SchoolObjectMixin, UpdateView):  # Re
 
     def form_valid(self, form):
         super().form_valid(form)
-        if self.request.user == form.instance.student or self.request.user == form.instance.student.parent:
-            lesson = form.save(commit=False)
-            number_of_lessons = ScheduledLesson.objects.filter(
-                lesson=lesson
-            ).count()
-            lesson.price = (lesson.duration / 60) * number_of_lessons * 10
+        lesson = form.save(commit=False)
+        terms = term_calendar(self.school_instance)
+        count = None
+        if lesson.fulfilled and lesson.start_date and lesson.end_date:
+            reschedule(lesson, terms)
+            # the booking is charged for, and counts, the lessons of its new schedule
+            count = lesson.number_of_lessons = lesson_count(lesson, terms)
+        if self.request.user == lesson.student or self.request.user == lesson.student.parent \
+                or self.request.user.groups.filter(name='Administrator').exists():
+            lesson.price = lesson_price(lesson, count=count, terms=terms)
             lesson.save()
-        else:
-            administrators = User.objects.filter(groups__name='Administrator')
-            for admin in administrators:
-                if self.request.user == admin:
-                    lesson = form.save(commit=False)
-                    number_of_lessons = ScheduledLesson.objects.filter(
-                        lesson=lesson
-                    ).count()
-                    lesson.price = (lesson.duration / 60) * number_of_lessons * 10
-
-                    lesson.save()
         return HttpResponseRedirect(self.get_success_url())
 
     def get_success_url(self):
@@ -124,23 +111,31 @@ class LessonModifyView(LoginRequiredMixin, SchoolObjectMixin, UpdateView):  # Re
         return redirect('home')
 
 
-class BookingListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
+class BookingListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, KeysetPaginationMixin, ListView):
     """
-    View that displays all student bookings.
+    View that displays all student bookings, a page at a time with bookings awaiting fulfilment first.
     """
 
     model = Lesson
     template_name = "lessons/bookings.html"
     context_object_name = "lessons"
     allowed_group = "Administrator"
+    keyset = ('fulfilled', 'id')
 
     def get_queryset(self):
-        return super().get_queryset().filter(school=self.kwargs['school'])
+        return super().get_queryset().filter(
+            school=self.kwargs['school']
+        ).select_related('student', 'teacher').with_payment_summary()
 
-    def get_context_data(self, **kwargs):
-        context = super(BookingListView, self).get_context_data(**kwargs)
-        context['lessons'] = context['lessons'].order_by('-fulfilled')
-        return context
+
+class BookingExportView(CSVExportMixin, BookingListView):
+    """
+    View that streams every student booking of a school to an administrator as a CSV file.
+    """
+
+    export_name = "bookings"
+    export_columns = BOOKING_COLUMNS
+    ordering = ('fulfilled', 'id')
 
 
 class LessonFulfillView(SchoolGroupRestrictedMixin, SchoolObjectMixin, UpdateView):
@@ -157,10 +152,11 @@ class LessonFulfillView(SchoolGroupRestrictedMixin, SchoolObjectMixin, UpdateVie
     allowed_group = "Administrator"
 
     def dispatch(self, request, *args, **kwargs):
-        school_instance = get_object_or_404(School, pk=self.kwargs['school'])
+        school_instance = get_request_school(request, self.kwargs['school'])
+        calendar = term_calendar(school_instance)
         self.this_term = school_instance.get_update_current_term
-        if self.this_term != None and Term.objects.filter(school_id=self.kwargs['school']).count() > 1:
-            self.next_term = Term.get_next_by_start_date(self.this_term, school=school_instance)
+        if self.this_term != None and len(calendar) > 1:
+            self.next_term = calendar.next_term(self.this_term)
             days_to_term_end = (self.this_term.end_date - datetime.now().date()).days
             # we still have a week of term left
             if days_to_term_end >= 7:
@@ -176,6 +172,11 @@ class LessonFulfillView(SchoolGroupRestrictedMixin, SchoolObjectMixin, UpdateVie
     def get_initial(self):
         return {'start_term': self.next_term, 'school': self.kwargs['school']}
 
+    def get_form_kwargs(self, **kwargs):
+        form_kwargs = super(LessonFulfillView, self).get_form_kwargs(**kwargs)
+        form_kwargs['school'] = self.school_instance
+        return form_kwargs
+
     def form_valid(self, form):
         super().form_valid(form)
 
@@ -190,12 +191,10 @@ class LessonFulfillView(SchoolGroupRestrictedMixin, SchoolObjectMixin, UpdateVie
             data.start_date = term.start_date
         data.fulfilled = True
 
-        self.calculateSchedule(data)
+        schedule = self.calculateSchedule(data)
 
-        data.number_of_lessons = ScheduledLesson.objects.filter(
-            lesson=data
-        ).count()
-        data.price = (data.duration / 60) * data.number_of_lessons * 10
+        data.number_of_lessons = len(schedule)
+        data.price = lesson_price(data, count=data.number_of_lessons)
         form.save()
         return HttpResponseRedirect(self.get_success_url())
 
@@ -206,23 +205,7 @@ class LessonFulfillView(SchoolGroupRestrictedMixin, SchoolObjectMixin, UpdateVie
         return redirect('home')
 
     def calculateSchedule(self, lesson):
-        duration = timedelta(minutes=lesson.duration)
-        interval = timedelta(weeks=lesson.interval)
-        date = lesson.start_date
-        
-        while date.strftime('%A') != lesson.day:
-            date += timedelta(days=1)
-
-        current = datetime.combine(date, lesson.time)
-        
-        while current.date() <= lesson.end_date:
-            sl = ScheduledLesson.objects.create(
-                lesson = Lesson.objects.get(pk=lesson.id),
-                start = make_aware(current),
-                end = make_aware(current + duration),
-            )
-
-            current += interval
+        return create_schedule(lesson, term_calendar(get_request_school(self.request, self.kwargs['school'])))
 
 
 @method_decorator(lesson_fulfilled_restricted, name='dispatch')
@@ -240,6 +223,8 @@ class LessonInvoiceView(LoginRequiredMixin, SchoolObjectMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super(LessonInvoiceView, self).get_context_data(**kwargs)
-        context['lessons'] = Lesson.objects.filter(id=self.kwargs['pk'])
-        context['transfers'] = Transfer.objects.filter(lesson=self.kwargs['pk'])
+        context['lessons'] = Lesson.objects.filter(
+            id=self.kwargs['pk']
+        ).select_related('student__parent').with_payment_summary()
+        context['transfers'] = Transfer.objects.filter(lesson=self.kwargs['pk']).select_related('user', 'lesson')
         return context
@@ -1,8 +1,34 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.core.exceptions import ImproperlyConfigured
-from django.shortcuts import get_object_or_404, redirect
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import connection
+from django.db.models import Q
+from django.http import Http404, StreamingHttpResponse
+from django.shortcuts import redirect
+
+from lessons.models import School
+from lessons.services import csv_rows
 
-from lessons.models import School, Admission
+
+def get_request_school(request, school_id):
+    """
+    Return the school of a request with the requesting user's membership already loaded. The school is fetched at
+    most once per request and shared by every mixin and view that asks for it.
+    """
+    if not hasattr(request, '_schools'):
+        request._schools = {}
+    school_id = int(school_id)
+    if school_id not in request._schools:
+        try:
+            request._schools[school_id] = School.objects.get_with_membership(request.user, id=school_id)
+        except School.DoesNotExist:
+            raise Http404("No School matches the given query.")
+    return request._schools[school_id]
 
 
 class GroupRestrictedMixin(LoginRequiredMixin):
@@ -34,12 +60,9 @@ class SchoolGroupRestrictedMixin(LoginRequiredMixin):
 
         if self.request.user.is_anonymous:
             return self.handle_no_permission()
-        school = get_object_or_404(School, id=self.kwargs['school'])
-        try:
-            admission = Admission.objects.get(school=school, client=self.request.user)
-        except Admission.DoesNotExist:
-            admission = None
-        if not admission or not admission.is_active or not admission.groups.filter(name=self.allowed_group).exists():
+        school = get_request_school(self.request, self.kwargs['school'])
+        membership = school.get_membership(self.request.user)
+        if not membership.exists or membership.is_banned or not membership.in_group(self.allowed_group):
             return self.handle_no_permission()
         return super().dispatch(*args, **kwargs)
 
@@ -51,12 +74,8 @@ class SchoolObjectMixin:
     
     def dispatch(self, request, *args, **kwargs):
         self.school_id = self.kwargs['school']
-        self.school_instance = get_object_or_404(School, id=self.school_id)
-        try:
-            admission = Admission.objects.get(school=self.school_instance, client=self.request.user)
-            self.admission_groups = admission.groups.all()
-        except Admission.DoesNotExist:
-            self.admission_groups = None
+        self.school_instance = get_request_school(request, self.school_id)
+        self.admission_groups = self.school_instance.get_membership(request.user).group_names
         return super(SchoolObjectMixin, self).dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
@@ -71,3 +90,134 @@ class SchoolObjectMixin:
     def form_valid(self, form):
         form.instance.school_id = self.school_id
         return super().form_valid(form)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor, length):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, binascii.Error):
+        raise Http404("Invalid page.")
+    if not isinstance(values, list) or len(values) != length:
+        raise Http404("Invalid page.")
+    return values
+
+
+def cursor_values(queryset, ordering, cursor):
+    """
+    Decode a cursor into the key values of an ordering of a queryset, each cleaned by its field or annotation so a
+    tampered cursor is a missing page rather than a failed query.
+    """
+    values = decode_cursor(cursor, len(ordering))
+    fields = [
+        queryset.query.annotations[name].output_field if name in queryset.query.annotations
+        else queryset.model._meta.get_field(name)
+        for name in (field.lstrip('-') for field in ordering)
+    ]
+    try:
+        return [_clean_key(field, value) for field, value in zip(fields, values)]
+    except (ValidationError, TypeError, ValueError):
+        raise Http404("Invalid page.")
+
+
+def _clean_key(field, value):
+    value = field.clean(value, None)
+    if value is None:
+        raise ValueError("Keys cannot be null.")
+    # automatic primary keys have no range validators, but the database still rejects integers it cannot store
+    low, high = connection.ops.integer_field_ranges.get(field.get_internal_type(), (None, None))
+    if low is not None and not low <= value <= high:
+        raise ValueError("Key out of range.")
+    return value
+
+
+def keyset_filter(ordering, values, reverse=False):
+    """
+    Return the condition matching the rows that come after the given key values in an ordering, or before them when
+    reversed. Each field of the ordering is compared only when every field before it is equal.
+    """
+    equal, conditions = {}, []
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+        conditions.append(Q(**equal, **{f'{name}__{lookup}': value}))
+        equal[name] = value
+    return reduce(or_, conditions)
+
+
+class KeysetPaginationMixin:
+    """
+    Mixin that splits a list view into pages of page_size rows ordered by the fields of keyset. Each page is found
+    by seeking past the keys of the last row of the previous page, given by the after and before parameters, so
+    every page costs the same as the first.
+    """
+
+    page_size = 50
+    keyset = ('id',)
+
+    def paginate_keyset(self, queryset):
+        after = self.request.GET.get('after')
+        before = self.request.GET.get('before')
+        ordering = list(self.keyset)
+        if before:
+            reversed_ordering = [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+            queryset = queryset.filter(
+                keyset_filter(ordering, cursor_values(queryset, ordering, before), reverse=True)
+            ).order_by(*reversed_ordering)
+        elif after:
+            queryset = queryset.filter(
+                keyset_filter(ordering, cursor_values(queryset, ordering, after))
+            ).order_by(*ordering)
+        else:
+            queryset = queryset.order_by(*ordering)
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if before:
+            rows.reverse()
+        has_next = has_more if not before else True
+        has_previous = has_more if before else bool(after)
+
+        page = {'has_next': has_next and bool(rows), 'has_previous': has_previous and bool(rows)}
+        if page['has_next']:
+            page['next_query'] = self._page_query('after', rows[-1])
+        if page['has_previous']:
+            page['previous_query'] = self._page_query('before', rows[0])
+        return rows, page
+
+    def _page_query(self, direction, row):
+        query = self.request.GET.copy()
+        query.pop('after', None)
+        query.pop('before', None)
+        query[direction] = encode_cursor([getattr(row, field.lstrip('-')) for field in self.keyset])
+        return query.urlencode()
+
+    def get_context_data(self, **kwargs):
+        rows, page = self.paginate_keyset(self.object_list)
+        context = super().get_context_data(object_list=rows, **kwargs)
+        context['page'] = page
+        return context
+
+
+class CSVExportMixin:
+    """
+    Mixin that turns a list view into a download of its queryset as a CSV file, streamed to the client a chunk of
+    rows at a time instead of being rendered, so exports of any length neither fill memory nor time out.
+    """
+
+    export_name = None
+    export_columns = ()
+
+    def get(self, request, *args, **kwargs):
+        if self.export_name is None:
+            raise ImproperlyConfigured("Please set the name of the export.")
+        response = StreamingHttpResponse(
+            csv_rows(self.get_queryset(), self.export_columns), content_type='text/csv; charset=utf-8'
+        )
+        file_name = f'school-{self.kwargs["school"]}-{self.export_name}.csv'
+        response['Content-Disposition'] = f'attachment; filename="{file_name}"'
+        return response
@@ -1,6 +1,5 @@
 from django import forms
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.views.generic import CreateView, ListView, UpdateView
@@ -9,28 +8,34 @@ from django.views.generic import FormView
 from lessons.forms import SchoolCreateForm
 from lessons.forms import SchoolManageForm
 from lessons.models import School
-from lessons.views.mixins import GroupRestrictedMixin, SchoolGroupRestrictedMixin
+from lessons.models.search import normalise_name
+from lessons.services import enrolled_schools, search_schools
+from lessons.views.mixins import GroupRestrictedMixin, KeysetPaginationMixin, SchoolGroupRestrictedMixin
 from lessons.views.mixins import SchoolObjectMixin
 
 
-class HomeView(LoginRequiredMixin, ListView):
+class HomeView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
     """ 
     View that displays the home page to join a school.
     """
     model = School
     template_name = "school/list_school.html"
     context_object_name = "schools"
+    page_size = 20
+
+    @property
+    def keyset(self):
+        if normalise_name(self.request.GET.get('search', "")):
+            return ('rank', 'name_key', 'id')
+        return ('name_key', 'id')
 
     def get_queryset(self):
         search_query = self.request.GET.get('search', "")
         show_enrolled = self.request.GET.get('enrolled', False)
+        schools = search_schools(School.objects.all(), search_query)
         if show_enrolled:
-            context = School.objects.filter(Q(name__contains=search_query) &
-                                            Q(admission__client=self.request.user) &
-                                            Q(admission__groups__name__contains="")).distinct()
-        else:
-            context = School.objects.filter(Q(name__contains=search_query))
-        return context
+            schools = enrolled_schools(schools, self.request.user)
+        return schools
 
     def get_context_data(self, **kwargs):
         context = super(HomeView, self).get_context_data(**kwargs)
@@ -51,7 +56,7 @@ class SchoolHomeView(LoginRequiredMixin, SchoolObjectMixin, FormView):
     form_class = forms.Form
 
     def form_valid(self, form):
-        school = School.objects.get(id=self.school_id)
+        school = self.school_instance
         if school.is_director(self.request.user):
             return self.handle_no_permission()
         if form.data['follow']:
@@ -1,11 +1,8 @@
-
-from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect
 from django.views.generic import ListView
-from lessons.models import Lesson, School
 from lessons.models.lesson import ScheduledLesson
+from lessons.services import teacher_timetable
 from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin
-from django.db.models import Q
 
 class TeacherTimetableView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
     """
@@ -18,24 +15,8 @@ class TeacherTimetableView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListVi
     allowed_group = "Teacher"
 
     def get_queryset(self):
-        school = School.objects.get(pk=self.kwargs['school'])
-        term = school.get_update_current_term
-        if term:
-            # get all scheduled lessons that follow these constraints
-            return ScheduledLesson.objects.filter(
-                Q(lesson__school=school.id),
-                Q(lesson__teacher=self.request.user),
-                (Q(lesson__start_date__gte=school.get_update_current_term.start_date)
-                & Q(lesson__start_date__lte=school.get_update_current_term.end_date))
-                | (Q(lesson__end_date__gte=school.get_update_current_term.start_date)
-                & Q(lesson__end_date__lte=school.get_update_current_term.end_date))
-            ).order_by('start')
-
-        return ScheduledLesson.objects.filter(
-                Q(lesson__school=school.id),
-                Q(lesson__student=self.request.user),
-                
-        ).order_by('start')
+        school = self.school_instance
+        return teacher_timetable(school, self.request.user, school.get_update_current_term)
 
     def handle_no_permission(self):
-        return redirect('home')
\ No newline at end of file
+        return redirect('home')
@@ -5,9 +5,9 @@ Views that will be used in the music school management system.
 from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
-from django.views.generic import CreateView, UpdateView
+from django.views.generic import CreateView, FormView, UpdateView
 
-from lessons.forms import TermForm
+from lessons.forms import TermForm, TermImportForm
 from lessons.models import School, Term
 from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin
 
@@ -66,3 +66,27 @@ class TermEditView(SchoolGroupRestrictedMixin, SchoolObjectMixin, UpdateView):
 
     def get_success_url(self):
         return reverse('terms', kwargs={'school': self.school_id})
+
+
+class TermImportView(SchoolGroupRestrictedMixin, SchoolObjectMixin, FormView):
+    """
+    View that displays the form allowing administrators to import the terms of a school from a file. If the terms
+    of the file are valid they are all saved and the user is redirected to the term page.
+    """
+
+    template_name = "terms/import_terms.html"
+    form_class = TermImportForm
+    http_method_names = ['get', 'post']
+    allowed_group = "Administrator"
+
+    def get_form_kwargs(self):
+        kwargs = super(TermImportView, self).get_form_kwargs()
+        kwargs['school'] = self.school_instance.id
+        return kwargs
+
+    def form_valid(self, form):
+        form.save()
+        return HttpResponseRedirect(self.get_success_url())
+
+    def get_success_url(self):
+        return reverse('terms', kwargs={'school': self.school_id})
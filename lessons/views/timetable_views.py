@@ -1,15 +1,13 @@
-from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect
 from django.views.generic import ListView
-from django.db.models import Q
 
 from lessons.models.lesson import ScheduledLesson
-from lessons.models import School, User
+from lessons.services import household_timetable, children_timetable
 from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin
 
 class TimetableView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
     """
-    View that displays all lessons that have been scheduled for the current term.
+    View that displays all lessons of the user and their children that have been scheduled for the current term.
     """
 
     model = ScheduledLesson
@@ -18,38 +16,8 @@ class TimetableView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
     allowed_group = "Client"
 
     def get_queryset(self):
-        school = School.objects.get(pk=self.kwargs['school'])
-        term = school.get_update_current_term
-        if term:
-            # get all scheduled lessons that follow these constraints
-            parent = ScheduledLesson.objects.filter(
-                Q(lesson__school=school.id),
-                Q(lesson__student=self.request.user),
-                (Q(lesson__start_date__gte=school.get_update_current_term.start_date)
-                & Q(lesson__start_date__lte=school.get_update_current_term.end_date))
-                | (Q(lesson__end_date__gte=school.get_update_current_term.start_date)
-                & Q(lesson__end_date__lte=school.get_update_current_term.end_date))
-            ).order_by('start')
-            children = User.objects.filter(parent=self.request.user)
-            for child in children:
-
-                children = ScheduledLesson.objects.filter(
-                    Q(lesson__school=school.id),
-                    Q(lesson__student=child),
-                    (Q(lesson__start_date__gte=school.get_update_current_term.start_date)
-                    & Q(lesson__start_date__lte=school.get_update_current_term.end_date))
-                    | (Q(lesson__end_date__gte=school.get_update_current_term.start_date)
-                    & Q(lesson__end_date__lte=school.get_update_current_term.end_date))
-                ).order_by('start')
-                parent = parent | children
-
-            return parent
-
-        return ScheduledLesson.objects.filter(
-                Q(lesson__school=school.id),
-                Q(lesson__student=self.request.user),
-                
-        ).order_by('start')
+        school = self.school_instance
+        return household_timetable(school, self.request.user, school.get_update_current_term)
 
     def handle_no_permission(self):
         return redirect('home')
@@ -57,7 +25,7 @@ class TimetableView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
 
 class ChildrenTimetableView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
     """
-    View that displays all lessons that have been scheduled for the current term.
+    View that displays all lessons of the user's children that have been scheduled for the current term.
     """
 
     model = ScheduledLesson
@@ -66,24 +34,8 @@ class ChildrenTimetableView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListV
     allowed_group = "Client"
 
     def get_queryset(self):
-        school = School.objects.get(pk=self.kwargs['school'])
-        term = school.get_update_current_term
-        if term:
-            # get all scheduled lessons that follow these constraints
-            return ScheduledLesson.objects.filter(
-                Q(lesson__school=school.id),
-                Q(lesson__student=User.objects.filter(parent=self.request.user)),
-                (Q(lesson__start_date__gte=school.get_update_current_term.start_date)
-                & Q(lesson__start_date__lte=school.get_update_current_term.end_date))
-                | (Q(lesson__end_date__gte=school.get_update_current_term.start_date)
-                & Q(lesson__end_date__lte=school.get_update_current_term.end_date))
-            ).order_by('start')
-
-        return ScheduledLesson.objects.filter(
-                Q(lesson__school=school.id),
-                Q(lesson__student=self.request.user),
-                
-        ).order_by('start')
+        school = self.school_instance
+        return children_timetable(school, self.request.user, school.get_update_current_term)
 
     def handle_no_permission(self):
-        return redirect('home')
\ No newline at end of file
+        return redirect('home')
@@ -4,11 +4,12 @@ Views that will be used in the music school management system.
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect
 from django.urls import reverse
-from django.views.generic import ListView, CreateView
+from django.views.generic import ListView, CreateView, FormView
 
-from lessons.forms import TransferForm
-from lessons.models import Transfer, Lesson, User
-from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin
+from lessons.forms import TransferForm, TransferImportForm
+from lessons.models import Transfer, StudentBalance
+from lessons.services import BALANCE_COLUMNS, TRANSFER_COLUMNS
+from lessons.views.mixins import SchoolObjectMixin, SchoolGroupRestrictedMixin, KeysetPaginationMixin, CSVExportMixin
 
 
 class TransactionsListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
@@ -22,20 +23,24 @@ class TransactionsListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListVi
     allowed_group = "Client"
 
     def get_queryset(self):
-        return super().get_queryset().filter(school=self.kwargs['school'])
+        return super().get_queryset().filter(
+            school=self.kwargs['school'], user=self.request.user
+        ).select_related('user', 'lesson')
 
     def get_context_data(self, **kwargs):
         context = super(TransactionsListView, self).get_context_data(**kwargs)
-        context['transfers'] = Transfer.objects.filter(user_id=self.request.user).filter(school=self.kwargs['school'])
+        context['balance'] = StudentBalance.objects.filter(
+            school=self.kwargs['school'], student=self.request.user
+        ).first()
         return context
 
     def handle_no_permission(self):
         return redirect('home')
 
 
-class SchoolTransferListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, ListView):
+class SchoolTransferListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, KeysetPaginationMixin, ListView):
     """ 
-    View that displays all user transactions and their payment status to an administrator.
+    View that displays all user transactions and their payment status to an administrator, a page at a time.
     """
 
     model = Transfer
@@ -44,12 +49,54 @@ class SchoolTransferListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, List
     allowed_group = "Administrator"
 
     def get_queryset(self):
-        return super().get_queryset().filter(school=self.kwargs['school'])
+        return super().get_queryset().filter(school=self.kwargs['school']).select_related('user', 'lesson')
 
     def handle_no_permission(self):
         return redirect('home')
 
 
+class SchoolBalanceListView(SchoolGroupRestrictedMixin, SchoolObjectMixin, KeysetPaginationMixin, ListView):
+    """
+    View that displays the balance of every student of a school to an administrator, optionally only those in arrears,
+    a page at a time.
+    """
+
+    model = StudentBalance
+    template_name = "transfer/balances.html"
+    context_object_name = "balances"
+    allowed_group = "Administrator"
+    keyset = ('-outstanding', 'id')
+
+    def get_queryset(self):
+        balances = StudentBalance.objects.filter(school=self.kwargs['school']).select_related('student')
+        if self.request.GET.get('arrears'):
+            balances = balances.filter(outstanding__gt=0)
+        return balances.order_by('-outstanding', 'id')
+
+    def handle_no_permission(self):
+        return redirect('home')
+
+
+class SchoolTransferExportView(CSVExportMixin, SchoolTransferListView):
+    """
+    View that streams every transfer of a school to an administrator as a CSV file.
+    """
+
+    export_name = "transfers"
+    export_columns = TRANSFER_COLUMNS
+    ordering = ('id',)
+
+
+class SchoolBalanceExportView(CSVExportMixin, SchoolBalanceListView):
+    """
+    View that streams the balance of every student of a school to an administrator as a CSV file, optionally only
+    those in arrears.
+    """
+
+    export_name = "balances"
+    export_columns = BALANCE_COLUMNS
+
+
 class TransferCreateView(SchoolGroupRestrictedMixin, SchoolObjectMixin, CreateView):
     """ 
     View that displays the create transaction form to an administrator.
@@ -67,8 +114,6 @@ class TransferCreateView(SchoolGroupRestrictedMixin, SchoolObjectMixin, CreateVi
         return kwargs
 
     def form_valid(self, form):
-        form.instance.user = User.objects.filter(pk=form.cleaned_data.get('user_id')).first()
-        form.instance.lesson = Lesson.objects.filter(pk=form.cleaned_data.get('lesson_id')).first()
         super().form_valid(form)
         return HttpResponseRedirect(self.get_success_url())
 
@@ -77,3 +122,41 @@ class TransferCreateView(SchoolGroupRestrictedMixin, SchoolObjectMixin, CreateVi
 
     def handle_no_permission(self):
         return redirect('home')
+
+
+class TransferImportView(SchoolGroupRestrictedMixin, SchoolObjectMixin, FormView):
+    """
+    View that displays the form allowing administrators to import the transfers of a bank statement. The valid
+    transfers are saved and the administrator is redirected back to the form, where the number of imported transfers
+    and every rejected line of the statement are listed once, so refreshing the page does not import it again.
+    """
+
+    template_name = "transfer/import_transfers.html"
+    form_class = TransferImportForm
+    http_method_names = ['get', 'post']
+    allowed_group = "Administrator"
+
+    def get_form_kwargs(self):
+        kwargs = super(TransferImportView, self).get_form_kwargs()
+        kwargs['school'] = self.school_instance.id
+        return kwargs
+
+    def _result_key(self):
+        return f"transfer_import_{self.school_instance.id}"
+
+    def form_valid(self, form):
+        result = form.save()
+        self.request.session[self._result_key()] = {
+            'imported': len(result.transfers),
+            'rejects': result.rejects
+        }
+        return redirect('import_transfers', school=self.school_instance.id)
+
+    def get_context_data(self, **kwargs):
+        context = super(TransferImportView, self).get_context_data(**kwargs)
+        if self.request.method == 'GET':
+            context.update(self.request.session.pop(self._result_key(), {}))
+        return context
+
+    def handle_no_permission(self):
+        return redirect('home')
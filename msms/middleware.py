@@ -0,0 +1,107 @@
+"""
+Middleware that will be used to profile the queries and rendering of each request when REQUEST_PROFILING is enabled.
+"""
+import json
+import logging
+from time import perf_counter
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+logger = logging.getLogger('msms.requests')
+
+SLOWEST_QUERY_LENGTH = 500
+
+
+class RequestProfile:
+    """
+    Execute wrapper that records the number of queries of a request, the time spent running them and the slowest one,
+    along with the time spent rendering its template and the name of its view.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_sql = None
+        self.template_time = None
+        self.view_name = None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = perf_counter() - started
+            self.queries += 1
+            self.db_time += elapsed
+            if elapsed >= self.slowest_time:
+                self.slowest_time = elapsed
+                self.slowest_sql = sql
+
+    def server_timing(self, total_time):
+        metrics = [
+            f'db;desc="{self.queries} queries";dur={self.db_time * 1000:.2f}',
+            f'slowest-query;dur={self.slowest_time * 1000:.2f}',
+        ]
+        if self.template_time is not None:
+            metrics.append(f'template;dur={self.template_time * 1000:.2f}')
+        metrics.append(f'total;dur={total_time * 1000:.2f}')
+        return ', '.join(metrics)
+
+    def as_dict(self, request, response, total_time):
+        return {
+            'method': request.method,
+            'path': request.path,
+            'view': self.view_name,
+            'status': response.status_code,
+            'queries': self.queries,
+            'db_ms': round(self.db_time * 1000, 2),
+            'slowest_query_ms': round(self.slowest_time * 1000, 2),
+            'slowest_query': self.slowest_sql and self.slowest_sql[:SLOWEST_QUERY_LENGTH],
+            'template_ms': None if self.template_time is None else round(self.template_time * 1000, 2),
+            'total_ms': round(total_time * 1000, 2),
+        }
+
+
+class RequestProfilingMiddleware:
+    """
+    Opt-in middleware that adds a Server-Timing header to every response and logs a JSON line to the msms.requests
+    logger with the queries, database time, slowest query, template render time and view of the request.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_PROFILING', False):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = RequestProfile()
+        request.profile = profile
+        started = perf_counter()
+        with connection.execute_wrapper(profile):
+            response = self.get_response(request)
+        total_time = perf_counter() - started
+
+        response['Server-Timing'] = profile.server_timing(total_time)
+        logger.info(json.dumps(profile.as_dict(request, response, total_time)))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.profile.view_name = request.resolver_match.view_name
+
+    def process_template_response(self, request, response):
+        # template responses are rendered after this hook returns, so their render method is timed instead
+        render = response.render
+        profile = request.profile
+
+        def timed_render():
+            started = perf_counter()
+            try:
+                return render()
+            finally:
+                profile.template_time = perf_counter() - started
+
+        response.render = timed_render
+        return response
@@ -43,6 +43,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'msms.middleware.RequestProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -143,4 +144,39 @@ LOGGED_IN_REDIRECT_URL = 'home'
 # Hashing
 
 HASHID_SALT = 'Veni vidi vici'
-HASHID_LENGTH = 10
\ No newline at end of file
+HASHID_LENGTH = 10
+
+# Caches
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# Cache alias used to share the term calendars of schools between requests, or None to disable sharing. Only set it
+# to a cache shared by every worker, such as Memcached or Redis, as a per-process cache would keep stale terms
+
+TERM_CALENDAR_CACHE_ALIAS = None
+TERM_CALENDAR_CACHE_TIMEOUT = 3600
+
+# Profiling of the queries and rendering of each request, reported in a Server-Timing header and the msms.requests log
+
+REQUEST_PROFILING = False
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'msms.requests': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
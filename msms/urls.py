@@ -39,13 +39,19 @@ school_urlpatterns = [
 
     # Administrator
     path('bookings/', views.BookingListView.as_view(), name='school_bookings'),
+    path('bookings/export/', views.BookingExportView.as_view(), name='export_bookings'),
     path('lesson/<hashid:pk>/fulfill/', views.LessonFulfillView.as_view(), name='fulfill_lesson'),
 
     path('transfers/', views.SchoolTransferListView.as_view(), name='school_transfers'),
     path('transfer/create/', views.TransferCreateView.as_view(), name='create_transfer'),
+    path('transfers/import/', views.TransferImportView.as_view(), name='import_transfers'),
+    path('transfers/export/', views.SchoolTransferExportView.as_view(), name='export_transfers'),
+    path('balances/', views.SchoolBalanceListView.as_view(), name='school_balances'),
+    path('balances/export/', views.SchoolBalanceExportView.as_view(), name='export_balances'),
 
     path('terms/', views.TermsView.as_view(), name='terms'),
     path('term/<int:pk>/edit/', views.TermEditView.as_view(), name='edit_term'),
+    path('terms/import/', views.TermImportView.as_view(), name='import_terms'),
 
     # Super-administrator
     path('members/', views.SchoolUserListView.as_view(), name='members'),